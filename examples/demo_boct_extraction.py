@@ -13,6 +13,14 @@ for oct in oct_volumes:
         "boct_testing.png"
     )  # save volume as a set of sequential images, fds_testing_[1...N].png
 
+# The disk buffer can be kept as a named, compressed HDF5 cache. Later reads
+# of the same, unchanged file open the cache instead of parsing the .OCT again.
+oct_volumes = boct.read_oct_volume(cache_path="sample.h5", compression="lzf")
+
+# Long recordings can be read one time point at a time instead
+for oct in boct.iter_oct_volumes():
+    oct.save("boct_testing.avi")
+
 # create DICOM from .OCT
 dcm = create_dicom_from_oct(filepath)
 # Output dir can be specified, otherwise will
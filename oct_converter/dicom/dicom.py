@@ -178,13 +178,13 @@ def opt_shared_functional_groups(ds: Dataset, meta: DicomMetadata) -> Dataset:
 
 
 def write_opt_dicom(
-    meta: DicomMetadata, frames: t.List[np.ndarray], filepath: Path
+    meta: DicomMetadata, frames: t.List[np.ndarray] | np.ndarray, filepath: Path
 ) -> Path:
     """Writes required DICOM metadata and oct pixel data to .dcm file.
 
     Args:
             meta: DICOM metadata information
-            frames: list of frames of pixel data
+            frames: list or (frames, rows, columns) array of frames of pixel data
             filepath: Path to where output file is being saved
     Returns:
             Path to created DICOM file
@@ -232,11 +232,10 @@ def write_opt_dicom(
     ds.InstanceNumber = 1
 
     per_frame = []
-    pixel_data_bytes = list()
-    # Normalize
-    frames = normalize_volume(frames)
-    # Convert to a 3d volume
-    pixel_data = np.array(frames).astype(np.uint16)
+    # Normalize frame by frame straight into the 16 bit volume
+    frames = np.asarray(frames)
+    pixel_data = np.empty(frames.shape, dtype=np.uint16)
+    normalize_volume(frames, out=pixel_data)
     ds.Rows = pixel_data.shape[1]
     ds.Columns = pixel_data.shape[2]
     for i in range(pixel_data.shape[0]):
@@ -248,10 +247,6 @@ def write_opt_dicom(
         frame_fgs.FrameContentSequence = [Dataset()]
         frame_fgs.FrameContentSequence[0].InStackPositionNumber = i + 1
         frame_fgs.FrameContentSequence[0].StackID = "1"
-
-        # Pixel data
-        frame_dat = pixel_data[i, :, :]
-        pixel_data_bytes.append(frame_dat.tobytes())
         per_frame.append(frame_fgs)
     ds.PerFrameFunctionalGroupsSequence = per_frame
     ds.PixelData = pixel_data.tobytes()
@@ -460,21 +455,29 @@ def create_dicom_from_oct(
     return files
 
 
-def normalize_volume(vol: list[np.ndarray]) -> list[np.ndarray]:
+def normalize_volume(
+    vol: list[np.ndarray] | np.ndarray, out: np.ndarray | None = None
+) -> list[np.ndarray] | np.ndarray:
     """Normalizes pixel intensities within a range of 0-100.
 
     Args:
-        vol: List of frames
+        vol: List or array of frames
+        out: if given, an array of the same shape each normalized frame is cast
+            and written into, so the volume is never held as floats all at once.
     Returns:
-        Normalized list of frames
+        Normalized list of frames, or out
     """
-    arr = np.array(vol)
+    arr = np.asarray(vol)
+    arr_min = arr.min()
+    diff_arr = arr.max() - arr_min
     norm_vol = []
-    diff_arr = arr.max() - arr.min()
-    for i in arr:
-        temp = ((i - arr.min()) / diff_arr) * 100
-        norm_vol.append(temp)
-    return norm_vol
+    for index, i in enumerate(arr):
+        temp = ((i - arr_min) / diff_arr) * 100
+        if out is None:
+            norm_vol.append(temp)
+        else:
+            out[index] = temp
+    return norm_vol if out is None else out
 
 
 def create_dicom_from_boct(
@@ -1,6 +1,7 @@
 """Init module."""
 
 from .fundus import FundusImageWithMetaData
+from .lazy_volume import LazyVolume
 from .metadata_types import (
     DeviceInfo,
     FundusMetadataModel,
@@ -19,6 +20,7 @@ __all__ = [
     "FundusImageWithMetaData",
     "FundusMetadataModel",
     "ImageGeometry",
+    "LazyVolume",
     "OCTMetadataModel",
     "OCTVolumeWithMetaData",
     "PatientInfo",
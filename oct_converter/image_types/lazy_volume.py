@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Callable
+
+import numpy as np
+
+
+class LazyVolume(Sequence):
+    """List-like container of b-scans that are only loaded when accessed.
+
+    Can be used in place of the list of 2D arrays held by OCTVolumeWithMetaData.
+
+    Attributes:
+        loaders: one callable per b-scan, returning the 2D array.
+        cache: if True, keep each b-scan in memory after its first access.
+    """
+
+    def __init__(
+        self, loaders: list[Callable[[], np.ndarray]], cache: bool = True
+    ) -> None:
+        self.loaders = list(loaders)
+        self.cache = cache
+        self._slices = [None] * len(self.loaders)
+
+    def __len__(self) -> int:
+        return len(self.loaders)
+
+    def __getitem__(self, index: int | slice) -> np.ndarray | list[np.ndarray]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("b-scan index out of range")
+
+        image = self._slices[index]
+        if image is None:
+            image = self.loaders[index]()
+            if self.cache:
+                self._slices[index] = image
+        return image
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        volume = np.stack(list(self))
+        if dtype is not None:
+            volume = volume.astype(dtype, copy=False)
+        return volume
+
+    def clear_cache(self) -> None:
+        """Drops all cached b-scans."""
+        self._slices = [None] * len(self.loaders)
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import os
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -33,7 +37,9 @@ class OCTVolumeWithMetaData(object):
     Also provides methods for viewing and saving.
 
     Attributes:
-        volume: all the volume's b-scans.
+        volume: all the volume's b-scans. B-scans sharing a shape are held as a
+            single (slices, height, width) array, which indexes, slices and
+            iterates b-scan by b-scan like a list. See as_array().
 
         patient_id: patient ID.
         patient_name: patient full name.
@@ -48,6 +54,8 @@ class OCTVolumeWithMetaData(object):
         laterality: left or right eye.
 
         contours: contours data.
+        slice_mask: for readers that index b-scans by position, which positions
+            held a b-scan. Missing positions are not part of volume.
         pixel_spacing: (x, y, z) pixel spacing in mm.
         device_name: device / scanner name.
         scan_pattern: scan pattern or protocol label.
@@ -56,7 +64,7 @@ class OCTVolumeWithMetaData(object):
 
     def __init__(
         self,
-        volume: list[np.array],
+        volume: list[np.ndarray] | np.ndarray,
         patient_id: str | None = None,
         first_name: str | None = None,
         surname: str | None = None,
@@ -74,9 +82,11 @@ class OCTVolumeWithMetaData(object):
         device_name: str | None = None,
         scan_pattern: str | None = None,
         metadata_model: OCTMetadataModel | None = None,
+        slice_mask: np.ndarray | None = None,
     ) -> None:
         # image
         self.volume = volume
+        self.slice_mask = slice_mask
         self.meta = metadata_model or OCTMetadataModel(
             patient=PatientInfo(
                 patient_id=patient_id,
@@ -99,7 +109,29 @@ class OCTVolumeWithMetaData(object):
             oct_header=oct_header,
             contours=contours,
         )
-        self.num_slices = len(self.volume)
+
+    @property
+    def volume(self) -> np.ndarray | Sequence[np.ndarray]:
+        return self._volume
+
+    @volume.setter
+    def volume(self, value: list[np.ndarray] | np.ndarray) -> None:
+        self._volume = _as_volume(value)
+        self.num_slices = len(self._volume)
+
+    def as_array(self) -> np.ndarray:
+        """Returns the volume as a single (slices, height, width) array.
+
+        No copy is made when the volume is already held as an array, which is the
+        case whenever its b-scans share a shape, unless they are lazily loaded.
+
+        Returns:
+            the volume array. Write to a copy, it may be a read-only view over the
+            source file.
+        """
+        if isinstance(self._volume, np.ndarray):
+            return self._volume
+        return np.asarray(self._volume)
 
     @property
     def source(self) -> SourceInfo:
@@ -299,11 +331,13 @@ class OCTVolumeWithMetaData(object):
         else:
             plt.show()
 
-    def save(self, filepath: str | Path) -> None:
+    def save(self, filepath: str | Path, workers: int | None = None) -> None:
         """Saves OCT volume as a video or stack of slices.
 
         Args:
             filepath: location to save volume to. Extension must be in VIDEO_TYPES or IMAGE_TYPES.
+            workers: number of threads used to encode and write a stack of slices.
+                Defaults to ThreadPoolExecutor's default.
         """
         extension = Path(filepath).suffix
         if extension.lower() in VIDEO_TYPES:
@@ -315,7 +349,6 @@ class OCTVolumeWithMetaData(object):
                 video_writer.append_data(slice)
             video_writer.close()
         elif extension.lower() in {".tif", ".tiff"}:
-
             pages = []
 
             for slice in self.volume:
@@ -330,11 +363,7 @@ class OCTVolumeWithMetaData(object):
 
             pages = np.stack(pages, axis=0)
 
-            tiff.imwrite(
-                filepath,
-                pages,
-                photometric="minisblack"
-            )
+            tiff.imwrite(filepath, pages, photometric="minisblack")
 
         elif extension.lower() in IMAGE_TYPES:
             base = Path(filepath).stem
@@ -344,21 +373,49 @@ class OCTVolumeWithMetaData(object):
                 )
             )
             full_base = Path(filepath).with_suffix("")
-            self.volume = np.array(self.volume).astype("float64")
-            self.volume *= 255.0 / self.volume.max()
-            for index, slice in enumerate(self.volume):
-                filename = "{}_{}{}".format(full_base, index, extension)
-                cv2_imwrite_safe(filename, slice)
+            full_base.parent.mkdir(parents=True, exist_ok=True)
+            self._save_slices(full_base, extension, workers)
         elif extension.lower() == ".npy":
-            np.save(filepath, self.volume)
+            np.save(filepath, self.as_array())
         else:
             raise NotImplementedError(
                 "Saving with file extension {} not supported".format(extension)
             )
 
+    def _save_slices(
+        self, full_base: Path, extension: str, workers: int | None = None
+    ) -> None:
+        """Writes each b-scan to its own image file, scaled by the volume's maximum.
+
+        The volume is left untouched: the maximum is found in one pass, then each
+        b-scan is scaled, encoded and written on a thread pool, with only a few
+        b-scans in flight at a time.
+        """
+        if isinstance(self.volume, np.ndarray):
+            volume_max = self.volume.max()
+        else:
+            volume_max = max(np.max(slice) for slice in self.volume)
+        # as a Python float, so float32 volumes are scaled in float64 as before
+        scale = 255.0 / float(volume_max) if volume_max > 0 else 0.0
+
+        def write(index: int, slice: np.ndarray) -> None:
+            filename = "{}_{}{}".format(full_base, index, extension)
+            cv2_imwrite_safe(filename, slice.astype("float64") * scale, makedirs=False)
+
+        max_in_flight = 2 * (workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for index, slice in enumerate(self.volume):
+                pending.append(pool.submit(write, index, slice))
+                # bound the b-scans held in memory
+                if len(pending) > max_in_flight:
+                    pending.popleft().result()
+            for future in pending:
+                future.result()
+
     def get_projection(self) -> np.array:
         """Produces a 2D projection image from the volume."""
-        projection = np.mean(self.volume, axis=1)
+        projection = np.mean(self.as_array(), axis=1)
         return projection
 
     def save_projection(self, filepath: str | Path) -> None:
@@ -376,3 +433,38 @@ class OCTVolumeWithMetaData(object):
             raise NotImplementedError(
                 "Saving with file extension {} not supported".format(extension)
             )
+
+
+def _as_volume(volume: list[np.ndarray] | np.ndarray) -> np.ndarray | Sequence:
+    """Brings a list of b-scans into a single (slices, height, width) array.
+
+    Arrays, and sequences that load b-scans lazily such as LazyVolume, are kept as
+    they are. A list of b-scans is only copied into a new array if it is not already
+    a list of consecutive views into one, and is kept as a list if its b-scans
+    differ in shape or are memory-mapped, as stacking would read them all.
+    """
+    if not isinstance(volume, (list, tuple)) or not volume:
+        return volume
+    if not all(isinstance(bscan, np.ndarray) for bscan in volume):
+        return volume
+    first = volume[0]
+    if any(
+        bscan.shape != first.shape or bscan.dtype != first.dtype for bscan in volume
+    ):
+        return volume
+
+    base = first.base
+    if (
+        isinstance(base, np.ndarray)
+        and base.shape == (len(volume),) + first.shape
+        and base.dtype == first.dtype
+        and all(
+            bscan.strides == base[i].strides
+            and bscan.ctypes.data == base[i].ctypes.data
+            for i, bscan in enumerate(volume)
+        )
+    ):
+        return base
+    if any(isinstance(bscan, np.memmap) for bscan in volume):
+        return volume
+    return np.stack(volume)
@@ -3,8 +3,17 @@ import os
 import cv2
 
 
-def cv2_imwrite_safe(path, img):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+def cv2_imwrite_safe(path, img, makedirs=True):
+    """Encodes and writes an image, also to paths cv2.imwrite cannot handle.
+
+    Args:
+        path: location to save the image to, its extension selects the format.
+        img: image to save.
+        makedirs: create the parent directory if needed. Callers writing many
+            files to one directory can create it once and pass False.
+    """
+    if makedirs:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
     ext = os.path.splitext(path)[1]
     ok, buf = cv2.imencode(ext, img)
     if not ok:
@@ -3,5 +3,6 @@ from .dicom import Dicom
 from .e2e import E2E
 from .fda import FDA
 from .fds import FDS
+from .image_series import ImageSeries
 from .img import IMG
 from .poct import POCT
@@ -1,3 +1,4 @@
+import numpy as np
 from construct import (
     Array,
     Float32l,
@@ -63,6 +64,44 @@ chunk_structure = Struct(
     "type" / Int32un,
     "unknown5" / Int32un,
 )
+
+# NumPy equivalents of sub_directory_structure and chunk_structure,
+# used to parse whole directory blocks and batches of chunk headers at once.
+sub_directory_dtype = np.dtype(
+    [
+        ("pos", np.uint32),
+        ("start", np.uint32),
+        ("size", np.uint32),
+        ("unknown", np.uint32),
+        ("patient_db_id", np.uint32),
+        ("study_id", np.uint32),
+        ("series_id", np.uint32),
+        ("slice_id", np.int32),
+        ("unknown2", np.uint16),
+        ("unknown3", np.uint16),
+        ("type", np.uint32),
+        ("unknown4", np.uint32),
+    ]
+)
+chunk_dtype = np.dtype(
+    [
+        ("magic3", "S12"),
+        ("unknown", np.uint32),
+        ("unknown2", np.uint32),
+        ("pos", np.uint32),
+        ("size", np.uint32),
+        ("unknown3", np.uint32),
+        ("patient_db_id", np.uint32),
+        ("study_id", np.uint32),
+        ("series_id", np.uint32),
+        ("slice_id", np.int32),
+        ("ind", np.uint16),
+        ("unknown4", np.uint16),
+        ("type", np.uint32),
+        ("unknown5", np.uint32),
+    ]
+)
+
 image_structure = Struct(
     "size" / Int32un,
     "type" / Int32un,
@@ -89,6 +128,14 @@ contour_structure = Struct(
     "unknown1" / Int32un,
     "width" / Int32un,
 )
+contour_dtype = np.dtype(
+    [
+        ("unknown0", np.uint32),
+        ("id", np.uint32),
+        ("unknown1", np.uint32),
+        ("width", np.uint32),
+    ]
+)
 
 # following the spec from
 # https://github.com/neurodial/LibE2E/blob/d26d2d9db64c5f765c0241ecc22177bb0c440c87/E2E/dataelements/bscanmetadataelement.cpp#L75
@@ -2,14 +2,15 @@ from __future__ import annotations
 
 import re
 import tempfile
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import BinaryIO
+from typing import Iterator
 
 import h5py
 import numpy as np
-from construct import StringError, Struct
-from numpy.typing import NDArray
+from construct import Container, StreamError, StringError
 
 from oct_converter.exceptions import InvalidOCTReaderError
 from oct_converter.image_types import (
@@ -54,12 +55,33 @@ class BOCT(object):
         return True
 
     def read_oct_volume(
-        self, diskbuffered: bool = False
+        self,
+        diskbuffered: bool = False,
+        workers: int | None = None,
+        cache_path: str | Path | None = None,
+        chunks: tuple[int, int, int, int] | None = None,
+        compression: str | None = None,
+        compression_opts: int | None = None,
     ) -> list[OCTVolumeWithMetaData]:
         """Reads OCT data.
 
+        When all frames are evenly spaced in the file, which is the usual case, the
+        4D volume is a read-only strided view over the memory-mapped file and pixels
+        are only read from disk when accessed. Otherwise frames are gathered into
+        memory on a thread pool.
+
         Args:
             diskbuffered: if True, reduces memory usage by storing volume on disk using HDF5.
+            workers: number of threads used to gather frames that are not evenly
+                spaced. Defaults to ThreadPoolExecutor's default.
+            cache_path: if set, the HDF5 buffer is written to this file instead of an
+                anonymous temporary file, and implies diskbuffered. If the file already
+                holds a cache of the same, unchanged .OCT file it is opened read-only
+                without parsing the .OCT file again.
+            chunks: HDF5 chunk shape, (time, frames, A-scans, depth). Defaults to one
+                B-scan per chunk.
+            compression: HDF5 compression filter, e.g. "gzip" or "lzf".
+            compression_opts: compression level, for gzip 0-9.
 
         Returns:
             OCT volumes with metadata.
@@ -68,10 +90,80 @@ class BOCT(object):
         self.laterality = None
         self.patient_id = self.filepath.stem
 
-        # Lazily parse the file without loading frame pixels
-        oct = self.file_structure.parse_file(self.filepath)
-        header = oct.header
-        self.frames = FrameGenerator(oct.data)
+        if cache_path is not None:
+            diskbuffered = True
+            if self._open_cache(cache_path):
+                self.get_laterality_from_filename()
+                return self.load_oct_volume()
+
+        self._read_layout()
+        bscan_shape = (self.volume_shape[2], self.volume_shape[3])
+        framecount = self.volume_shape[0]
+
+        mapped = self._map_frames()
+        if diskbuffered:
+            self.vol = self._create_disk_buffer(
+                buffer_shape=bscan_shape,
+                cache_path=cache_path,
+                chunks=chunks,
+                compression=compression,
+                compression_opts=compression_opts,
+            )
+            if mapped is not None:
+                for t in range(framecount):
+                    self.vol[t] = mapped[t]
+            else:
+                self._gather_frames(self.vol, workers=workers)
+            if cache_path is not None:
+                self._finish_cache()
+        elif mapped is not None:
+            self.vol = mapped
+        else:
+            self.vol = np.zeros(self.volume_shape, dtype=np.uint16)
+            self._gather_frames(self.vol, workers=workers)
+
+        # Attempt to parse laterality from filename
+        self.get_laterality_from_filename()
+
+        return self.load_oct_volume()
+
+    def iter_oct_volumes(
+        self, workers: int | None = None
+    ) -> Iterator[OCTVolumeWithMetaData]:
+        """Reads OCT data one time point at a time.
+
+        Each time point is only read from disk when the iterator reaches it, so a
+        4D recording can be processed volume by volume while holding no more than
+        one 3D volume in memory.
+
+        Args:
+            workers: number of threads used to gather frames that are not evenly
+                spaced. Defaults to ThreadPoolExecutor's default.
+
+        Yields:
+            OCT volume with metadata, for each time point in order.
+        """
+        # Laterality/patient_id data not contained in .OCT file (often in filename)
+        self.laterality = None
+        self.patient_id = self.filepath.stem
+        self._read_layout()
+        self.get_laterality_from_filename()
+
+        mapped = self._map_frames()
+        for t in range(self.volume_shape[0]):
+            if mapped is not None:
+                volume = np.array(mapped[t])
+            else:
+                volume = np.zeros(self.volume_shape[1:], dtype=np.uint16)
+                self._gather_frames(
+                    volume[np.newaxis], time_points=range(t, t + 1), workers=workers
+                )
+            yield self._volume_with_metadata(volume)
+
+    def _read_layout(self) -> None:
+        """Sets the volume shape, frame table and acquisition datetime."""
+        # Locate every frame from the frame headers, without reading any pixels
+        header, first_frame, offsets, lines = self.read_frame_table()
         scantype = self.bioptigen_scan_type_map[header.scantype.value]
         framecount = header.frames.value
         scancount = header.scans.value
@@ -84,18 +176,14 @@ class BOCT(object):
         self.volume_shape = (
             framecount,
             scancount,
-            self.frames.Ascans,
-            self.frames.depth,
+            first_frame.framelines.value,
+            header.linelength.value,
         )
-        bscan_shape = (self.volume_shape[2], self.volume_shape[3])
         self.vol_frames_shape = (self.volume_shape[0], self.volume_shape[1])
-        if diskbuffered:
-            self.vol = self._create_disk_buffer(buffer_shape=bscan_shape)
-        else:
-            self.vol = np.empty(self.volume_shape, dtype=np.uint16)
+        self.frame_offsets, self.frame_lines = offsets, lines
 
         # Grab the acquisition datetime,
-        dt = oct.data[0].header.framedatetime.value
+        dt = first_frame.framedatetime.value
         self.acquisition_datetime = datetime(
             year=dt.year,
             month=dt.month,
@@ -105,54 +193,250 @@ class BOCT(object):
             second=dt.second,
         )
 
-        # Attempt to parse laterality from filename
-        self.get_laterality_from_filename()
+    def read_frame_table(self) -> tuple[Container, Container, np.ndarray, np.ndarray]:
+        """Builds the position of every frame's pixels from the frame headers alone.
 
-        return self.load_oct_volume()
+        The first frame header is parsed and frames are assumed to follow at a fixed
+        stride. This is confirmed by comparing every frame header against the first
+        one in a single gather over the memory-mapped file, ignoring the per-frame
+        date and timestamp. Only if that fails are the frame headers walked one by one.
+
+        Returns:
+            header: the file header.
+            first_frame: the first frame's header.
+            offsets: absolute position of each frame's pixels.
+            lines: number of A-scans in each frame.
+        """
+        file_size = self.filepath.stat().st_size
+        with open(self.filepath, "rb") as f:
+            header = self.header_structure.parse_stream(f)
+            start = f.tell()
+            first_frame = boct_binary.oct_frame_header_struct.parse_stream(f)
+            header_size = f.tell() - start
+        framecount = header.framecount.value
+        depth = header.linelength.value
+        frame_size = header_size + first_frame.framelines.value * depth * 2 + 4
+
+        # bytes of the frame header holding its date and timestamp values
+        date_at = 8 + first_frame.framedata.keylength
+        date_at += 8 + first_frame.framedatetime.keylength
+        stamp_at = date_at + 16 + 8 + first_frame.frametimestamp.keylength
+        static = np.ones(header_size, dtype=bool)
+        static[date_at : date_at + 16] = False
+        static[stamp_at : stamp_at + 8] = False
+
+        last_end = start + (framecount - 1) * frame_size + frame_size - 4
+        if framecount > 0 and last_end <= file_size:
+            raw = np.memmap(self.filepath, dtype=np.uint8, mode="r")
+            frame_starts = start + np.arange(framecount, dtype=np.int64) * frame_size
+            positions = np.flatnonzero(static)
+            headers = raw[frame_starts[:, None] + positions[None, :]]
+            if (headers == raw[start + positions]).all():
+                offsets = frame_starts + header_size
+                lines = np.full(framecount, first_frame.framelines.value)
+                return header, first_frame, offsets, lines
+
+        offsets = []
+        lines = []
+        with open(self.filepath, "rb") as f:
+            position = start
+            for _ in range(framecount):
+                try:
+                    f.seek(position)
+                    frame = boct_binary.oct_frame_header_struct.parse_stream(f)
+                except (StreamError, StringError) as e:
+                    warnings.warn(
+                        f"Could not read frame {len(offsets)} of {self.filepath}: {e}",
+                        UserWarning,
+                    )
+                    break
+                pixels_end = f.tell() + frame.framelines.value * depth * 2
+                if pixels_end > file_size:
+                    warnings.warn(
+                        f"Frame {len(offsets)} of {self.filepath} is truncated.",
+                        UserWarning,
+                    )
+                    break
+                offsets.append(f.tell())
+                lines.append(frame.framelines.value)
+                position = pixels_end + 4
+        return (
+            header,
+            first_frame,
+            np.asarray(offsets, dtype=np.int64),
+            np.asarray(lines, dtype=np.int64),
+        )
+
+    def _map_frames(self) -> np.ndarray | None:
+        """Maps the 4D volume as one strided view when its frames are evenly spaced.
+
+        Returns:
+            read-only (time, frames, A-scans, depth) view, or None if the frames are
+            not evenly spaced, differ in size or are missing.
+        """
+        num_frames = self.volume_shape[0] * self.volume_shape[1]
+        ascans, depth = self.volume_shape[2:]
+        offsets = self.frame_offsets[:num_frames]
+        if len(offsets) < num_frames or num_frames == 0:
+            return None
+        if (self.frame_lines[:num_frames] != ascans).any():
+            return None
+        stride = offsets[1] - offsets[0] if num_frames > 1 else 0
+        if (np.diff(offsets) != stride).any():
+            return None
+        raw = np.memmap(self.filepath, dtype=np.uint8, mode="r")
+        return np.ndarray(
+            self.volume_shape,
+            dtype=np.uint16,
+            buffer=raw,
+            offset=int(offsets[0]),
+            strides=(self.volume_shape[1] * stride, stride, depth * 2, 2),
+        )
+
+    def _gather_frames(
+        self,
+        out: np.ndarray | h5py.Dataset,
+        time_points: range | None = None,
+        workers: int | None = None,
+    ) -> None:
+        """Copies frames one by one, spread over a thread pool.
+
+        Args:
+            out: array of shape (time points, frames, A-scans, depth) to fill.
+            time_points: time points to read into out. Defaults to all of them.
+            workers: number of threads. Defaults to ThreadPoolExecutor's default.
+        """
+        if time_points is None:
+            time_points = range(self.volume_shape[0])
+        scancount = self.volume_shape[1]
+        ascans, depth = self.volume_shape[2:]
+        raw = np.memmap(self.filepath, dtype=np.uint8, mode="r")
+
+        def load(index: int) -> None:
+            t, z = divmod(index, scancount)
+            count = int(self.frame_lines[index]) * depth
+            pixels = np.frombuffer(
+                raw, dtype=np.uint16, count=count, offset=int(self.frame_offsets[index])
+            )
+            out[t - time_points.start, z, :, :] = np.resize(pixels, (ascans, depth))
+
+        indices = range(
+            time_points.start * scancount,
+            min(time_points.stop * scancount, len(self.frame_offsets)),
+        )
+        if isinstance(out, h5py.Dataset):
+            # h5py datasets are not safe to write from several threads
+            for index in indices:
+                load(index)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(load, indices))
 
     def _create_disk_buffer(
-        self, buffer_shape: tuple[int, int], name: str = "vol"
+        self,
+        buffer_shape: tuple[int, int],
+        name: str = "vol",
+        cache_path: str | Path | None = None,
+        chunks: tuple[int, int, int, int] | None = None,
+        compression: str | None = None,
+        compression_opts: int | None = None,
     ) -> h5py.Dataset:
         x, y = buffer_shape
-        chunksize = (1, 1, x, y)
-        tf = h5py.File(tempfile.TemporaryFile(), "w")
+        chunksize = chunks or (1, 1, x, y)
+        chunksize = tuple(min(c, s) for c, s in zip(chunksize, self.volume_shape))
+        if cache_path is None:
+            tf = h5py.File(tempfile.TemporaryFile(), "w")
+        else:
+            tf = h5py.File(cache_path, "w")
         return tf.create_dataset(
-            name, shape=self.volume_shape, dtype=np.uint16, chunks=chunksize
+            name,
+            shape=self.volume_shape,
+            dtype=np.uint16,
+            chunks=chunksize,
+            compression=compression,
+            compression_opts=compression_opts,
         )
 
-    def load_oct_volume(self) -> list[OCTVolumeWithMetaData]:
-        volFrames = np.reshape(self.frames.data, self.vol_frames_shape)
+    def _cache_key(self) -> dict[str, int | str]:
+        """Identifies the .OCT file a cache was written from."""
+        stat = self.filepath.stat()
+        return {
+            "source_name": self.filepath.name,
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+        }
+
+    def _finish_cache(self) -> None:
+        """Marks a freshly written cache as complete and reopens it read-only.
+
+        The source attributes are written last, so a cache left behind by an
+        interrupted read is never mistaken for a complete one.
+        """
+        tf = self.vol.file
+        filename, name = tf.filename, self.vol.name
+        tf.attrs.update(self._cache_key())
+        tf.attrs["acquisition_datetime"] = self.acquisition_datetime.isoformat()
+        tf.close()
+        self.vol = h5py.File(filename, "r")[name]
+
+    def _open_cache(self, cache_path: str | Path, name: str = "vol") -> bool:
+        """Opens an existing HDF5 cache of this .OCT file, if there is one.
+
+        Args:
+            cache_path: path to the HDF5 cache.
+            name: name of the volume dataset within the cache.
+
+        Returns:
+            True if a valid cache was found and opened into self.vol.
+        """
+        if not Path(cache_path).exists():
+            return False
         try:
-            with open(self.filepath, "rb") as f:
-                for t, v in enumerate(volFrames):
-                    for z, frame in enumerate(v):
-                        self.vol[t, z, :, :] = frame.load(
-                            f, self.frames.Ascans, self.frames.depth
-                        )
-        except Exception as e:
-            print(e)
-            print("Stopping load")
+            tf = h5py.File(cache_path, "r")
+        except OSError:
+            return False
+        attrs = dict(tf.attrs)
+        if name not in tf or any(
+            attrs.get(key) != value for key, value in self._cache_key().items()
+        ):
+            tf.close()
+            return False
+
+        self.vol = tf[name]
+        self.volume_shape = self.vol.shape
+        self.vol_frames_shape = (self.volume_shape[0], self.volume_shape[1])
+        self.acquisition_datetime = datetime.fromisoformat(
+            attrs["acquisition_datetime"]
+        )
+        return True
+
+    def load_oct_volume(self) -> list[OCTVolumeWithMetaData]:
         return [
-            OCTVolumeWithMetaData(
-                self.vol[t, :, :, :],
-                metadata_model=OCTMetadataModel(
-                    source=SourceInfo(
-                        vendor="Bioptigen",
-                        file_format="OCT",
-                        filepath=self.filepath,
-                    ),
-                    patient=PatientInfo(patient_id=self.patient_id),
-                    series=SeriesInfo(
-                        acquisition_date=self.acquisition_datetime,
-                        laterality=self.laterality,
-                    ),
-                    device=DeviceInfo(vendor="Bioptigen"),
-                    geometry=ImageGeometry(),
-                ),
-            )
+            self._volume_with_metadata(self.vol[t, :, :, :])
             for t in range(self.vol.shape[0])
         ]
 
+    def _volume_with_metadata(
+        self, volume: np.ndarray | h5py.Dataset
+    ) -> OCTVolumeWithMetaData:
+        return OCTVolumeWithMetaData(
+            volume,
+            metadata_model=OCTMetadataModel(
+                source=SourceInfo(
+                    vendor="Bioptigen",
+                    file_format="OCT",
+                    filepath=self.filepath,
+                ),
+                patient=PatientInfo(patient_id=self.patient_id),
+                series=SeriesInfo(
+                    acquisition_date=self.acquisition_datetime,
+                    laterality=self.laterality,
+                ),
+                device=DeviceInfo(vendor="Bioptigen"),
+                geometry=ImageGeometry(),
+            ),
+        )
+
     def read_fundus_image(self) -> None:
         return
 
@@ -179,33 +463,3 @@ class BOCT(object):
             self.laterality = ""
 
         return
-
-
-class OCTFrame(object):
-    def __init__(self, frame: Struct) -> None:
-        self.count = frame.image.totalpixels
-        self.abs_pos = frame.image.offset
-
-    def from_bytes(self, f: BinaryIO) -> NDArray[np.uint16]:
-        f.seek(self.abs_pos, 0)
-        im = np.fromfile(f, dtype=np.uint16, count=self.count)
-        return im
-
-    def load(self, f: BinaryIO, Ascans: int, depth: int) -> NDArray[np.uint16]:
-        return np.resize(self.from_bytes(f), (Ascans, depth))
-
-
-class FrameGenerator(object):
-    def __init__(self, oct_data: Struct) -> None:
-        self.Ascans = oct_data[0].image.columns
-        self.depth = oct_data[0].image.rows
-        self.data = np.asarray([OCTFrame(frame) for frame in oct_data])
-        self.count = len(self.data)
-
-    def reorder(self, indexArr: NDArray[np.int_]) -> FrameGenerator:
-        try:
-            self.data = self.data[indexArr]
-        except Exception as e:
-            print(e)
-        finally:
-            return self
@@ -1,15 +1,39 @@
 from __future__ import annotations
 
+import struct
+import warnings
+from functools import partial
 from pathlib import Path
 
+import numpy as np
+
 from oct_converter.image_types import (
     DeviceInfo,
     ImageGeometry,
+    LazyVolume,
     OCTMetadataModel,
     OCTVolumeWithMetaData,
     SourceInfo,
 )
 
+# Attributes needed to decode a frame of pixel data on its own
+PIXEL_MODULE = (
+    "SamplesPerPixel",
+    "PhotometricInterpretation",
+    "PlanarConfiguration",
+    "Rows",
+    "Columns",
+    "BitsAllocated",
+    "BitsStored",
+    "HighBit",
+    "PixelRepresentation",
+)
+PIXEL_DATA_TAG = (0x7FE0, 0x0010)
+ITEM_TAG = (0xFFFE, 0xE000)
+SEQUENCE_DELIMITER_TAG = (0xFFFE, 0xE0DD)
+# Markers a JPEG, JPEG 2000 codestream or JP2 frame starts with
+FRAME_START_MARKERS = (b"\xff\xd8", b"\xff\x4f\xff\x51", b"\x00\x00\x00\x0c")
+
 
 class Dicom(object):
     def __init__(self, filepath: str | Path) -> None:
@@ -17,20 +41,38 @@ class Dicom(object):
         if not self.filepath.exists():
             raise FileNotFoundError(self.filepath)
 
-    def read_oct_volume(self) -> OCTVolumeWithMetaData:
+    def read_oct_volume(
+        self, lazy: bool = False, cache_slices: bool = True
+    ) -> OCTVolumeWithMetaData:
         """Reads OCT data.
 
+        Args:
+            lazy: if True, metadata is read with stop_before_pixels and only the
+                position of each frame is indexed, from the Basic or Extended Offset
+                Table or by scanning fragments for encapsulated data, and from fixed
+                strides for native data. Frames are decoded when accessed.
+            cache_slices: if lazy, keep each decoded frame in memory after its
+                first access.
+
         Returns:
             OCTVolumeWithMetaData
         """
         import pydicom
 
-        dicom_data = pydicom.dcmread(self.filepath)
+        if lazy:
+            with open(self.filepath, "rb") as f:
+                dicom_data = pydicom.dcmread(f, stop_before_pixels=True)
+                pixel_position = f.tell()
+        else:
+            dicom_data = pydicom.dcmread(self.filepath)
         if dicom_data.Manufacturer.startswith("Carl Zeiss Meditec"):
             raise ValueError(
                 "This appears to be a Zeiss DCM. You may need to read with the ZEISSDCM class."
             )
-        pixel_data = dicom_data.pixel_array
+        if lazy:
+            pixel_data = self._index_frames(dicom_data, pixel_position, cache_slices)
+        else:
+            pixel_data = dicom_data.pixel_array
         oct_volume = OCTVolumeWithMetaData(
             volume=pixel_data,
             metadata_model=OCTMetadataModel(
@@ -49,3 +91,206 @@ class Dicom(object):
             ),
         )
         return oct_volume
+
+    def _index_frames(
+        self, dicom_data, position: int, cache_slices: bool = True
+    ) -> np.ndarray | LazyVolume:
+        """Locates every frame of the pixel data without decoding any of them.
+
+        Args:
+            dicom_data: dataset read with stop_before_pixels.
+            position: file position where reading stopped, i.e. of the Pixel Data
+                element.
+            cache_slices: keep each decoded frame in memory after its first access.
+
+        Returns:
+            read-only memory-mapped (frames, rows, columns) array for plain native
+            data, otherwise a LazyVolume decoding one frame per access. Like
+            pixel_array, a single frame is returned as a (rows, columns) array.
+        """
+        transfer_syntax = dicom_data.file_meta.TransferSyntaxUID
+        raw = np.memmap(self.filepath, dtype=np.uint8, mode="r")
+        element = self._read_element_header(raw, position, transfer_syntax)
+        native = not transfer_syntax.is_encapsulated
+        frame_size = self._native_frame_size(dicom_data) if native else None
+        if element is None or (native and frame_size is None):
+            warnings.warn(
+                f"Could not locate the frames of {self.filepath}, reading them eagerly.",
+                UserWarning,
+            )
+            import pydicom
+
+            return pydicom.dcmread(self.filepath).pixel_array
+
+        value_offset, length = element
+        num_frames = int(getattr(dicom_data, "NumberOfFrames", 1) or 1)
+        if not native:
+            frames = self._index_fragments(dicom_data, raw, value_offset, num_frames)
+        else:
+            mapped = self._map_native_frames(
+                dicom_data, raw, value_offset, frame_size, num_frames
+            )
+            if mapped is not None:
+                return mapped[0] if num_frames == 1 else mapped
+            frames = [
+                [(value_offset + i * frame_size, frame_size)] for i in range(num_frames)
+            ]
+        volume = LazyVolume(
+            [partial(self._decode_frame, dicom_data, raw, parts) for parts in frames],
+            cache=cache_slices,
+        )
+        return volume[0] if num_frames == 1 else volume
+
+    @staticmethod
+    def _native_frame_size(dicom_data) -> int | None:
+        """Size in bytes of one frame of native pixel data.
+
+        Returns:
+            the frame size, or None if frames do not start on a byte boundary,
+            which happens for 1 bit data.
+        """
+        samples = dicom_data.SamplesPerPixel
+        if dicom_data.PhotometricInterpretation == "YBR_FULL_422":
+            # Cb and Cr are only stored for every second pixel
+            samples = 2
+        bits = dicom_data.Rows * dicom_data.Columns * samples * dicom_data.BitsAllocated
+        if bits % 8:
+            return None
+        return bits // 8
+
+    @staticmethod
+    def _read_element_header(
+        raw: np.ndarray, position: int, transfer_syntax
+    ) -> tuple[int, int] | None:
+        """Reads the tag and length of the Pixel Data element at position.
+
+        Returns:
+            offset of the element's value and its length, or None if there is no
+            little endian Pixel Data element at position.
+        """
+        if not transfer_syntax.is_little_endian or position + 8 > len(raw):
+            return None
+        if struct.unpack_from("<HH", raw, position) != PIXEL_DATA_TAG:
+            return None
+        if transfer_syntax.is_implicit_VR:
+            (length,) = struct.unpack_from("<I", raw, position + 4)
+            return position + 8, length
+        (length,) = struct.unpack_from("<I", raw, position + 8)
+        return position + 12, length
+
+    @staticmethod
+    def _map_native_frames(
+        dicom_data, raw: np.ndarray, value_offset: int, frame_size: int, num_frames: int
+    ) -> np.ndarray | None:
+        """Maps native pixel data that needs no decoding as a strided array.
+
+        Returns:
+            read-only array shaped like pixel_array, or None if the pixel data
+            needs decoding, e.g. for YBR colour or packed and masked bits.
+        """
+        bits = dicom_data.BitsAllocated
+        samples = dicom_data.SamplesPerPixel
+        if (
+            bits not in (8, 16, 32)
+            or dicom_data.BitsStored != bits
+            or dicom_data.PhotometricInterpretation
+            not in ("MONOCHROME1", "MONOCHROME2", "RGB")
+            or (samples > 1 and getattr(dicom_data, "PlanarConfiguration", 0) != 0)
+            or value_offset + frame_size * num_frames > len(raw)
+        ):
+            return None
+        kind = "i" if dicom_data.PixelRepresentation else "u"
+        shape = (num_frames, dicom_data.Rows, dicom_data.Columns)
+        if samples > 1:
+            shape += (samples,)
+        return np.ndarray(
+            shape, dtype=f"<{kind}{bits // 8}", buffer=raw, offset=value_offset
+        )
+
+    def _index_fragments(
+        self, dicom_data, raw: np.ndarray, value_offset: int, num_frames: int
+    ) -> list[list[tuple[int, int]]]:
+        """Groups the fragments of encapsulated pixel data into frames.
+
+        Only the 8 byte item headers are read. Frame boundaries come from the
+        Extended Offset Table, else the Basic Offset Table, else one fragment per
+        frame if the counts match, else from the fragments starting with a JPEG or
+        JPEG 2000 start marker.
+
+        Returns:
+            for each frame, the (offset, length) of each of its fragments.
+        """
+        tag_group, tag_element, bot_length = struct.unpack_from(
+            "<HHI", raw, value_offset
+        )
+        if (tag_group, tag_element) != ITEM_TAG:
+            raise ValueError(
+                f"Encapsulated pixel data of {self.filepath} has no Basic Offset Table item."
+            )
+        first_fragment = value_offset + 8 + bot_length
+
+        positions, fragments = [], []
+        position = first_fragment
+        while position + 8 <= len(raw):
+            tag_group, tag_element, length = struct.unpack_from("<HHI", raw, position)
+            if (tag_group, tag_element) != ITEM_TAG:
+                break
+            positions.append(position - first_fragment)
+            fragments.append((position + 8, length))
+            position += 8 + length
+        positions = np.asarray(positions, dtype=np.int64)
+
+        if "ExtendedOffsetTable" in dicom_data:
+            starts = np.frombuffer(dicom_data.ExtendedOffsetTable, dtype="<u8")
+        elif bot_length:
+            starts = np.frombuffer(
+                raw, dtype="<u4", count=bot_length // 4, offset=value_offset + 8
+            )
+        elif len(fragments) == num_frames:
+            starts = positions
+        elif num_frames == 1:
+            starts = positions[:1]
+        else:
+            starts = np.asarray(
+                [
+                    p
+                    for p, (offset, _) in zip(positions, fragments)
+                    if bytes(raw[offset : offset + 4]).startswith(FRAME_START_MARKERS)
+                ]
+            )
+            if len(starts) != num_frames:
+                raise ValueError(
+                    f"Could not locate the {num_frames} frames of {self.filepath}."
+                )
+
+        frame_of_fragment = np.searchsorted(starts, positions, side="right") - 1
+        frames = [[] for _ in range(num_frames)]
+        for frame, fragment in zip(frame_of_fragment, fragments):
+            if 0 <= frame < num_frames:
+                frames[frame].append(fragment)
+        return frames
+
+    @staticmethod
+    def _decode_frame(
+        dicom_data, raw: np.ndarray, parts: list[tuple[int, int]]
+    ) -> np.ndarray:
+        """Decodes a single frame with pydicom, from the bytes of its fragments."""
+        from pydicom.dataset import Dataset, FileMetaDataset
+        from pydicom.encaps import encapsulate
+
+        transfer_syntax = dicom_data.file_meta.TransferSyntaxUID
+        frame = Dataset()
+        frame.file_meta = FileMetaDataset()
+        frame.file_meta.TransferSyntaxUID = transfer_syntax
+        for keyword in PIXEL_MODULE:
+            if keyword in dicom_data:
+                setattr(frame, keyword, dicom_data[keyword].value)
+        frame.NumberOfFrames = 1
+
+        data = b"".join(bytes(raw[offset : offset + size]) for offset, size in parts)
+        if transfer_syntax.is_encapsulated:
+            frame.add_new(PIXEL_DATA_TAG, "OB", encapsulate([data]))
+        else:
+            vr = "OB" if dicom_data.BitsAllocated <= 8 else "OW"
+            frame.add_new(PIXEL_DATA_TAG, vr, data)
+        return frame.pixel_array
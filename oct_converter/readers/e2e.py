@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import copy
+import hashlib
+import json
+import os
 import time
 import warnings
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
+from functools import lru_cache, partial
 from itertools import chain
 from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
 
 import numpy as np
 from construct.core import StreamError
@@ -15,6 +22,7 @@ from oct_converter.image_types import (
     FundusImageWithMetaData,
     FundusMetadataModel,
     ImageGeometry,
+    LazyVolume,
     OCTMetadataModel,
     OCTVolumeWithMetaData,
     PatientInfo,
@@ -54,6 +62,164 @@ def _extract_metadata_scan_pattern(metadata: dict, image_id: str) -> str:
     )
 
 
+def _decode_ufloat16(codes: np.ndarray) -> np.ndarray:
+    """Vectorized version of ``E2E.uint16_to_ufloat16``.
+
+    Custom float is a floating point type with no sign, 6-bit exponent, and 10-bit mantissa.
+    The mantissa bits are read in reverse order, matching the scalar implementation.
+    """
+    codes = codes.astype(np.uint32)
+    mantissa = codes & 0x3FF
+    reversed_mantissa = np.zeros_like(mantissa)
+    for bit in range(10):
+        reversed_mantissa |= ((mantissa >> bit) & 1) << (9 - bit)
+    exponent = (codes >> 10).astype(np.int64) - 63
+    return (1 + reversed_mantissa / pow(2, 10)) * np.float_power(2, exponent)
+
+
+# ufloat16 value of every possible uint16 code, computed once at import.
+UFLOAT16_LUT = _decode_ufloat16(np.arange(pow(2, 16)))
+UFLOAT16_LUT.flags.writeable = False
+
+
+def intensity_lut(
+    legacy_intensity_transform: bool = False, dtype: np.dtype = np.float32
+) -> np.ndarray:
+    """Lookup table mapping raw uint16 B-scan codes to display intensity.
+
+    Combines the ufloat16 decoding with the intensity transform, so a B-scan is
+    decoded with a single ``lut[raw]`` index. Tables are cached and read-only.
+
+    Args:
+        legacy_intensity_transform: if True, use ``pow(x, 1/2.4)`` as in v<=0.5.7.
+        dtype: output dtype. Floating dtypes hold the transformed intensity as is,
+            integer dtypes (e.g. uint8, uint16) are scaled to the full range of the type.
+
+    Returns:
+        array of 65,536 intensities.
+    """
+    # np.float32, "float32" and np.dtype("float32") share one cached table
+    return _intensity_lut(bool(legacy_intensity_transform), np.dtype(dtype))
+
+
+@lru_cache(maxsize=None)
+def _intensity_lut(legacy_intensity_transform: bool, dtype: np.dtype) -> np.ndarray:
+    if legacy_intensity_transform:
+        lut = np.power(UFLOAT16_LUT, 1.0 / 2.4)
+    else:
+        # see E2E.vol_intensity_transform
+        lut = UFLOAT16_LUT.copy()
+        selection_data = lut <= 1
+        lut[selection_data] = (np.log(lut[selection_data] + 2.44e-04) + 8.3) / 8.285
+        lut[lut == np.finfo(np.float32).max] = 0
+        lut = np.clip(lut, 0, 1)
+
+    if np.issubdtype(dtype, np.integer):
+        lut = np.rint(lut * (np.iinfo(dtype).max / lut.max()))
+    lut = lut.astype(dtype)
+    lut.flags.writeable = False
+    return lut
+
+
+def _decode_bscan(
+    buffer: np.ndarray, offset: int, height: int, width: int, lut: np.ndarray
+) -> np.ndarray:
+    """Decodes one uint16 b-scan stored at ``offset`` in ``buffer`` through ``lut``."""
+    raw_volume = np.frombuffer(
+        buffer, dtype=np.uint16, count=height * width, offset=offset
+    )
+    return lut[raw_volume].reshape(height, width)
+
+
+# Bump when the content of the index cache changes.
+_INDEX_CACHE_VERSION = 3
+
+_CHUNK_INDEX_DTYPE = np.dtype(
+    [
+        ("offset", np.int64),
+        ("size", np.uint32),
+        ("patient_db_id", np.uint32),
+        ("study_id", np.uint32),
+        ("series_id", np.uint32),
+        ("slice_id", np.int32),
+        ("ind", np.uint16),
+        ("type", np.uint32),
+    ]
+)
+
+
+def _to_json(value):
+    """Converts header metadata into values json can write and _from_json restore.
+
+    Construct containers become plain dicts and lists, dates are tagged ISO strings
+    and dicts with non-string keys are stored as a list of items.
+
+    Raises:
+        TypeError: if value holds anything else json cannot write.
+    """
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value):
+            return {key: _to_json(item) for key, item in value.items()}
+        if not all(isinstance(key, (str, int)) for key in value):
+            raise TypeError("only str and int keys can be cached")
+        return {"__items__": [[key, _to_json(item)] for key, item in value.items()]}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    raise TypeError(f"{type(value).__name__} cannot be cached")
+
+
+def _from_json(obj: dict):
+    """Object hook for json.loads, undoing the tagging of _to_json."""
+    if len(obj) == 1:
+        if "__datetime__" in obj:
+            return datetime.fromisoformat(obj["__datetime__"])
+        if "__date__" in obj:
+            return date.fromisoformat(obj["__date__"])
+        if "__items__" in obj:
+            return {key: item for key, item in obj["__items__"]}
+    return obj
+
+
+class E2EChunk(NamedTuple):
+    """Entry of the chunk index built from the .e2e directory.
+
+    Attributes:
+        offset: absolute file position of the 60-byte chunk header.
+        size: size of the chunk payload following the header.
+        patient_db_id: patient DB ID set by the software.
+        study_id: study ID.
+        series_id: series ID.
+        slice_id: slice ID (twice the B-scan index for OCT data).
+        ind: image index (0 for fundus, 1 for OCT).
+        type: chunk type.
+    """
+
+    offset: int
+    size: int
+    patient_db_id: int
+    study_id: int
+    series_id: int
+    slice_id: int
+    ind: int
+    type: int
+
+    @property
+    def data_offset(self) -> int:
+        return self.offset + 60
+
+    @property
+    def volume_string(self) -> str:
+        return "{}_{}_{}".format(self.patient_db_id, self.study_id, self.series_id)
+
+
 class E2E(object):
     """Class for extracting data from Heidelberg's .e2e file format.
 
@@ -63,12 +229,19 @@ class E2E(object):
 
     Attributes:
         filepath: path to .e2e file for reading.
+        index_cache: where to keep the chunk index and header metadata between runs. True stores it in a
+            sidecar file next to the .e2e file, a path stores it in that cache directory.
+            Defaults to False (no cache).
+        chunk_index: list of E2EChunk, parsed once on first access.
     """
 
-    def __init__(self, filepath: str | Path) -> None:
+    def __init__(
+        self, filepath: str | Path, index_cache: bool | str | Path = False
+    ) -> None:
         self.filepath = Path(filepath)
         if not self.filepath.exists():
             raise FileNotFoundError(self.filepath)
+        self.index_cache = index_cache
 
         self.power = pow(2, 10)
         self.sex = None
@@ -93,6 +266,14 @@ class E2E(object):
             raw = f.read(52)
             main_directory = e2e_binary.main_directory_structure.parse(raw)
 
+            self._chunk_index = None
+            self._max_slice_ids = None
+            self._lateralities = None
+            self._patient = None
+            self._metadata = None
+            if self._load_index_cache():
+                return
+
             # traverse list of main directories in first pass
             self.directory_stack = []
 
@@ -104,11 +285,230 @@ class E2E(object):
                 directory_chunk = e2e_binary.main_directory_structure.parse(raw)
                 current = directory_chunk.prev
 
+    @property
+    def chunk_index(self) -> list[E2EChunk]:
+        """All parseable chunks of the file, in directory order."""
+        if self._chunk_index is None:
+            self._build_chunk_index()
+        return self._chunk_index
+
+    @property
+    def max_slice_ids(self) -> dict[str, float]:
+        """Highest ``slice_id / 2`` listed in the directory for each volume string."""
+        if self._max_slice_ids is None:
+            self._build_chunk_index()
+        return self._max_slice_ids
+
+    def _build_chunk_index(self) -> None:
+        """Walks the directory and chunk headers once and stores the result."""
+        with open(self.filepath, "rb") as f:
+            entries = self._read_directory_entries(f)
+
+        # highest slice per volume, keeping volumes in order of first appearance
+        ids = np.stack(
+            [entries["patient_db_id"], entries["study_id"], entries["series_id"]],
+            axis=1,
+        )
+        unique_ids, first_index, inverse = np.unique(
+            ids, axis=0, return_index=True, return_inverse=True
+        )
+        max_slice_id = np.full(len(unique_ids), -np.inf)
+        np.maximum.at(max_slice_id, inverse.ravel(), entries["slice_id"] / 2)
+        max_slice_ids = {}
+        for i in np.argsort(first_index, kind="stable"):
+            volume_string = "{}_{}_{}".format(*unique_ids[i].tolist())
+            max_slice_ids[volume_string] = max_slice_id[i].item()
+
+        starts = entries["start"][entries["start"] > entries["pos"]]
+        self._chunk_index = self._read_chunk_headers(
+            starts.astype(np.int64) + self.byte_skip
+        )
+        self._max_slice_ids = max_slice_ids
+        if self.index_cache:
+            # header metadata is cached along with the index
+            self._read_lateralities()
+            self._read_patient()
+            self.read_all_metadata()
+            self._save_index_cache()
+
+    def _index_cache_path(self) -> Path:
+        """Location of the chunk index cache for this file."""
+        if self.index_cache is True:
+            return self.filepath.with_name(self.filepath.name + ".index.npz")
+        path_hash = hashlib.sha1(str(self.filepath.resolve()).encode()).hexdigest()
+        return Path(self.index_cache, f"{self.filepath.stem}-{path_hash[:16]}.npz")
+
+    def _index_cache_key(self) -> np.ndarray:
+        """Identifies the file by path, size, modification time and header hash."""
+        stat = self.filepath.stat()
+        with open(self.filepath, "rb") as f:
+            header_hash = hashlib.sha1(f.read(self.byte_skip + 36 + 52)).hexdigest()
+        return np.array(
+            [
+                str(_INDEX_CACHE_VERSION),
+                str(self.filepath.resolve()),
+                str(stat.st_size),
+                str(stat.st_mtime_ns),
+                header_hash,
+            ]
+        )
+
+    def _load_index_cache(self) -> bool:
+        """Restores directory_stack, the chunk index and header metadata from the cache.
+
+        Returns:
+            True if the cache exists and matches the file.
+        """
+        if not self.index_cache:
+            return False
+        path = self._index_cache_path()
+        if not path.exists():
+            return False
+        try:
+            with np.load(path, allow_pickle=False) as cache:
+                if not np.array_equal(cache["key"], self._index_cache_key()):
+                    return False
+                directory_stack = cache["directory_stack"].tolist()
+                chunk_index = [E2EChunk(*row) for row in cache["chunks"].tolist()]
+                max_slice_ids = dict(
+                    zip(
+                        cache["volume_strings"].tolist(),
+                        cache["max_slice_ids"].tolist(),
+                    )
+                )
+                if "header" in cache:
+                    header = json.loads(str(cache["header"]), object_hook=_from_json)
+                else:
+                    header = {"lateralities": None, "patient": None, "metadata": None}
+        except Exception:
+            # unreadable or outdated cache, the index is rebuilt and the cache rewritten
+            return False
+
+        self.directory_stack = directory_stack
+        self._chunk_index = chunk_index
+        self._max_slice_ids = max_slice_ids
+        self._lateralities = header["lateralities"]
+        self._patient = header["patient"]
+        self._metadata = header["metadata"]
+        return True
+
+    def _save_index_cache(self) -> None:
+        """Writes directory_stack, the chunk index and header metadata to the cache.
+
+        The header metadata (read_all_metadata, the patient record and the
+        laterality of each volume) is stored as JSON, with dates as ISO strings, so
+        loading a cache never runs code. It is left out, and parsed again on
+        demand, if it holds a value JSON cannot represent.
+        """
+        path = self._index_cache_path()
+        chunks = np.array(
+            [tuple(chunk) for chunk in self._chunk_index], dtype=_CHUNK_INDEX_DTYPE
+        )
+        arrays = {
+            "key": self._index_cache_key(),
+            "directory_stack": np.array(self.directory_stack, dtype=np.int64),
+            "chunks": chunks,
+            "volume_strings": np.array(list(self._max_slice_ids), dtype=str),
+            "max_slice_ids": np.array(
+                list(self._max_slice_ids.values()), dtype=np.float64
+            ),
+        }
+        header = {
+            "lateralities": self._lateralities,
+            "patient": self._patient,
+            "metadata": self._metadata,
+        }
+        try:
+            arrays["header"] = np.array(json.dumps(_to_json(header)))
+        except (TypeError, ValueError):
+            pass
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(path.name + ".tmp")
+            with open(temp_path, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(temp_path, path)
+        except OSError as e:
+            warnings.warn(f"Could not write E2E index cache {path}: {e}", UserWarning)
+
+    def _read_directory_entries(self, f) -> np.ndarray:
+        """Reads the subdirectory entries of every main directory, one read per block."""
+        blocks = []
+        for position in self.directory_stack:
+            f.seek(position + self.byte_skip)
+            raw = f.read(52)
+            directory_chunk = e2e_binary.main_directory_structure.parse(raw)
+
+            num_bytes = directory_chunk.num_entries * 44
+            raw = f.read(num_bytes)
+            if len(raw) < num_bytes:
+                raise StreamError(
+                    "directory at {} is truncated, expected {} entries".format(
+                        position, directory_chunk.num_entries
+                    )
+                )
+            blocks.append(np.frombuffer(raw, dtype=e2e_binary.sub_directory_dtype))
+        if not blocks:
+            return np.zeros(0, dtype=e2e_binary.sub_directory_dtype)
+        return np.concatenate(blocks)
+
+    def _read_chunk_headers(
+        self, offsets: np.ndarray, batch_size: int = 4096
+    ) -> list[E2EChunk]:
+        """Parses the 60-byte chunk headers at ``offsets`` in batches.
+
+        Headers that run past the end of the file or have a non-ascii magic
+        are handed to construct, as these are the chunks it fails on.
+        """
+        fields = ("size", "patient_db_id", "study_id", "series_id")
+        fields += ("slice_id", "ind", "type")
+        header_bytes = np.arange(60)
+
+        chunk_index = []
+        buffer = np.memmap(self.filepath, dtype=np.uint8, mode="r")
+        with open(self.filepath, "rb") as f:
+            for batch_start in range(0, len(offsets), batch_size):
+                batch = offsets[batch_start : batch_start + batch_size]
+                in_file = batch + 60 <= buffer.size
+                raw = np.zeros((len(batch), 60), dtype=np.uint8)
+                raw[in_file] = buffer[batch[in_file, None] + header_bytes]
+                is_valid = in_file & (raw[:, :12].max(axis=1) < 128)
+
+                headers = raw.view(e2e_binary.chunk_dtype).ravel()
+                columns = [headers[name].tolist() for name in fields]
+                for offset, valid, values in zip(
+                    batch.tolist(), is_valid.tolist(), zip(*columns)
+                ):
+                    if valid:
+                        chunk_index.append(E2EChunk(offset, *values))
+                        continue
+
+                    f.seek(offset)
+                    raw_header = f.read(60)
+                    try:
+                        # Heidelberg's updated anonymization seems to cause problems with
+                        # some chunks. Observed problems include an empty raw and problems
+                        # with undecodable bytes. For now, these chunks are skipped...
+                        chunk = e2e_binary.chunk_structure.parse(raw_header)
+                    except Exception:
+                        continue
+                    chunk_index.append(
+                        E2EChunk(offset, *(getattr(chunk, name) for name in fields))
+                    )
+        return chunk_index
+
     def read_oct_volume(
         self,
         legacy_intensity_transform: bool = False,
         scalex: float = 0.01,
         slice_thickness: float = 0.05,
+        lazy: bool = False,
+        cache_slices: bool = True,
+        workers: int = 1,
+        series: Iterable[str] | None = None,
+        laterality: str | None = None,
+        slices: slice | None = None,
+        dtype: np.dtype = np.float64,
     ) -> list[OCTVolumeWithMetaData]:
         """Reads OCT data.
 
@@ -116,112 +516,55 @@ class E2E(object):
              legacy_intensity_transform: if True, use intensity transform used in v<=0.5.7. Defaults to False.
              scalex: Manually set scale of x axis
              slice_thickness: Manually set scale of z axis
+             lazy: if True, b-scans are not read here. Each volume holds a LazyVolume of offsets
+                into a memory-mapped file, and b-scans are decoded on first access.
+             cache_slices: with lazy, keep decoded b-scans in memory. Defaults to True.
+             workers: number of threads used to decode b-scans. Defaults to 1.
+             series: only read these volumes, given as "patient_db_id_study_id_series_id" strings.
+             laterality: only read volumes of this eye, "R" or "L". With series or
+                laterality, the attached metadata only covers the selected volumes.
+             slices: only read these b-scans of each volume, e.g. ``slice(10, 20)``.
+             dtype: dtype of the b-scans. Floating dtypes hold the transformed intensity,
+                integer dtypes (e.g. uint8, uint16) are scaled to their full range. Defaults to float64.
 
         Returns:
             A list of OCTVolumeWithMetaData.
         """
 
-        def _make_lut():
-            LUT = []
-            for i in range(0, pow(2, 16)):
-                LUT.append(self.uint16_to_ufloat16(i))
-            return np.array(LUT)
-
-        LUT = _make_lut()
+        LUT = intensity_lut(legacy_intensity_transform, dtype)
+        file_size = self.filepath.stat().st_size
+        if lazy:
+            mapped = np.memmap(self.filepath, dtype=np.uint8, mode="r")
 
+        volume_dict = self.max_slice_ids
+        laterality_dict = self._read_lateralities()
+        selected = self._select_series(series, laterality, None, laterality_dict)
+        for name, value in self._read_patient().items():
+            setattr(self, name, value)
         with open(self.filepath, "rb") as f:
-            # get all subdirectories
-            chunk_stack = []
-            volume_dict = {}
-            for position in self.directory_stack:
-                f.seek(position + self.byte_skip)
-                raw = f.read(52)
-                directory_chunk = e2e_binary.main_directory_structure.parse(raw)
-
-                for ii in range(directory_chunk.num_entries):
-                    raw = f.read(44)
-                    chunk = e2e_binary.sub_directory_structure.parse(raw)
-                    volume_string = "{}_{}_{}".format(
-                        chunk.patient_db_id, chunk.study_id, chunk.series_id
-                    )
-                    # print(volume_string)
-                    if volume_string not in volume_dict.keys():
-                        volume_dict[volume_string] = chunk.slice_id / 2
-                    elif chunk.slice_id / 2 > volume_dict[volume_string]:
-                        volume_dict[volume_string] = chunk.slice_id / 2
-
-                    if chunk.start > chunk.pos:
-                        chunk_stack.append([chunk.start, chunk.size])
-
             # initalise dict to hold all the image volumes
             volume_array_dict = {}
             volume_array_dict_additional = (
                 {}
             )  # for storage of slices not caught by extraction
-            laterality_dict = {}
-            laterality = None
             for volume, num_slices in volume_dict.items():
+                if selected is not None and volume not in selected:
+                    continue
                 if num_slices > 0:
                     # num_slices + 1 here due to evidence that a slice was being missed off the end in extraction
                     volume_array_dict[volume] = [0] * int(num_slices + 1)
 
-            contour_dict = defaultdict(lambda: defaultdict(dict))
-
             # traverse all chunks and extract slices
-            for start, pos in chunk_stack:
-                f.seek(start + self.byte_skip)
-                raw = f.read(60)
-                try:
-                    # Heidelberg's updated anonymization seems to cause problems with
-                    # some chunks. Observed problems include an empty raw and problems
-                    # with undecodable bytes. For now, these chunks are skipped...
-                    chunk = e2e_binary.chunk_structure.parse(raw)
-                except Exception:
+            for chunk in self.chunk_index:
+                if selected is not None and chunk.volume_string not in selected:
                     continue
+                f.seek(chunk.data_offset)
 
-                if chunk.type == 9:  # patient data
-                    raw = f.read(127)
-                    try:
-                        patient_data = e2e_binary.patient_id_structure.parse(raw)
-                        self.sex = patient_data.sex
-                        self.first_name = patient_data.first_name
-                        self.surname = patient_data.surname
-                        self.patient_id = patient_data.patient_id
-                        if len(str(patient_data.birthdate)) == 8:
-                            # Encountered a file where birthdate had been stored as YYYYMMDD,
-                            # this is an attempt to catch that.
-                            self.birthdate = str(patient_data.birthdate)
-                        else:
-                            try:
-                                julian_birthdate = (
-                                    patient_data.birthdate / 64
-                                ) - 14558805
-                                self.birthdate = self.julian_to_ymd(julian_birthdate)
-                                # TODO: There are conflicting ideas of how to parse E2E's birthdate
-                                # https://bitbucket.org/uocte/uocte/wiki/Heidelberg%20File%20Format suggests the above,
-                                # whereas https://github.com/neurodial/LibE2E/blob/master/E2E/dataelements/patientdataelement.cpp
-                                # suggests that DOB is given as a Windows date. Neither option seems accurate to
-                                # test files with known-correct birthdates. More investigation is needed.
-                            except ValueError:
-                                # If the julian_to_ymd function cannot parse it into a date obj,
-                                # it throws a ValueError
-                                self.birthdate = None
-                    except Exception:
-                        pass
-
-                elif chunk.type == 10004:  # bscan metadata
+                if chunk.type == 10004:  # bscan metadata
                     raw = f.read(104)
                     bscan_metadata = e2e_binary.bscan_metadata.parse(raw)
 
-                    windowsTicks = bscan_metadata.acquisitionTime
-                    windowsTicksToUnixFactor = 10000000
-                    secToUnixEpechFromWindowsTicks = 11644473600
-                    unixtime = (
-                        windowsTicks / windowsTicksToUnixFactor
-                        - secToUnixEpechFromWindowsTicks
-                    )
-                    utc_time = time.gmtime(unixtime)
-                    dt_time = datetime.fromtimestamp(time.mktime(utc_time))
+                    dt_time = self._ticks_to_datetime(bscan_metadata.acquisitionTime)
                     if self.acquisition_date is None:
                         self.acquisition_date = dt_time
                     if self.pixel_spacing is None:
@@ -232,52 +575,6 @@ class E2E(object):
                             slice_thickness,
                         ]
 
-                elif chunk.type == 3:  # scan preamble data
-                    raw = f.read(chunk.size)
-                    try:
-                        pre_data = e2e_binary.pre_data.parse(raw)
-                        if pre_data.laterality in ["R", "L"]:
-                            laterality = pre_data.laterality
-                    except Exception:
-                        laterality = None
-                    volume_string = "{}_{}_{}".format(
-                        chunk.patient_db_id, chunk.study_id, chunk.series_id
-                    )
-                    if laterality and (volume_string not in laterality_dict):
-                        laterality_dict[volume_string] = laterality
-
-                elif chunk.type == 10019:  # contour data
-                    raw = f.read(16)
-                    contour_data = e2e_binary.contour_structure.parse(raw)
-
-                    if contour_data.width > 0:
-                        volume_string = "{}_{}_{}".format(
-                            chunk.patient_db_id, chunk.study_id, chunk.series_id
-                        )
-                        slice_id = int(chunk.slice_id / 2)
-                        contour_name = f"contour{contour_data.id}"
-                        try:
-                            raw_volume = np.frombuffer(
-                                f.read(contour_data.width * 4), dtype=np.float32
-                            )
-                            contour = np.array(raw_volume)
-                            max_float = np.finfo(np.float32).max
-                            contour[(contour < 1e-9) | (contour == max_float)] = np.nan
-                        except Exception as e:
-                            warnings.warn(
-                                (
-                                    f"Could not read contour "
-                                    f"image id {volume_string}"
-                                    f"contour name {contour_name} "
-                                    f"slice id {slice_id}."
-                                ),
-                                UserWarning,
-                            )
-                        else:
-                            (
-                                contour_dict[volume_string][contour_name][slice_id]
-                            ) = contour
-
                 elif chunk.type == 1073741824:  # image data
                     raw = f.read(20)
                     image_data = e2e_binary.image_structure.parse(raw)
@@ -286,30 +583,39 @@ class E2E(object):
                         count = image_data.height * image_data.width
                         if count == 0:
                             break
-                        raw_volume = np.fromfile(f, dtype=np.uint16, count=count)
-                        volume_string = "{}_{}_{}".format(
-                            chunk.patient_db_id, chunk.study_id, chunk.series_id
-                        )
+                        volume_string = chunk.volume_string
+                        pixel_offset = chunk.data_offset + 20
                         try:
-                            image = LUT[raw_volume].reshape(
-                                image_data.height, image_data.width
-                            )
+                            # only check the b-scan is in the file, pixels are read below
+                            num_elements = (file_size - pixel_offset) // 2
+                            if num_elements < count:
+                                raise ValueError(volume_string)
+                            if lazy:
+                                image = partial(
+                                    _decode_bscan,
+                                    mapped,
+                                    pixel_offset,
+                                    image_data.height,
+                                    image_data.width,
+                                    LUT,
+                                )
+                            else:
+                                image = (
+                                    pixel_offset,
+                                    image_data.height,
+                                    image_data.width,
+                                )
                         except Exception:
                             warnings.warn(
                                 (
                                     f"Could not reshape image id {volume_string} with "
-                                    f"{len(LUT[raw_volume])} elements into a "
+                                    f"{max(num_elements, 0)} elements into a "
                                     f"{image_data.height}x"
                                     f"{image_data.width} array"
                                 ),
                                 UserWarning,
                             )
                         else:
-                            if legacy_intensity_transform:
-                                image = pow(image, 1.0 / 2.4)
-                            else:
-                                image = self.vol_intensity_transform(image)
-
                             if volume_string in volume_array_dict.keys():
                                 volume_array_dict[volume_string][
                                     int(chunk.slice_id / 2)
@@ -325,33 +631,48 @@ class E2E(object):
                                         image
                                     ]
 
-            contour_data = {}
-            for volume_id, contours in contour_dict.items():
-                if volume_id in volume_dict:
-                    num_slices = int(volume_dict[volume_id]) + 1
-                else:
-                    num_slices = None
-                contour_data[volume_id] = {
-                    k: [None] * (num_slices or len(v)) for k, v in contours.items()
-                }
+            if slices is not None:
+                for volume in chain(
+                    volume_array_dict.values(), volume_array_dict_additional.values()
+                ):
+                    volume[:] = volume[slices]
+
+            if not lazy:
+                decoded = self._read_bscans(
+                    {**volume_array_dict, **volume_array_dict_additional},
+                    LUT,
+                    workers,
+                )
 
-                for contour_name, contour_values in contours.items():
-                    for slice_id, contour in contour_values.items():
-                        (contour_data[volume_id][contour_name][slice_id]) = contour
+            contour_data = {}
+            for volume_id, (contour_names, contours) in self.read_contours(
+                series=selected
+            ).items():
+                if slices is not None:
+                    contours = contours[:, slices]
+                contour_data[volume_id] = dict(zip(contour_names, contours))
 
             # Read metadata to attach to OCTVolumeWithMetaData
-            metadata = self.read_all_metadata()
+            metadata = self.read_all_metadata(series=selected)
 
             oct_volumes = []
             for key, volume in chain(
                 volume_array_dict.items(), volume_array_dict_additional.items()
             ):
                 # remove any initalised volumes that never had image data attached
-                volume = [slc for slc in volume if not isinstance(slc, int)]
-                if volume is None or len(volume) == 0:
+                slice_mask = np.array([not isinstance(slc, int) for slc in volume])
+                if not slice_mask.any():
                     continue
+                if lazy:
+                    volume = LazyVolume(
+                        [slc for slc in volume if not isinstance(slc, int)],
+                        cache=cache_slices,
+                    )
+                else:
+                    volume = decoded[key]
                 oct_volume = OCTVolumeWithMetaData(
                     volume=volume,
+                    slice_mask=slice_mask,
                     metadata_model=OCTMetadataModel(
                         source=SourceInfo(
                             vendor="Heidelberg",
@@ -385,50 +706,409 @@ class E2E(object):
         oct_volumes = sorted(oct_volumes, key=lambda v: int(v.volume_id.split('_')[-1]))
         return oct_volumes
 
+    def _read_lateralities(self) -> dict[str, str]:
+        """Reads the laterality of each volume from the scan preamble chunks."""
+        if self._lateralities is not None:
+            return dict(self._lateralities)
+        laterality_dict = {}
+        laterality = None
+        with open(self.filepath, "rb") as f:
+            for chunk in self.chunk_index:
+                if chunk.type != 3:  # scan preamble data
+                    continue
+                f.seek(chunk.data_offset)
+                raw = f.read(chunk.size)
+                try:
+                    pre_data = e2e_binary.pre_data.parse(raw)
+                    if pre_data.laterality in ["R", "L"]:
+                        laterality = pre_data.laterality
+                except Exception:
+                    laterality = None
+                volume_string = chunk.volume_string
+                if laterality and (volume_string not in laterality_dict):
+                    laterality_dict[volume_string] = laterality
+        self._lateralities = laterality_dict
+        return dict(laterality_dict)
+
+    def _read_patient(self) -> dict:
+        """Reads the patient record from the patient data chunks.
+
+        Returns:
+            dictionary of sex, first_name, surname, patient_id and birthdate, as
+            given by the last patient chunk that parses. Empty if there is none.
+        """
+        if self._patient is not None:
+            return dict(self._patient)
+        patient = {}
+        with open(self.filepath, "rb") as f:
+            for chunk in self.chunk_index:
+                if chunk.type != 9:  # patient data
+                    continue
+                f.seek(chunk.data_offset)
+                raw = f.read(127)
+                try:
+                    patient_data = e2e_binary.patient_id_structure.parse(raw)
+                    patient["sex"] = patient_data.sex
+                    patient["first_name"] = patient_data.first_name
+                    patient["surname"] = patient_data.surname
+                    patient["patient_id"] = patient_data.patient_id
+                    if len(str(patient_data.birthdate)) == 8:
+                        # Encountered a file where birthdate had been stored as YYYYMMDD,
+                        # this is an attempt to catch that.
+                        patient["birthdate"] = str(patient_data.birthdate)
+                    else:
+                        try:
+                            julian_birthdate = (patient_data.birthdate / 64) - 14558805
+                            patient["birthdate"] = self.julian_to_ymd(julian_birthdate)
+                            # TODO: There are conflicting ideas of how to parse E2E's birthdate
+                            # https://bitbucket.org/uocte/uocte/wiki/Heidelberg%20File%20Format suggests the above,
+                            # whereas https://github.com/neurodial/LibE2E/blob/master/E2E/dataelements/patientdataelement.cpp
+                            # suggests that DOB is given as a Windows date. Neither option seems accurate to
+                            # test files with known-correct birthdates. More investigation is needed.
+                        except ValueError:
+                            # If the julian_to_ymd function cannot parse it into a date obj,
+                            # it throws a ValueError
+                            patient["birthdate"] = None
+                except Exception:
+                    pass
+        self._patient = patient
+        return dict(patient)
+
+    def _select_series(
+        self,
+        series: Iterable[str] | None,
+        laterality: str | None,
+        modality: str | None,
+        laterality_dict: dict[str, str],
+    ) -> set[str] | None:
+        """Volume strings matching the given filters, or None if there are no filters.
+
+        Only the chunk index and the preamble chunks are used, no image data is read.
+        """
+        if series is None and laterality is None and modality is None:
+            return None
+
+        selected = {chunk.volume_string for chunk in self.chunk_index}
+        if isinstance(series, str):
+            series = [series]
+        if series is not None:
+            selected &= set(series)
+        if laterality is not None:
+            selected = {
+                key for key in selected if laterality_dict.get(key) == laterality
+            }
+        if modality is not None:
+            oct_series = {
+                chunk.volume_string
+                for chunk in self.chunk_index
+                if chunk.type == 1073741824 and chunk.ind == 1
+            }
+            if modality == "localizer":
+                selected &= oct_series
+            elif modality == "fundus":
+                selected -= oct_series
+            else:
+                raise ValueError(
+                    "modality must be 'localizer' or 'fundus', not {}".format(modality)
+                )
+        return selected
+
+    def _read_bscans(
+        self,
+        volumes: dict[str, list],
+        lut: np.ndarray,
+        workers: int = 1,
+    ) -> dict[str, np.ndarray | list[np.ndarray]]:
+        """Reads and decodes the b-scans given by ``(offset, height, width)`` entries.
+
+        The b-scans of each volume are written into one preallocated
+        ``(num_slices, height, width)`` array of ``lut.dtype`` when they share a shape.
+        Only positions holding a b-scan get a row, so the array needs no compacting
+        afterwards. Pixels are read in file order on the calling thread, while the
+        LUT mapping, which releases the GIL, is spread over ``workers`` threads.
+
+        Returns:
+            dictionary of volume string to its array, or to a list of b-scans if
+            they differ in shape.
+        """
+        decoded = {}
+        targets = []
+        for key, slices in volumes.items():
+            jobs = [job for job in slices if isinstance(job, tuple)]
+            shapes = {job[1:] for job in jobs}
+            if len(shapes) == 1:
+                decoded[key] = np.empty((len(jobs),) + shapes.pop(), dtype=lut.dtype)
+            else:
+                decoded[key] = [np.empty(job[1:], dtype=lut.dtype) for job in jobs]
+            targets.extend((job[0], out) for job, out in zip(jobs, decoded[key]))
+        targets.sort(key=lambda target: target[0])
+
+        with open(self.filepath, "rb") as f, ThreadPoolExecutor(
+            max_workers=max(workers, 1)
+        ) as pool:
+            pending = deque()
+            for offset, out in targets:
+                f.seek(offset)
+                raw_volume = np.fromfile(f, dtype=np.uint16, count=out.size)
+                if workers <= 1:
+                    np.take(lut, raw_volume, out=out.reshape(-1), mode="clip")
+                    continue
+                pending.append(
+                    pool.submit(
+                        np.take, lut, raw_volume, out=out.reshape(-1), mode="clip"
+                    )
+                )
+                # bound the raw b-scans held in memory
+                if len(pending) > 4 * workers:
+                    pending.popleft().result()
+            for future in pending:
+                future.result()
+        return decoded
+
+    def read_contours(
+        self, series: Iterable[str] | None = None, batch_size: int = 256
+    ) -> dict[str, tuple[list[str], np.ndarray]]:
+        """Reads the segmentation contours of each volume into a single array.
+
+        Args:
+            series: only read contours of these volumes.
+            batch_size: number of contour rows gathered from the file at once.
+
+        Returns:
+            dictionary of volume string to (contour names, contours), where contours is a
+            float32 array of shape (num_contours, num_slices, width) with NaN for missing data.
+        """
+        selected = self._select_series(series, None, None, {})
+        contour_chunks = [
+            chunk
+            for chunk in self.chunk_index
+            if chunk.type == 10019
+            and (selected is None or chunk.volume_string in selected)
+        ]
+        if not contour_chunks:
+            return {}
+
+        buffer = np.memmap(self.filepath, dtype=np.uint8, mode="r")
+        offsets = np.array([chunk.data_offset for chunk in contour_chunks])
+        in_file = offsets + 16 <= buffer.size
+        raw = np.zeros((len(offsets), 16), dtype=np.uint8)
+        raw[in_file] = buffer[offsets[in_file, None] + np.arange(16)]
+        headers = raw.view(e2e_binary.contour_dtype).ravel()
+        widths = np.where(in_file, headers["width"], 0)
+        data_in_file = offsets + 16 + widths.astype(np.int64) * 4 <= buffer.size
+
+        # position of every contour row, later chunks replace earlier ones
+        rows = {}
+        contour_names = defaultdict(dict)
+        shapes = {}
+        for chunk, contour_id, width, valid in zip(
+            contour_chunks,
+            headers["id"].tolist(),
+            widths.tolist(),
+            data_in_file.tolist(),
+        ):
+            if width <= 0:
+                continue
+            volume_string = chunk.volume_string
+            contour_name = f"contour{contour_id}"
+            slice_id = int(chunk.slice_id / 2)
+            if not valid:
+                warnings.warn(
+                    (
+                        f"Could not read contour "
+                        f"image id {volume_string}"
+                        f"contour name {contour_name} "
+                        f"slice id {slice_id}."
+                    ),
+                    UserWarning,
+                )
+                continue
+            names = contour_names[volume_string]
+            layer = names.setdefault(contour_name, len(names))
+            rows[volume_string, layer, slice_id] = (chunk.data_offset + 16, width)
+            shape = shapes.get(volume_string, (0, 0))
+            shapes[volume_string] = (max(shape[0], slice_id + 1), max(shape[1], width))
+
+        contours = {}
+        for volume_string, names in contour_names.items():
+            num_slices, width = shapes[volume_string]
+            if volume_string in self.max_slice_ids:
+                num_slices = max(num_slices, int(self.max_slice_ids[volume_string]) + 1)
+            contours[volume_string] = (
+                list(names),
+                np.full((len(names), num_slices, width), np.nan, dtype=np.float32),
+            )
+
+        # gather rows of the same width from the file in batches
+        by_width = defaultdict(list)
+        for (volume_string, layer, slice_id), (offset, width) in rows.items():
+            by_width[volume_string, width].append((layer, slice_id, offset))
+        max_float = np.finfo(np.float32).max
+        for (volume_string, width), width_rows in by_width.items():
+            row_bytes = np.arange(width * 4)
+            for batch_start in range(0, len(width_rows), batch_size):
+                batch = np.array(width_rows[batch_start : batch_start + batch_size])
+                layers, slice_ids, offsets = batch.T
+                values = buffer[offsets[:, None] + row_bytes].view(np.float32)
+                values[(values < 1e-9) | (values == max_float)] = np.nan
+                contours[volume_string][1][layers, slice_ids, :width] = values
+        return contours
+
+    def iter_bscans(
+        self,
+        legacy_intensity_transform: bool = False,
+        dtype: np.dtype = np.float64,
+        series: Iterable[str] | None = None,
+        laterality: str | None = None,
+    ) -> Iterator[tuple[str, int, np.ndarray, dict]]:
+        """Yields OCT b-scans one at a time, in file order, without building volumes.
+
+        Args:
+            legacy_intensity_transform: if True, use intensity transform used in v<=0.5.7. Defaults to False.
+            dtype: dtype of the b-scans, as in read_oct_volume. Defaults to float64.
+            series: only yield b-scans of these volumes.
+            laterality: only yield b-scans of this eye, "R" or "L".
+
+        Yields:
+            tuples of (volume string, b-scan index, b-scan, metadata), where metadata holds
+            the b-scan's "acquisition_time", "scaley" and "contours" (contour name to row).
+        """
+        LUT = intensity_lut(legacy_intensity_transform, dtype)
+        laterality_dict = self._read_lateralities() if laterality else {}
+        selected = self._select_series(series, laterality, None, laterality_dict)
+
+        # group the per-slice chunks from the index, nothing is read yet
+        image_chunks = []
+        slice_chunks = defaultdict(list)
+        for chunk in self.chunk_index:
+            if selected is not None and chunk.volume_string not in selected:
+                continue
+            if chunk.type == 1073741824 and chunk.ind == 1:
+                image_chunks.append(chunk)
+            elif chunk.type in [10004, 10019]:
+                key = (chunk.volume_string, int(chunk.slice_id / 2))
+                slice_chunks[key].append(chunk)
+        image_chunks.sort(key=lambda chunk: chunk.offset)
+
+        with open(self.filepath, "rb") as f:
+            for chunk in image_chunks:
+                f.seek(chunk.data_offset)
+                raw = f.read(20)
+                image_data = e2e_binary.image_structure.parse(raw)
+                count = image_data.height * image_data.width
+                if count == 0:
+                    return
+                raw_volume = np.fromfile(f, dtype=np.uint16, count=count)
+                if len(raw_volume) < count:
+                    warnings.warn(
+                        (
+                            f"Could not reshape image id {chunk.volume_string} with "
+                            f"{len(raw_volume)} elements into a "
+                            f"{image_data.height}x"
+                            f"{image_data.width} array"
+                        ),
+                        UserWarning,
+                    )
+                    continue
+                image = LUT[raw_volume].reshape(image_data.height, image_data.width)
+
+                slice_id = int(chunk.slice_id / 2)
+                key = (chunk.volume_string, slice_id)
+                metadata = {"acquisition_time": None, "scaley": None, "contours": {}}
+                for slice_chunk in slice_chunks.get(key, []):
+                    f.seek(slice_chunk.data_offset)
+                    if slice_chunk.type == 10004:  # bscan metadata
+                        raw = f.read(104)
+                        bscan_metadata = e2e_binary.bscan_metadata.parse(raw)
+                        metadata["acquisition_time"] = self._ticks_to_datetime(
+                            bscan_metadata.acquisitionTime
+                        )
+                        metadata["scaley"] = bscan_metadata.scaley
+                    else:  # contour data
+                        contour = self._read_contour(f, slice_chunk)
+                        if contour is not None:
+                            contour_name, contour_values = contour
+                            metadata["contours"][contour_name] = contour_values
+
+                yield chunk.volume_string, slice_id, image, metadata
+
+    def _read_contour(self, f, chunk: E2EChunk) -> tuple[str, np.ndarray] | None:
+        """Reads a contour chunk, with f positioned at its data.
+
+        Returns:
+            the contour name and row, with missing values set to NaN, or None.
+        """
+        raw = f.read(16)
+        contour_data = e2e_binary.contour_structure.parse(raw)
+        if contour_data.width <= 0:
+            return None
+
+        contour_name = f"contour{contour_data.id}"
+        try:
+            raw_volume = np.frombuffer(f.read(contour_data.width * 4), dtype=np.float32)
+            contour = np.array(raw_volume)
+            max_float = np.finfo(np.float32).max
+            contour[(contour < 1e-9) | (contour == max_float)] = np.nan
+        except Exception:
+            warnings.warn(
+                (
+                    f"Could not read contour "
+                    f"image id {chunk.volume_string}"
+                    f"contour name {contour_name} "
+                    f"slice id {int(chunk.slice_id / 2)}."
+                ),
+                UserWarning,
+            )
+            return None
+        return contour_name, contour
+
+    def _ticks_to_datetime(self, windowsTicks: int) -> datetime:
+        """Converts a b-scan acquisition time, in Windows ticks, to a datetime."""
+        windowsTicksToUnixFactor = 10000000
+        secToUnixEpechFromWindowsTicks = 11644473600
+        unixtime = (
+            windowsTicks / windowsTicksToUnixFactor - secToUnixEpechFromWindowsTicks
+        )
+        utc_time = time.gmtime(unixtime)
+        return datetime.fromtimestamp(time.mktime(utc_time))
+
     def read_fundus_image(
         self,
         extract_scan_repeats: bool = False,
         scalex: float = 0.01,
+        series: Iterable[str] | None = None,
+        laterality: str | None = None,
+        modality: str | None = None,
     ) -> list[FundusImageWithMetaData]:
         """Reads fundus data.
 
         Args:
             extract_scan_repeats: if True, extract all fundus images, including those that appear repeated. Defaults to False.
             scalex: Manually set scale of x axis
+            series: only read these images, given as "patient_db_id_study_id_series_id" strings.
+            laterality: only read images of this eye, "R" or "L".
+            modality: "localizer" to only read the fundus images of OCT series,
+                "fundus" to only read those of series without OCT data. With any
+                filter, the attached metadata only covers the selected series.
 
         Returns:
             A sequence of FundusImageWithMetaData.
         """
+        laterality_dict = self._read_lateralities()
+        selected = self._select_series(series, laterality, modality, laterality_dict)
         with open(self.filepath, "rb") as f:
-            # traverse in second pass and  get all subdirectories
-            chunk_stack = []
-            for position in self.directory_stack:
-                f.seek(position + self.byte_skip)
-                raw = f.read(52)
-                directory_chunk = e2e_binary.main_directory_structure.parse(raw)
-
-                for ii in range(directory_chunk.num_entries):
-                    raw = f.read(44)
-                    chunk = e2e_binary.sub_directory_structure.parse(raw)
-                    if chunk.start > chunk.pos:
-                        chunk_stack.append([chunk.start, chunk.size])
-
             # initalise dict to hold all the image volumes
             image_array_dict = {}
-            laterality_dict = {}
-            laterality = None
 
             # traverse all chunks and extract slices
-            for start, pos in chunk_stack:
-                f.seek(start + self.byte_skip)
-                raw = f.read(60)
-                try:
-                    # Heidelberg's updated anonymization seems to cause problems with
-                    # some chunks. Observed problems include an empty raw and problems
-                    # with undecodable bytes. For now, these chunks are skipped...
-                    chunk = e2e_binary.chunk_structure.parse(raw)
-                except Exception:
+            for chunk in self.chunk_index:
+                if (
+                    selected is not None
+                    and chunk.type != 9
+                    and chunk.volume_string not in selected
+                ):
                     continue
+                f.seek(chunk.data_offset)
 
                 if chunk.type == 9:  # patient data
                     raw = f.read(127)
@@ -443,20 +1123,6 @@ class E2E(object):
                     except Exception:
                         pass
 
-                elif chunk.type == 3:  # scan preamble data
-                    raw = f.read(chunk.size)
-                    try:
-                        pre_data = e2e_binary.pre_data.parse(raw)
-                        if pre_data.laterality in ["R", "L"]:
-                            laterality = pre_data.laterality
-                    except Exception:
-                        laterality = None
-                    volume_string = "{}_{}_{}".format(
-                        chunk.patient_db_id, chunk.study_id, chunk.series_id
-                    )
-                    if laterality and (volume_string not in laterality_dict):
-                        laterality_dict[volume_string] = laterality
-
                 elif chunk.type == 1073741824:  # image data
                     raw = f.read(20)
                     image_data = e2e_binary.image_structure.parse(raw)
@@ -469,9 +1135,7 @@ class E2E(object):
                             image_data.height, image_data.width
                         )
 
-                        image_string = "{}_{}_{}".format(
-                            chunk.patient_db_id, chunk.study_id, chunk.series_id
-                        )
+                        image_string = chunk.volume_string
                         if (
                             image_string in image_array_dict.keys()
                             and extract_scan_repeats
@@ -485,7 +1149,7 @@ class E2E(object):
                         image_array_dict[image_string] = image
 
             # Read metadata to attach to FundusImageWithMetaData
-            metadata = self.read_all_metadata()
+            metadata = self.read_all_metadata(series=selected)
 
             fundus_images = []
             for key, image in image_array_dict.items():
@@ -524,15 +1188,41 @@ class E2E(object):
 
         return fundus_images
 
-    def read_all_metadata(self):
+    def read_all_metadata(self, series: Iterable[str] | None = None):
         """
         Reads all available metadata and returns a dictionary.
 
         The metadata is a raw dump of everything available.
 
+        Args:
+            series: only read the chunks of these volumes, given as
+                "patient_db_id_study_id_series_id" strings. Chunks outside any
+                image series, such as the patient and device records, are always
+                read. Defaults to every volume.
+
         Returns:
             dictionary with all metadata.
         """
+        if series is not None:
+            return self._parse_all_metadata(series)
+        if self._metadata is None:
+            self._metadata = self._parse_all_metadata()
+        return copy.deepcopy(self._metadata)
+
+    def _parse_all_metadata(self, series: Iterable[str] | None = None) -> dict:
+        """Parses the metadata returned by read_all_metadata."""
+        chunks = self.chunk_index
+        if series is not None:
+            series = {series} if isinstance(series, str) else set(series)
+            image_series = {
+                chunk.volume_string for chunk in chunks if chunk.type == 1073741824
+            }
+            chunks = [
+                chunk
+                for chunk in chunks
+                if chunk.volume_string in series
+                or chunk.volume_string not in image_series
+            ]
 
         def _convert_to_dict(container):
             """Converts a container object to a dictionary"""
@@ -561,35 +1251,11 @@ class E2E(object):
         metadata["additional_device_data"] = []
 
         with open(self.filepath, "rb") as f:
-            # get all subdirectories
-            chunk_stack = []
-
-            for position in self.directory_stack:
-                f.seek(position + self.byte_skip)
-                raw = f.read(52)
-                directory_chunk = e2e_binary.main_directory_structure.parse(raw)
-
-                for ii in range(directory_chunk.num_entries):
-                    raw = f.read(44)
-                    chunk = e2e_binary.sub_directory_structure.parse(raw)
-                    if chunk.start > chunk.pos:
-                        chunk_stack.append([chunk.start, chunk.size])
-
             # traverse all chunks and extract slices
-            for start, pos in chunk_stack:
-                f.seek(start + self.byte_skip)
-                raw = f.read(60)
-                try:
-                    # Heidelberg's updated anonymization seems to cause problems with
-                    # some chunks. Observed problems include an empty raw and problems
-                    # with undecodable bytes. For now, these chunks are skipped...
-                    chunk = e2e_binary.chunk_structure.parse(raw)
-                except Exception:
-                    continue
+            for chunk in chunks:
+                f.seek(chunk.data_offset)
 
-                image_string = "{}_{}_{}".format(
-                    chunk.patient_db_id, chunk.study_id, chunk.series_id
-                )
+                image_string = chunk.volume_string
 
                 if chunk.type == 9:  # patient data
                     raw = f.read(127)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import io
-import struct
 import typing as t
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import cv2
 import numpy as np
 from construct import ListContainer
 from PIL import Image
@@ -22,6 +24,83 @@ from oct_converter.image_types import (
     SourceInfo,
 )
 from oct_converter.readers.binary_structs import fda_binary
+from oct_converter.readers.topcon_chunks import TopconChunk, TopconChunks
+
+CONTOUR_LAYERS = {
+    "MULTILAYERS_1": "ILM",
+    "MULTILAYERS_2": "RNFL_GCL",
+    "MULTILAYERS_3": "GCL_IPL",
+    "MULTILAYERS_4": "IPL_INL",
+    "MULTILAYERS_5": "MZ_EZ",
+    "MULTILAYERS_6": "IZ_RPE",
+    "MULTILAYERS_7": "BM",
+    "MULTILAYERS_8": "INL_OPL",
+    "MULTILAYERS_9": "ELM",
+    "MULTILAYERS_10": "CSI",
+}
+
+
+class FDASegmentation(Mapping):
+    """Lazy, name-addressable layer segmentation from @CONTOUR_INFO chunks.
+
+    Only the small chunk headers are parsed up front. Each layer is a
+    ``(num_slices, width)`` read-only view over the memory-mapped file, measured
+    in pixels from the b-scan bottom, and is only read from disk when accessed.
+
+    Attributes:
+        height: if set, layers are instead measured from the top of a b-scan of
+            this height, as int64 arrays computed when a layer is first accessed.
+    """
+
+    def __init__(
+        self,
+        chunks: TopconChunks,
+        layers: dict[str, t.Tuple[TopconChunk, int, int]] | None = None,
+        height: int | None = None,
+    ) -> None:
+        self._chunks = chunks
+        if layers is None:
+            layers = {}
+            for chunk in chunks.find(b"@CONTOUR_INFO"):
+                header = chunks.parse(fda_binary.contour_info_header, chunk)
+                layer_name = CONTOUR_LAYERS.get(header.id, header.id)
+                layers[layer_name] = (chunk, header.height, header.width)
+        self._layers = layers
+        self.height = height
+        self._cache = {}
+
+    def __getitem__(self, layer_name: str) -> np.ndarray:
+        if layer_name in self._cache:
+            return self._cache[layer_name]
+        chunk, height, width = self._layers[layer_name]
+        seg = self._chunks.array(
+            chunk, dtype=np.uint16, shape=(height, width), offset=34
+        )
+        seg = np.flip(seg, 0)
+        if self.height is not None:
+            seg = np.subtract(self.height, seg, dtype=np.int64)
+            self._cache[layer_name] = seg
+        return seg
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._layers)
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    def measured_from_top(self, height: int) -> FDASegmentation:
+        """Returns the same layers measured from the top of a b-scan of ``height``."""
+        return FDASegmentation(self._chunks, self._layers, height)
+
+    def as_array(self) -> np.ndarray:
+        """Stacks all layers into a single ``(layers, num_slices, width)`` array.
+
+        Layers are stacked in iteration order, matching ``list(self)``.
+        """
+        shapes = {layer[1:] for layer in self._layers.values()}
+        if len(shapes) > 1:
+            raise ValueError(f"Segmentation layers differ in shape: {shapes}")
+        return np.stack([self[layer_name] for layer_name in self])
 
 
 class FDA(object):
@@ -29,6 +108,7 @@ class FDA(object):
 
     Attributes:
         filepath: path to .fda file for reading.
+        chunks: memory-mapped chunk container shared by all read methods.
         chunk_dict: names of data chunks present in the file, and their start locations.
     """
 
@@ -37,6 +117,7 @@ class FDA(object):
         if not self.filepath.exists():
             raise FileNotFoundError(self.filepath)
 
+        self.chunks = TopconChunks(self.filepath, fda_binary.header)
         self.chunk_dict, self.header = self.get_list_of_file_chunks(printing=printing)
 
     def get_list_of_file_chunks(self, printing: bool = False) -> t.Tuple[dict, dict]:
@@ -48,30 +129,16 @@ class FDA(object):
             header: dictionary of file header information
         """
         chunk_dict = {}
-        with open(self.filepath, "rb") as f:
-            raw = f.read(15)
-            header = dict(fda_binary.header.parse(raw))
-
-            eof = False
-            while not eof:
-                chunk_name_size = np.fromstring(f.read(1), dtype=np.uint8)[0]
-                if chunk_name_size == 0:
-                    eof = True
-                else:
-                    chunk_name = f.read(chunk_name_size)
-                    chunk_size = np.fromstring(f.read(4), dtype=np.uint32)[0]
-                    chunk_location = f.tell()
-                    f.seek(chunk_size, 1)
-                    if chunk_name in chunk_dict.keys():
-                        previous_location = chunk_dict[chunk_name][0]
-                        previous_size = chunk_dict[chunk_name][1]
-                        if not isinstance(previous_location, list):
-                            previous_location = [previous_location]
-                            previous_size = [previous_size]
-                        chunk_location = previous_location + [chunk_location]
-                        chunk_size = previous_size + [chunk_size]
-
-                    chunk_dict[chunk_name] = [chunk_location, chunk_size]
+        for chunk_name in self.chunks.names():
+            chunks = self.chunks.find(chunk_name)
+            if len(chunks) == 1:
+                chunk_dict[chunk_name] = [chunks[0].offset, chunks[0].size]
+            else:
+                chunk_dict[chunk_name] = [
+                    [chunk.offset for chunk in chunks],
+                    [chunk.size for chunk in chunks],
+                ]
+        header = self.chunks.header
         if printing:
             print("File {} contains the following chunks:".format(self.filepath))
             for key in chunk_dict.keys():
@@ -79,19 +146,23 @@ class FDA(object):
             print("")
         return chunk_dict, header
 
-    def read_oct_volume(self) -> OCTVolumeWithMetaData:
+    def read_oct_volume(self, workers: int | None = None) -> OCTVolumeWithMetaData:
         """Reads OCT data.
 
         Notes:
             Mostly based on description of .fda file format here:
             https://bitbucket.org/uocte/uocte/wiki/Topcon%20File%20Format
 
+        Args:
+            workers: number of threads used to decode @IMG_JPEG b-scans.
+                Defaults to ThreadPoolExecutor's default.
+
         Returns:
             OCTVolumeWithMetaData
         """
         # read oct data chunk, whether that's IMG_JPEG or IMG_MOT_COMP_03
         # TODO: could support the other IMG_MOT_COMP variants as well.
-        volume, oct_header = self.read_oct_data_chunk()
+        volume, oct_header = self.read_oct_data_chunk(workers=workers)
         # if oct data is found, calculate pixel spacing.
         if oct_header:
             pixel_spacing = self.read_scan_params(oct_header)
@@ -102,10 +173,61 @@ class FDA(object):
         # from top of scan to be compatible with plotting in OCTVolume
         contours = self.read_segmentation()
         if contours:
-            contours = {k: oct_header.get("height") - v for k, v in contours.items()}
+            contours = contours.measured_from_top(oct_header.get("height"))
 
         # read all other metadata
         metadata = self.read_all_metadata()
+        oct_volume = OCTVolumeWithMetaData(
+            volume,
+            metadata_model=self._metadata_model(
+                metadata, oct_header, pixel_spacing, contours
+            ),
+        )
+        return oct_volume
+
+    def probe(self) -> OCTMetadataModel:
+        """Reads a summary of the file without decoding any image data.
+
+        Only the chunk table, the patient, capture and scan parameter chunks and
+        the few header bytes in front of the OCT pixels are read, which makes this
+        suitable for cataloguing large archives.
+
+        Returns:
+            OCTMetadataModel, where oct_header holds the volume's dimensions and scan
+            mode, and metadata holds the parsed chunks along with a "chunks" inventory
+            of every chunk name in the file and the sizes of its occurrences.
+        """
+        metadata = {}
+        for key in [
+            b"@PATIENT_INFO_02",
+            b"@CAPTURE_INFO_02",
+            b"@CAPTURE_INFO",
+            b"@PARAM_SCAN_04",
+            b"@PARAM_SCAN_02",
+        ]:
+            if key in self.chunks:
+                json_key = key.decode().split("@")[-1].lower()
+                metadata[json_key] = self.read_any_info_and_make_dict(key)
+        metadata["chunks"] = {
+            name.decode(): [chunk.size for chunk in self.chunks.find(name)]
+            for name in self.chunks.names()
+        }
+
+        oct_header = self.read_oct_header()
+        if oct_header:
+            pixel_spacing = self.read_scan_params(oct_header)
+        else:
+            pixel_spacing = None
+        return self._metadata_model(metadata, oct_header, pixel_spacing)
+
+    def _metadata_model(
+        self,
+        metadata: dict,
+        oct_header: dict | None,
+        pixel_spacing: list | None,
+        contours: dict | None = None,
+    ) -> OCTMetadataModel:
+        """Builds the metadata model shared by read_oct_volume and probe."""
         patient_info = metadata.get("patient_info_02") or metadata.get(
             "patient_info", {}
         )
@@ -119,79 +241,83 @@ class FDA(object):
             patient_dob = datetime(*patient_info.get("birth_date"))
         except (TypeError, ValueError):
             patient_dob = None
-        # print("Patient info:", patient_info)
-        oct_volume = OCTVolumeWithMetaData(
-            volume,
-            metadata_model=OCTMetadataModel(
-                source=SourceInfo(
-                    vendor="Topcon",
-                    file_format="FDA",
-                    filepath=self.filepath,
-                ),
-                patient=PatientInfo(
-                    patient_id=patient_info.get("patient_id"),
-                    first_name=patient_info.get("first_name"),
-                    surname=patient_info.get("last_name"),
-                    sex=sex_map[patient_info.get("sex", None)],
-                    patient_dob=patient_dob,
-                ),
-                series=SeriesInfo(
-                    acquisition_date=datetime(*capture_info.get("cap_date")),
-                    laterality=lat_map[capture_info.get("eye", None)],
-                ),
-                device=DeviceInfo(vendor="Topcon"),
-                geometry=ImageGeometry(pixel_spacing=pixel_spacing),
-                metadata=metadata,
-                header=self.header,
-                oct_header=oct_header,
-                contours=contours,
+        try:
+            acquisition_date = datetime(*capture_info.get("cap_date"))
+        except (TypeError, ValueError):
+            acquisition_date = None
+        return OCTMetadataModel(
+            source=SourceInfo(
+                vendor="Topcon",
+                file_format="FDA",
+                filepath=self.filepath,
+            ),
+            patient=PatientInfo(
+                patient_id=patient_info.get("patient_id"),
+                first_name=patient_info.get("first_name"),
+                surname=patient_info.get("last_name"),
+                sex=sex_map[patient_info.get("sex", None)],
+                patient_dob=patient_dob,
             ),
+            series=SeriesInfo(
+                acquisition_date=acquisition_date,
+                laterality=lat_map[capture_info.get("eye", None)],
+            ),
+            device=DeviceInfo(vendor="Topcon"),
+            geometry=ImageGeometry(pixel_spacing=pixel_spacing),
+            metadata=metadata,
+            header=self.header,
+            oct_header=oct_header,
+            contours=contours,
         )
-        return oct_volume
 
-    def read_oct_data_chunk(self) -> t.Tuple[np.ndarray, dict]:
+    def read_oct_header(self) -> dict | None:
+        """Reads the header in front of the OCT pixels, without reading any pixels.
+
+        Returns:
+            OCT header as dict, or None if no OCT data chunk is found.
+        """
+        if b"@IMG_JPEG" in self.chunks:
+            oct_header = self.chunks.parse(fda_binary.oct_header, b"@IMG_JPEG")
+        elif b"@IMG_MOT_COMP_03" in self.chunks:
+            oct_header = self.chunks.parse(fda_binary.oct_header_2, b"@IMG_MOT_COMP_03")
+        else:
+            return None
+        return {key: value for key, value in oct_header.items() if key != "_io"}
+
+    def read_oct_data_chunk(
+        self, workers: int | None = None
+    ) -> t.Tuple[np.ndarray, dict]:
         """Given available chunks, identifies which chunk to utilize
         as the primary OCT data and returns the volume.
 
+        Args:
+            workers: number of threads used to decode @IMG_JPEG b-scans.
+                Defaults to ThreadPoolExecutor's default.
+
         Returns:
-            volume: OCT volume as array
+            volume: OCT volume as array. @IMG_MOT_COMP_03 b-scans are read-only
+                views over the memory-mapped file, only read from disk when accessed.
             oct_header: OCT header as dict
         """
-        if b"@IMG_JPEG" in self.chunk_dict:
-            with open(self.filepath, "rb") as f:
-                chunk_location, chunk_size = self.chunk_dict[b"@IMG_JPEG"]
-                f.seek(chunk_location)  # Set the chunk’s current position.
-                raw = f.read(25)
-                oct_header = fda_binary.oct_header.parse(raw)
-
-                volume = []
-                for i in range(oct_header.number_slices):
-                    size = np.fromstring(f.read(4), dtype=np.int32)[0]
-                    raw_slice = f.read(size)
-                    image = Image.open(io.BytesIO(raw_slice))
-                    volume.append(np.asarray(image))
+        if b"@IMG_JPEG" in self.chunks:
+            data = self.chunks.data(b"@IMG_JPEG")
+            oct_header = fda_binary.oct_header.parse(data[:25])
+            table = self._jpeg_slice_table(data, oct_header.number_slices)
+            volume = self._decode_jpeg_slices(data, table, workers)
             return volume, dict(oct_header)
 
-        elif b"@IMG_MOT_COMP_03" in self.chunk_dict:
-            with open(self.filepath, "rb") as f:
-                chunk_location, chunk_size = self.chunk_dict[b"@IMG_MOT_COMP_03"]
-                f.seek(chunk_location)  # Set the chunk’s current position.
-                raw = f.read(22)
-                oct_header = fda_binary.oct_header_2.parse(raw)
-                number_pixels = (
-                    oct_header.width * oct_header.height * oct_header.number_slices
-                )
-                raw_volume = np.fromstring(f.read(number_pixels * 2), dtype=np.uint16)
-                volume = np.array(raw_volume)
-                volume = volume.reshape(
-                    oct_header.width,
-                    oct_header.height,
-                    oct_header.number_slices,
-                    order="F",
-                )
-                volume = np.transpose(volume, [1, 0, 2])
-                adjusted_volume = [volume[:, :, i] for i in range(volume.shape[2])]
-            return adjusted_volume, dict(oct_header)
+        elif b"@IMG_MOT_COMP_03" in self.chunks:
+            data = self.chunks.data(b"@IMG_MOT_COMP_03")
+            oct_header = fda_binary.oct_header_2.parse(data[:22])
+            # pixels are stored column-major as (width, height, slices), which is
+            # laid out exactly like a C-ordered (slices, height, width) volume.
+            volume = self.chunks.array(
+                b"@IMG_MOT_COMP_03",
+                dtype=np.uint16,
+                shape=(oct_header.number_slices, oct_header.height, oct_header.width),
+                offset=22,
+            )
+            return volume, dict(oct_header)
 
         else:
             print(
@@ -199,6 +325,88 @@ class FDA(object):
             )
             return None, None
 
+    @staticmethod
+    def _jpeg_slice_table(
+        data: memoryview, number_slices: int
+    ) -> list[t.Tuple[int, int]]:
+        """Walks the length prefixed b-scans of an @IMG_JPEG chunk.
+
+        Args:
+            data: @IMG_JPEG chunk data.
+            number_slices: number of b-scans given by the chunk's header.
+
+        Returns:
+            (offset, size) of each JPEG within the chunk.
+        """
+        table = []
+        position = 25
+        for i in range(number_slices):
+            size = int.from_bytes(data[position : position + 4], "little")
+            position += 4
+            table.append((position, size))
+            position += size
+        return table
+
+    @staticmethod
+    def _decode_jpeg(data: memoryview, offset: int, size: int) -> np.ndarray:
+        """Decodes a single JPEG b-scan without copying it out of the file.
+
+        Colour b-scans are returned as RGB, as PIL decodes them.
+        """
+        encoded = np.frombuffer(data, dtype=np.uint8, count=size, offset=offset)
+        image = cv2.imdecode(encoded, cv2.IMREAD_UNCHANGED)
+        if image is None:
+            # fall back to PIL for anything OpenCV is unable to decode
+            return np.asarray(Image.open(io.BytesIO(encoded)))
+        if image.ndim == 3 and image.shape[2] == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        return image
+
+    def _decode_jpeg_slices(
+        self,
+        data: memoryview,
+        table: list[t.Tuple[int, int]],
+        workers: int | None = None,
+    ) -> np.ndarray | list[np.ndarray]:
+        """Decodes JPEG b-scans concurrently into one preallocated array.
+
+        cv2.imdecode releases the GIL, so b-scans are decoded on a thread pool,
+        each written straight into its slot of a ``(num_slices, height, width)``
+        array shaped after the first b-scan. Any b-scan of a different shape is
+        kept as a separate array.
+
+        Args:
+            data: @IMG_JPEG chunk data.
+            table: (offset, size) of each JPEG, as given by _jpeg_slice_table.
+            workers: number of decoding threads.
+
+        Returns:
+            (num_slices, height, width) array, or a list of b-scans if any differ
+            in shape.
+        """
+        if not table:
+            return []
+        first = self._decode_jpeg(data, *table[0])
+        volume = np.empty((len(table),) + first.shape, dtype=first.dtype)
+        volume[0] = first
+
+        def decode_into(index: int) -> np.ndarray | None:
+            image = self._decode_jpeg(data, *table[index])
+            if image.shape != first.shape or image.dtype != first.dtype:
+                return image
+            volume[index] = image
+            return None
+
+        slices = None
+        indices = range(1, len(table))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for index, image in zip(indices, pool.map(decode_into, indices)):
+                if image is not None:
+                    if slices is None:
+                        slices = list(volume)
+                    slices[index] = image
+        return volume if slices is None else slices
+
     def read_scan_params(self, oct_header: dict) -> list:
         """Given available chunks, identifies available PARAM_SCAN chunk
         and calculates pixel spacing.
@@ -209,35 +417,26 @@ class FDA(object):
         Returns:
             pixel_spacing: list of pixel spacing, ordered by width, slice thickness, height.
         """
-        if (
-            b"@PARAM_SCAN_04" not in self.chunk_dict
-            and b"@PARAM_SCAN_02" not in self.chunk_dict
-        ):
+        if b"@PARAM_SCAN_04" in self.chunks:
+            scan_params = self.chunks.parse(
+                fda_binary.param_scan_04_header, b"@PARAM_SCAN_04"
+            )
+        elif b"@PARAM_SCAN_02" in self.chunks:
+            scan_params = self.chunks.parse(
+                fda_binary.param_scan_02_header, b"@PARAM_SCAN_02"
+            )
+        else:
             print(
                 "Neither @PARAM_SCAN_04 nor @PARAM_SCAN_02 found. Pixel spacing not calculated."
             )
             return None
-        with open(self.filepath, "rb") as f:
-            if b"@PARAM_SCAN_04" in self.chunk_dict:
-                chunk_loc, chunk_size = self.chunk_dict.get(
-                    b"@PARAM_SCAN_04", (None, None)
-                )
-                f.seek(chunk_loc)
-                scan_params = fda_binary.param_scan_04_header.parse(f.read(chunk_size))
-            elif b"@PARAM_SCAN_02" in self.chunk_dict:
-                chunk_loc, chunk_size = self.chunk_dict.get(
-                    b"@PARAM_SCAN_02", (None, None)
-                )
-                f.seek(chunk_loc)
-                scan_params = fda_binary.param_scan_02_header.parse(f.read(chunk_size))
-            pixel_spacing = [
-                scan_params.get("x_dimension_mm")
-                / oct_header.get("width"),  # WidthPixelS, PixelSpacing[1]
-                scan_params.get("y_dimension_mm")
-                / oct_header.get("number_slices"),  # FramePixelS / SliceThickness
-                scan_params.get("z_resolution_um")
-                / 1000,  # zHeightPixelS, PixelSpacing[0]
-            ]
+        pixel_spacing = [
+            scan_params.get("x_dimension_mm")
+            / oct_header.get("width"),  # WidthPixelS, PixelSpacing[1]
+            scan_params.get("y_dimension_mm")
+            / oct_header.get("number_slices"),  # FramePixelS / SliceThickness
+            scan_params.get("z_resolution_um") / 1000,  # zHeightPixelS, PixelSpacing[0]
+        ]
         return pixel_spacing
 
     def read_fundus_image(self) -> FundusImageWithMetaData:
@@ -246,20 +445,18 @@ class FDA(object):
         Returns:
             FundusImageWithMetaData
         """
-        if b"@IMG_FUNDUS" not in self.chunk_dict:
+        if b"@IMG_FUNDUS" not in self.chunks:
             print("@IMG_FUNDUS is not in chunk list, skipping.")
             return None
-        with open(self.filepath, "rb") as f:
-            chunk_location, chunk_size = self.chunk_dict[b"@IMG_FUNDUS"]
-            f.seek(chunk_location)  # Set the chunk’s current position.
-            raw = f.read(24)  # skip 24 is important
-            fundus_header = fda_binary.fundus_header.parse(raw)
-            number_pixels = fundus_header.width * fundus_header.height * 3
-            raw_image = f.read(fundus_header.size)
-            image = Image.open(io.BytesIO(raw_image))
-            image = np.asarray(image)
-            # store with RGB channel order
-            image = np.flip(image, 2)
+        data = self.chunks.data(b"@IMG_FUNDUS")
+        fundus_header = fda_binary.fundus_header.parse(
+            data[:24]
+        )  # skip 24 is important
+        raw_image = data[24 : 24 + fundus_header.size]
+        image = Image.open(io.BytesIO(raw_image))
+        image = np.asarray(image)
+        # store with RGB channel order
+        image = np.flip(image, 2)
         fundus_image = FundusImageWithMetaData(
             image,
             metadata_model=FundusMetadataModel(
@@ -279,18 +476,15 @@ class FDA(object):
         Returns:
             FundusImageWithMetaData
         """
-        if b"@IMG_TRC_02" not in self.chunk_dict:
+        if b"@IMG_TRC_02" not in self.chunks:
             print("@IMG_TRC_02 is not in chunk list, skipping.")
             return None
-        with open(self.filepath, "rb") as f:
-            chunk_location, chunk_size = self.chunk_dict[b"@IMG_TRC_02"]
-            f.seek(chunk_location)  # Set the chunk’s current position.
-            raw = f.read(21)  # skip 21 is important
-            img_trc_02_header = fda_binary.img_trc_02_header.parse(raw)
-            number_pixels = img_trc_02_header.width * img_trc_02_header.height * 1
-            raw_image = f.read(img_trc_02_header.size)
-            image = Image.open(io.BytesIO(raw_image))
-            image = np.asarray(image)
+        data = self.chunks.data(b"@IMG_TRC_02")
+        # skip 21 is important
+        img_trc_02_header = fda_binary.img_trc_02_header.parse(data[:21])
+        raw_image = data[21 : 21 + img_trc_02_header.size]
+        image = Image.open(io.BytesIO(raw_image))
+        image = np.asarray(image)
         fundus_gray_scale_image = FundusImageWithMetaData(
             image,
             metadata_model=FundusMetadataModel(
@@ -304,49 +498,22 @@ class FDA(object):
         )
         return fundus_gray_scale_image
 
-    def read_segmentation(self) -> dict:
+    def read_segmentation(self) -> FDASegmentation:
         """Reads layer segmentation data.
 
-        Segmentation values are returned in a dictionary with a key for every
-        layer boundary and are measured in pixels from B-scan bottom.
+        Segmentation values are returned in a mapping with a key for every
+        layer boundary and are measured in pixels from B-scan bottom. Layers are
+        only read from the file when accessed, and ``as_array()`` stacks them
+        into a single ``(layers, num_slices, width)`` array.
 
         Returns
-            dictionary with segmentation data.
+            FDASegmentation with segmentation data.
         """
 
-        if b"@CONTOUR_INFO" not in self.chunk_dict.keys():
+        if b"@CONTOUR_INFO" not in self.chunks:
             print("The file does not have any segmentation chunk.")
             return None
-
-        layer = {
-            "MULTILAYERS_1": "ILM",
-            "MULTILAYERS_2": "RNFL_GCL",
-            "MULTILAYERS_3": "GCL_IPL",
-            "MULTILAYERS_4": "IPL_INL",
-            "MULTILAYERS_5": "MZ_EZ",
-            "MULTILAYERS_6": "IZ_RPE",
-            "MULTILAYERS_7": "BM",
-            "MULTILAYERS_8": "INL_OPL",
-            "MULTILAYERS_9": "ELM",
-            "MULTILAYERS_10": "CSI",
-        }
-
-        seg_dict = {}
-        with open(self.filepath, "rb") as f:
-            for pos in self.chunk_dict[b"@CONTOUR_INFO"][0]:
-                f.seek(pos)
-                raw = f.read(34)
-                header = dict(fda_binary.__dict__["contour_info_header"].parse(raw))
-                n_voxel = header["width"] * header["height"]
-
-                data_bytes = f.read(n_voxel * 2)
-                seg = struct.unpack("H" * n_voxel, data_bytes)
-                seg = np.array(seg).reshape((header["height"], header["width"]))
-                seg = np.flip(seg, 0)
-                layer_name = layer.get(header["id"], header["id"])
-                seg_dict[layer_name] = seg
-
-        return seg_dict
+        return FDASegmentation(self.chunks)
 
     def read_all_metadata(self, verbose: bool = False):
         """
@@ -359,7 +526,7 @@ class FDA(object):
             dictionary with all metadata.
         """
         metadata = dict()
-        for key in self.chunk_dict.keys():
+        for key in self.chunks.names():
             if key in [b"@IMG_JPEG", b"@IMG_FUNDUS", b"@IMG_TRC_02", b"@CONTOUR_INFO"]:
                 # these chunks have their own dedicated methods for extraction
                 continue
@@ -383,23 +550,21 @@ class FDA(object):
         Returns:
             Chunk info data
         """
-        if chunk_name not in self.chunk_dict:
+        if chunk_name not in self.chunks:
             print(f"{chunk_name} is not in chunk list, skipping.")
             return None
-        with open(self.filepath, "rb") as f:
-            chunk_location, chunk_size = self.chunk_dict[chunk_name]
-            f.seek(chunk_location)  # Set the chunk’s current position.
-            raw = f.read()
-            header_name = f"{chunk_name.decode().split('@')[-1].lower()}_header"
-            chunk_info_header = dict(fda_binary.__dict__[header_name].parse(raw))
-            chunks_info = dict()
-            for idx, key in enumerate(chunk_info_header.keys()):
-                if idx == 0:
-                    continue
-                if type(chunk_info_header[key]) is ListContainer:
-                    chunks_info[key] = list(chunk_info_header[key])
-                else:
-                    chunks_info[key] = chunk_info_header[key]
+        header_name = f"{chunk_name.decode().split('@')[-1].lower()}_header"
+        chunk_info_header = dict(
+            self.chunks.parse(fda_binary.__dict__[header_name], chunk_name)
+        )
+        chunks_info = dict()
+        for idx, key in enumerate(chunk_info_header.keys()):
+            if idx == 0:
+                continue
+            if type(chunk_info_header[key]) is ListContainer:
+                chunks_info[key] = list(chunk_info_header[key])
+            else:
+                chunks_info[key] = chunk_info_header[key]
         return chunks_info
 
     def read_param_obs(self) -> dict:
@@ -408,24 +573,23 @@ class FDA(object):
         Returns:
             Chunk info data for PARAM_OBS_02
         """
-        with open(self.filepath, "rb") as f:
-            chunk_location, chunk_size = self.chunk_dict[b"@PARAM_OBS_02"]
-            f.seek(chunk_location)  # Set the chunk’s current position.
-            raw = f.read()
-            # PARAM_OBS_02 is either of size 90 or size 6.
-            if chunk_size == 90:
-                chunk_info_header = dict(fda_binary.param_obs_02_header.parse(raw))
-            else:  # chunk_size == 6
-                chunk_info_header = dict(
-                    fda_binary.param_obs_02_short_header.parse(raw)
-                )
-
-            chunks_info = dict()
-            for idx, key in enumerate(chunk_info_header.keys()):
-                if idx == 0:
-                    continue
-                if type(chunk_info_header[key]) is ListContainer:
-                    chunks_info[key] = list(chunk_info_header[key])
-                else:
-                    chunks_info[key] = chunk_info_header[key]
+        chunk = self.chunks.find(b"@PARAM_OBS_02")[-1]
+        # PARAM_OBS_02 is either of size 90 or size 6.
+        if chunk.size == 90:
+            chunk_info_header = dict(
+                self.chunks.parse(fda_binary.param_obs_02_header, chunk)
+            )
+        else:  # chunk.size == 6
+            chunk_info_header = dict(
+                self.chunks.parse(fda_binary.param_obs_02_short_header, chunk)
+            )
+
+        chunks_info = dict()
+        for idx, key in enumerate(chunk_info_header.keys()):
+            if idx == 0:
+                continue
+            if type(chunk_info_header[key]) is ListContainer:
+                chunks_info[key] = list(chunk_info_header[key])
+            else:
+                chunks_info[key] = chunk_info_header[key]
         return chunks_info
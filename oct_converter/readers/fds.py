@@ -19,6 +19,7 @@ from oct_converter.image_types import (
     SourceInfo,
 )
 from oct_converter.readers.binary_structs import fds_binary
+from oct_converter.readers.topcon_chunks import TopconChunks
 
 
 class FDS(object):
@@ -30,6 +31,7 @@ class FDS(object):
 
     Attributes:
         filepath: path to .img file for reading.
+        chunks: memory-mapped chunk container shared by all read methods.
         chunk_dict: names of data chunks present in the file, and their start locations.
     """
 
@@ -38,6 +40,7 @@ class FDS(object):
         if not self.filepath.exists():
             raise FileNotFoundError(self.filepath)
 
+        self.chunks = TopconChunks(self.filepath, fds_binary.header)
         self.chunk_dict, self.header = self.get_list_of_file_chunks()
 
     def get_list_of_file_chunks(self, printing: bool = False) -> t.Tuple[dict, dict]:
@@ -50,21 +53,9 @@ class FDS(object):
 
         """
         chunk_dict = {}
-        with open(self.filepath, "rb") as f:
-            raw = f.read(15)
-            header = dict(fds_binary.header.parse(raw))
-
-            eof = False
-            while not eof:
-                chunk_name_size = np.fromstring(f.read(1), dtype=np.uint8)[0]
-                if chunk_name_size == 0:
-                    eof = True
-                else:
-                    chunk_name = f.read(chunk_name_size)
-                    chunk_size = np.fromstring(f.read(4), dtype=np.uint32)[0]
-                    chunk_location = f.tell()
-                    f.seek(chunk_size, 1)
-                    chunk_dict[chunk_name] = [chunk_location, chunk_size]
+        for chunk in self.chunks.table:
+            chunk_dict[chunk.name] = [chunk.offset, chunk.size]
+        header = self.chunks.header
         if printing:
             print("File {} contains the following chunks:".format(self.filepath))
             for key in chunk_dict.keys():
@@ -75,32 +66,82 @@ class FDS(object):
     def read_oct_volume(self) -> OCTVolumeWithMetaData:
         """Reads OCT data.
 
+        B-scans are read-only views over the memory-mapped file, so opening the
+        volume is cheap and pixels are only read from disk when accessed. Use
+        ``np.array(oct_volume.as_array())`` for an in-memory copy.
+
         Returns:
             OCTVolumeWithMetaData
         """
         # TODO: could support the other IMG_SCAN variants as well.
-        if b"@IMG_SCAN_03" not in self.chunk_dict:
+        if b"@IMG_SCAN_03" not in self.chunks:
             raise ValueError("Could not find OCT header @IMG_SCAN_03 in chunk list")
-        with open(self.filepath, "rb") as f:
-            chunk_location, chunk_size = self.chunk_dict[b"@IMG_SCAN_03"]
-            f.seek(chunk_location)
-            raw = f.read(22)
-            oct_header = fds_binary.oct_header.parse(raw)
-            number_pixels = (
-                oct_header.width * oct_header.height * oct_header.number_slices
-            )
-            raw_volume = np.fromstring(f.read(number_pixels * 2), dtype=np.uint16)
-            volume = np.array(raw_volume)
-            volume = volume.reshape(
-                oct_header.width, oct_header.height, oct_header.number_slices, order="F"
-            )
-            volume = np.transpose(volume, [1, 0, 2])
+        data = self.chunks.data(b"@IMG_SCAN_03")
+        oct_header = fds_binary.oct_header.parse(data[:22])
+        # pixels are stored column-major as (width, height, slices), which is
+        # laid out exactly like a C-ordered (slices, height, width) volume.
+        volume = self.chunks.array(
+            b"@IMG_SCAN_03",
+            dtype=np.uint16,
+            shape=(oct_header.number_slices, oct_header.height, oct_header.width),
+            offset=22,
+        )
 
         # calculate pixel spacing
         pixel_spacing = self.read_scan_params(oct_header)
 
         # read all other metadata
         metadata = self.read_all_metadata()
+        oct_volume = OCTVolumeWithMetaData(
+            volume,
+            metadata_model=self._metadata_model(
+                metadata, dict(oct_header), pixel_spacing
+            ),
+        )
+        return oct_volume
+
+    def probe(self) -> OCTMetadataModel:
+        """Reads a summary of the file without reading any image data.
+
+        Only the chunk table, the patient, capture and scan parameter chunks and
+        the few header bytes in front of the OCT pixels are read, which makes this
+        suitable for cataloguing large archives.
+
+        Returns:
+            OCTMetadataModel, where oct_header holds the volume's dimensions and scan
+            mode, and metadata holds the parsed chunks along with a "chunks" inventory
+            of every chunk name in the file and the sizes of its occurrences.
+        """
+        metadata = {}
+        for key in [
+            b"@PATIENT_INFO_02",
+            b"@CAPTURE_INFO_02",
+            b"@CAPTURE_INFO",
+            b"@PARAM_SCAN_04",
+            b"@PARAM_SCAN_02",
+        ]:
+            if key in self.chunks:
+                json_key = key.decode().split("@")[-1].lower()
+                metadata[json_key] = self.read_any_info_and_make_dict(key)
+        metadata["chunks"] = {
+            name.decode(): [chunk.size for chunk in self.chunks.find(name)]
+            for name in self.chunks.names()
+        }
+
+        oct_header = self.read_oct_header()
+        if oct_header:
+            pixel_spacing = self.read_scan_params(oct_header)
+        else:
+            pixel_spacing = None
+        return self._metadata_model(metadata, oct_header, pixel_spacing)
+
+    def _metadata_model(
+        self,
+        metadata: dict,
+        oct_header: dict | None,
+        pixel_spacing: list | None,
+    ) -> OCTMetadataModel:
+        """Builds the metadata model shared by read_oct_volume and probe."""
         patient_info = metadata.get("patient_info_02") or metadata.get(
             "patient_info", {}
         )
@@ -114,59 +155,71 @@ class FDS(object):
             patient_dob = datetime(*patient_info.get("birth_date"))
         except (TypeError, ValueError):
             patient_dob = None
-
-        oct_volume = OCTVolumeWithMetaData(
-            [volume[:, :, i] for i in range(volume.shape[2])],
-            metadata_model=OCTMetadataModel(
-                source=SourceInfo(
-                    vendor="Topcon",
-                    file_format="FDS",
-                    filepath=self.filepath,
-                ),
-                patient=PatientInfo(
-                    patient_id=patient_info.get("patient_id"),
-                    first_name=patient_info.get("first_name"),
-                    surname=patient_info.get("last_name"),
-                    sex=sex_map[patient_info.get("sex", None)],
-                    patient_dob=patient_dob,
-                ),
-                series=SeriesInfo(
-                    acquisition_date=datetime(*capture_info.get("cap_date")),
-                    laterality=lat_map[capture_info.get("eye", None)],
-                ),
-                device=DeviceInfo(vendor="Topcon"),
-                geometry=ImageGeometry(pixel_spacing=pixel_spacing),
-                metadata=metadata,
-                header=self.header,
-                oct_header=dict(oct_header),
+        try:
+            acquisition_date = datetime(*capture_info.get("cap_date"))
+        except (TypeError, ValueError):
+            acquisition_date = None
+        return OCTMetadataModel(
+            source=SourceInfo(
+                vendor="Topcon",
+                file_format="FDS",
+                filepath=self.filepath,
             ),
+            patient=PatientInfo(
+                patient_id=patient_info.get("patient_id"),
+                first_name=patient_info.get("first_name"),
+                surname=patient_info.get("last_name"),
+                sex=sex_map[patient_info.get("sex", None)],
+                patient_dob=patient_dob,
+            ),
+            series=SeriesInfo(
+                acquisition_date=acquisition_date,
+                laterality=lat_map[capture_info.get("eye", None)],
+            ),
+            device=DeviceInfo(vendor="Topcon"),
+            geometry=ImageGeometry(pixel_spacing=pixel_spacing),
+            metadata=metadata,
+            header=self.header,
+            oct_header=oct_header,
         )
-        return oct_volume
 
-    def read_fundus_image(self) -> FundusImageWithMetaData:
-        """Reads fundus image.
+    def read_oct_header(self) -> dict | None:
+        """Reads the @IMG_SCAN_03 header, without reading any pixels.
+
+        Returns:
+            OCT header as dict, or None if @IMG_SCAN_03 is not found.
+        """
+        if b"@IMG_SCAN_03" not in self.chunks:
+            return None
+        oct_header = self.chunks.parse(fds_binary.oct_header, b"@IMG_SCAN_03")
+        return {key: value for key, value in oct_header.items() if key != "_io"}
+
+    def read_fundus_image(self, lazy: bool = False) -> FundusImageWithMetaData:
+        """Reads fundus image as uint8 RGB.
+
+        Args:
+            lazy: if True, the image is a read-only view over the memory-mapped
+                file and its bytes are only read from disk when accessed.
+                Otherwise it is copied into memory once.
 
         Returns:
             FundusImageWithMetaData
         """
-        if b"@IMG_OBS" not in self.chunk_dict:
+        if b"@IMG_OBS" not in self.chunks:
             raise ValueError("Could not find fundus header @IMG_OBS in chunk list")
-        with open(self.filepath, "rb") as f:
-            chunk_location, chunk_size = self.chunk_dict[b"@IMG_OBS"]
-            f.seek(chunk_location)
-            raw = f.read(21)
-            fundus_header = fds_binary.fundus_header.parse(raw)
-            # number_pixels = fundus_header.width * fundus_header.height * fundus_header.number_slices
-            raw_image = np.fromstring(f.read(fundus_header.size), dtype=np.uint8)
-            # raw_image = [struct.unpack('B', f.read(1)) for pixel in range(fundus_header.size)]
-            image = np.array(raw_image)
-            image = image.reshape(
-                3, fundus_header.width, fundus_header.height, order="F"
-            )
-            image = np.transpose(image, [2, 1, 0])
-            image = image.astype(np.float32)
-            # store with RGB channel order
-            image = np.flip(image, 2)
+        fundus_header = self.chunks.parse(fds_binary.fundus_header, b"@IMG_OBS")
+        # pixels are stored column-major as (3, width, height), which is laid out
+        # exactly like a C-ordered (height, width, 3) image.
+        image = self.chunks.array(
+            b"@IMG_OBS",
+            dtype=np.uint8,
+            shape=(fundus_header.height, fundus_header.width, 3),
+            offset=21,
+        )
+        # store with RGB channel order
+        image = np.flip(image, 2)
+        if not lazy:
+            image = np.ascontiguousarray(image)
         fundus_image = FundusImageWithMetaData(
             image,
             metadata_model=FundusMetadataModel(
@@ -190,35 +243,26 @@ class FDS(object):
         Returns:
             pixel_spacing: list of pixel spacing, ordered by width, slice thickness, height.
         """
-        if (
-            b"@PARAM_SCAN_04" not in self.chunk_dict
-            and b"@PARAM_SCAN_02" not in self.chunk_dict
-        ):
+        if b"@PARAM_SCAN_04" in self.chunks:
+            scan_params = self.chunks.parse(
+                fds_binary.param_scan_04_header, b"@PARAM_SCAN_04"
+            )
+        elif b"@PARAM_SCAN_02" in self.chunks:
+            scan_params = self.chunks.parse(
+                fds_binary.param_scan_02_header, b"@PARAM_SCAN_02"
+            )
+        else:
             print(
                 "Neither @PARAM_SCAN_04 nor @PARAM_SCAN_02 found. Pixel spacing not calculated."
             )
             return None
-        with open(self.filepath, "rb") as f:
-            if b"@PARAM_SCAN_04" in self.chunk_dict:
-                chunk_loc, chunk_size = self.chunk_dict.get(
-                    b"@PARAM_SCAN_04", (None, None)
-                )
-                f.seek(chunk_loc)
-                scan_params = fds_binary.param_scan_04_header.parse(f.read(chunk_size))
-            elif b"@PARAM_SCAN_02" in self.chunk_dict:
-                chunk_loc, chunk_size = self.chunk_dict.get(
-                    b"@PARAM_SCAN_02", (None, None)
-                )
-                f.seek(chunk_loc)
-                scan_params = fds_binary.param_scan_02_header.parse(f.read(chunk_size))
-            pixel_spacing = [
-                scan_params.get("x_dimension_mm")
-                / oct_header.get("width"),  # WidthPixelS, PixelSpacing[1]
-                scan_params.get("y_dimension_mm")
-                / oct_header.get("number_slices"),  # FramePixelS / SliceThickness
-                scan_params.get("z_resolution_um")
-                / 1000,  # zHeightPixelS, PixelSpacing[0]
-            ]
+        pixel_spacing = [
+            scan_params.get("x_dimension_mm")
+            / oct_header.get("width"),  # WidthPixelS, PixelSpacing[1]
+            scan_params.get("y_dimension_mm")
+            / oct_header.get("number_slices"),  # FramePixelS / SliceThickness
+            scan_params.get("z_resolution_um") / 1000,  # zHeightPixelS, PixelSpacing[0]
+        ]
         return pixel_spacing
 
     def read_all_metadata(self, verbose: bool = False):
@@ -232,7 +276,7 @@ class FDS(object):
             dictionary with all metadata.
         """
         metadata = dict()
-        for key in self.chunk_dict.keys():
+        for key in self.chunks.names():
             if key in [b"IMG_SCAN_03", b"@IMG_OBS"]:
                 # these chunks have their own dedicated methods for extraction
                 continue
@@ -256,23 +300,21 @@ class FDS(object):
         Returns:
             Chunk info data
         """
-        if chunk_name not in self.chunk_dict:
+        if chunk_name not in self.chunks:
             print(f"{chunk_name} is not in chunk list, skipping.")
             return None
-        with open(self.filepath, "rb") as f:
-            chunk_location, chunk_size = self.chunk_dict[chunk_name]
-            f.seek(chunk_location)  # Set the chunk’s current position.
-            raw = f.read()
-            header_name = f"{chunk_name.decode().split('@')[-1].lower()}_header"
-            chunk_info_header = dict(fds_binary.__dict__[header_name].parse(raw))
-            chunks_info = dict()
-            for idx, key in enumerate(chunk_info_header.keys()):
-                if idx == 0:
-                    continue
-                if type(chunk_info_header[key]) is ListContainer:
-                    chunks_info[key] = list(chunk_info_header[key])
-                else:
-                    chunks_info[key] = chunk_info_header[key]
+        header_name = f"{chunk_name.decode().split('@')[-1].lower()}_header"
+        chunk_info_header = dict(
+            self.chunks.parse(fds_binary.__dict__[header_name], chunk_name)
+        )
+        chunks_info = dict()
+        for idx, key in enumerate(chunk_info_header.keys()):
+            if idx == 0:
+                continue
+            if type(chunk_info_header[key]) is ListContainer:
+                chunks_info[key] = list(chunk_info_header[key])
+            else:
+                chunks_info[key] = chunk_info_header[key]
         return chunks_info
 
     def read_param_obs(self) -> dict:
@@ -281,24 +323,23 @@ class FDS(object):
         Returns:
             Chunk info data for PARAM_OBS_02
         """
-        with open(self.filepath, "rb") as f:
-            chunk_location, chunk_size = self.chunk_dict[b"@PARAM_OBS_02"]
-            f.seek(chunk_location)  # Set the chunk’s current position.
-            raw = f.read()
-            # PARAM_OBS_02 is either of size 90 or size 6.
-            if chunk_size == 90:
-                chunk_info_header = dict(fds_binary.param_obs_02_header.parse(raw))
-            else:  # chunk_size == 6
-                chunk_info_header = dict(
-                    fds_binary.param_obs_02_short_header.parse(raw)
-                )
-
-            chunks_info = dict()
-            for idx, key in enumerate(chunk_info_header.keys()):
-                if idx == 0:
-                    continue
-                if type(chunk_info_header[key]) is ListContainer:
-                    chunks_info[key] = list(chunk_info_header[key])
-                else:
-                    chunks_info[key] = chunk_info_header[key]
+        chunk = self.chunks.find(b"@PARAM_OBS_02")[-1]
+        # PARAM_OBS_02 is either of size 90 or size 6.
+        if chunk.size == 90:
+            chunk_info_header = dict(
+                self.chunks.parse(fds_binary.param_obs_02_header, chunk)
+            )
+        else:  # chunk.size == 6
+            chunk_info_header = dict(
+                self.chunks.parse(fds_binary.param_obs_02_short_header, chunk)
+            )
+
+        chunks_info = dict()
+        for idx, key in enumerate(chunk_info_header.keys()):
+            if idx == 0:
+                continue
+            if type(chunk_info_header[key]) is ListContainer:
+                chunks_info[key] = list(chunk_info_header[key])
+            else:
+                chunks_info[key] = chunk_info_header[key]
         return chunks_info
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import re
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from oct_converter.image_types import (
+    DeviceInfo,
+    ImageGeometry,
+    OCTMetadataModel,
+    OCTVolumeWithMetaData,
+    PatientInfo,
+    SeriesInfo,
+    SourceInfo,
+)
+
+IMAGE_SUFFIXES = (".bmp",)
+
+
+class ImageSeries(object):
+    """Class for assembling a volume from a directory of single-frame slices.
+
+    Volumes are often exported as one DICOM or BMP file per b-scan. DICOM slices
+    are ordered by InstanceNumber, or by ImagePositionPatient along the slice
+    normal; BMP slices are ordered by the numbers in their filenames.
+
+    Attributes:
+        filepath: path to the directory holding the slices.
+    """
+
+    def __init__(self, filepath: str | Path) -> None:
+        self.filepath = Path(filepath)
+        if not self.filepath.exists():
+            raise FileNotFoundError(self.filepath)
+        if not self.filepath.is_dir():
+            raise NotADirectoryError(self.filepath)
+
+    def read_oct_volume(self, workers: int | None = None) -> OCTVolumeWithMetaData:
+        """Reads OCT data.
+
+        Headers are read first, without pixel data, to find and order the slices.
+        Slices are then decoded on a thread pool straight into one preallocated
+        (slices, height, width) array.
+
+        Args:
+            workers: number of threads used to read headers and decode slices.
+                Defaults to ThreadPoolExecutor's default.
+
+        Returns:
+            OCTVolumeWithMetaData
+        """
+        headers = self.read_dicom_headers(workers)
+        if headers:
+            files = list(headers)
+            decode = _decode_dicom
+            first_header = headers[files[0]]
+        else:
+            files = self.find_image_files()
+            decode = _decode_image
+            first_header = None
+        if not files:
+            raise ValueError(f"No DICOM or BMP slices found in {self.filepath}.")
+
+        volume = self._decode_slices(files, decode, workers)
+        if first_header is None and volume.ndim == 4 and volume.shape[3] == 3:
+            if (volume[..., 0] == volume[..., 1]).all() and (
+                volume[..., 1] == volume[..., 2]
+            ).all():
+                # grayscale b-scans saved as 24-bit BMP
+                volume = np.ascontiguousarray(volume[..., 0])
+        return OCTVolumeWithMetaData(
+            volume=volume,
+            metadata_model=self._metadata_model(first_header, len(files)),
+        )
+
+    def read_dicom_headers(self, workers: int | None = None) -> dict[Path, object]:
+        """Reads the header of every DICOM file in the directory, in slice order.
+
+        If the directory holds more than one series, the one with the most slices
+        is kept.
+
+        Args:
+            workers: number of threads used to read headers.
+
+        Returns:
+            dictionary of path to header dataset, sorted into slice order.
+        """
+        paths = sorted(
+            path
+            for path in self.filepath.iterdir()
+            if path.is_file() and path.suffix.lower() not in IMAGE_SUFFIXES
+        )
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            headers = dict(zip(paths, pool.map(_read_dicom_header, paths)))
+        headers = {path: ds for path, ds in headers.items() if ds is not None}
+        if not headers:
+            return {}
+
+        series = {}
+        for path, ds in headers.items():
+            series.setdefault(getattr(ds, "SeriesInstanceUID", None), []).append(path)
+        if len(series) > 1:
+            warnings.warn(
+                f"{self.filepath} holds {len(series)} series, reading the largest.",
+                UserWarning,
+            )
+        paths = max(series.values(), key=len)
+        return {path: headers[path] for path in _sort_dicom_slices(paths, headers)}
+
+    def find_image_files(self) -> list[Path]:
+        """Finds the BMP files in the directory, in natural filename order."""
+        return sorted(
+            (
+                path
+                for path in self.filepath.iterdir()
+                if path.is_file() and path.suffix.lower() in IMAGE_SUFFIXES
+            ),
+            key=lambda path: _natural_key(path.name),
+        )
+
+    def _decode_slices(
+        self, files: list[Path], decode, workers: int | None = None
+    ) -> np.ndarray:
+        """Decodes slices into one array, preallocated from the first slice.
+
+        Args:
+            files: slices, in order.
+            decode: function reading a single slice into an array.
+            workers: number of threads.
+
+        Returns:
+            (slices, height, width) array, or (slices, height, width, channels).
+        """
+        first = decode(files[0])
+        volume = np.empty((len(files),) + first.shape, dtype=first.dtype)
+        volume[0] = first
+
+        def load(index: int) -> None:
+            image = decode(files[index])
+            if image.shape != first.shape:
+                raise ValueError(
+                    f"Slice {files[index].name} is {image.shape}, expected {first.shape}."
+                )
+            volume[index] = image
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(load, range(1, len(files))))
+        return volume
+
+    def _metadata_model(self, ds, num_slices: int) -> OCTMetadataModel:
+        """Builds the metadata model from the first DICOM header, if any."""
+        if ds is None:
+            return OCTMetadataModel(
+                source=SourceInfo(file_format="BMP", filepath=self.filepath),
+                metadata={"num_slices": num_slices},
+            )
+        pixel_spacing = [float(x) for x in getattr(ds, "PixelSpacing", [])]
+        spacing_between = getattr(ds, "SpacingBetweenSlices", None) or getattr(
+            ds, "SliceThickness", None
+        )
+        if pixel_spacing and spacing_between:
+            pixel_spacing.append(float(spacing_between))
+        return OCTMetadataModel(
+            source=SourceInfo(
+                vendor=getattr(ds, "Manufacturer", None),
+                file_format="DICOM",
+                filepath=self.filepath,
+            ),
+            patient=PatientInfo(
+                patient_id=getattr(ds, "PatientID", None),
+                patient_name=str(getattr(ds, "PatientName", "")) or None,
+                sex=getattr(ds, "PatientSex", None),
+                patient_dob=_parse_dicom_date(getattr(ds, "PatientBirthDate", None)),
+            ),
+            series=SeriesInfo(
+                volume_id=getattr(ds, "SeriesInstanceUID", None),
+                acquisition_date=_parse_dicom_date(
+                    getattr(ds, "AcquisitionDate", None)
+                    or getattr(ds, "ContentDate", None)
+                    or getattr(ds, "StudyDate", None)
+                ),
+                laterality=getattr(ds, "ImageLaterality", None)
+                or getattr(ds, "Laterality", None),
+                scan_pattern=getattr(ds, "SeriesDescription", None),
+            ),
+            device=DeviceInfo(
+                vendor=getattr(ds, "Manufacturer", None),
+                device_name=getattr(ds, "ManufacturerModelName", None),
+            ),
+            geometry=ImageGeometry(pixel_spacing=pixel_spacing or None),
+            metadata={"num_slices": num_slices},
+        )
+
+
+def _read_dicom_header(path: Path):
+    """Reads a DICOM header without pixel data, or None if path is not DICOM."""
+    import pydicom
+    from pydicom.errors import InvalidDicomError
+
+    try:
+        ds = pydicom.dcmread(path, stop_before_pixels=True)
+    except (InvalidDicomError, OSError):
+        return None
+    if "Rows" not in ds:
+        # DICOMDIR and other files without an image
+        return None
+    return ds
+
+
+def _sort_dicom_slices(paths: list[Path], headers: dict) -> list[Path]:
+    """Orders slices by InstanceNumber, else by position along the slice normal.
+
+    Falls back to filename order if neither is present on every slice.
+    """
+    if all(
+        getattr(headers[path], "InstanceNumber", None) is not None for path in paths
+    ):
+        return sorted(paths, key=lambda path: int(headers[path].InstanceNumber))
+    if all(
+        "ImagePositionPatient" in headers[path]
+        and "ImageOrientationPatient" in headers[path]
+        for path in paths
+    ):
+        orientation = np.asarray(headers[paths[0]].ImageOrientationPatient, dtype=float)
+        normal = np.cross(orientation[:3], orientation[3:])
+        return sorted(
+            paths,
+            key=lambda path: float(
+                np.dot(np.asarray(headers[path].ImagePositionPatient, float), normal)
+            ),
+        )
+    return sorted(paths, key=lambda path: _natural_key(path.name))
+
+
+def _decode_dicom(path: Path) -> np.ndarray:
+    import pydicom
+
+    return pydicom.dcmread(path).pixel_array
+
+
+def _decode_image(path: Path) -> np.ndarray:
+    # np.fromfile + imdecode also handles non-ASCII paths
+    image = cv2.imdecode(np.fromfile(path, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+    if image is None:
+        raise ValueError(f"Could not decode {path}.")
+    if image.ndim == 3 and image.shape[2] == 3:
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    return image
+
+
+def _natural_key(name: str) -> list:
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
+
+
+def _parse_dicom_date(value: str | None) -> datetime | None:
+    try:
+        return datetime.strptime(value, "%Y%m%d") if value else None
+    except ValueError:
+        return None
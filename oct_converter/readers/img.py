@@ -34,6 +34,9 @@ class IMG(object):
     ):
         """Reads OCT data.
 
+        The file is memory-mapped and b-scans are returned as read-only uint8 views
+        over it, so pixels are only read from disk when a b-scan is accessed.
+
         Args:
             rows: can be used to specify a custom row dimension of the image slice. Defaults to 1024 pixels.
             cols: dan be used to specify a custom column dimension of the image slice. Defaults to 512 pixels.
@@ -42,26 +45,32 @@ class IMG(object):
         Returns:
             OCTVolumeWithMetaData
         """
-        with open(self.filepath, "rb") as f:
-            volume = np.frombuffer(
-                f.read(), dtype=np.uint8
-            )  # np.fromstring() gives numpy depreciation warning
-            num_slices = len(volume) // (rows * cols)
-            volume = volume.reshape((rows, cols, num_slices), order="F")
-            if interlaced:
-                shape = volume.shape
-                mid_height = shape[0] // 2
-                interlaced = np.zeros((int(shape[0] / 2), shape[1], shape[2] * 2))
-                interlaced[..., 0::2] = volume[:mid_height, ...]
-                interlaced[..., 1::2] = volume[mid_height:, ...]
-                interlaced = np.rot90(interlaced, axes=(0, 1))
-                volume = interlaced
+        num_slices = self.filepath.stat().st_size // (rows * cols)
+        if num_slices == 0:
+            raise ValueError(
+                f"{self.filepath} is smaller than a single {rows}x{cols} b-scan."
+            )
+        # pixels are stored column-major as (rows, cols, slices), which is laid out
+        # exactly like a C-ordered (slices, cols, rows) volume.
+        raw_volume = np.memmap(
+            self.filepath, dtype=np.uint8, mode="r", shape=(num_slices, cols, rows)
+        )
+        if interlaced:
+            # each stored slice holds two b-scans, one in either half of its rows,
+            # which are interleaved and rotated by 90 degrees.
+            mid_height = rows // 2
+            halves = raw_volume[..., : 2 * mid_height].reshape(
+                num_slices, cols, 2, mid_height
+            )
+            volume = [halves[i // 2, ::-1, i % 2, :] for i in range(2 * num_slices)]
+        else:
+            volume = raw_volume.transpose(0, 2, 1)
 
         meta = self.get_metadata_from_filename()
         lat_map = {"OD": "R", "OS": "L", None: ""}
 
         oct_volume = OCTVolumeWithMetaData(
-            [volume[:, :, i] for i in range(volume.shape[2])],
+            volume,
             metadata_model=OCTMetadataModel(
                 source=SourceInfo(
                     vendor="Zeiss",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+import warnings
 from datetime import datetime
 from pathlib import Path
 
@@ -99,54 +100,83 @@ class POCT(object):
                 second=int(acq[5]),
             )
 
+        # Scan blocks are stored back to back as float32 B-scans
+        offset = 0
+        for scan in scan_info:
+            scan["offset"] = offset
+            offset += scan["number"] * scan["length"] * scan["height"] * 4
+
         self.scan_info = scan_info
         self.file_info = file_info
 
-    def read_oct_volume(self) -> list[OCTVolumeWithMetaData]:
+    def read_oct_volume(
+        self, scans: list[int] | None = None
+    ) -> list[OCTVolumeWithMetaData]:
         """Reads OCT data.
 
+        Each scan block described in the filespec is a read-only view over the
+        memory-mapped .oct file, so pixels are only read when a B-scan is accessed
+        and unselected blocks are never read.
+
+        Args:
+            scans: indices of the scan blocks to read, in the order they appear in
+                the filespec. Defaults to all of them.
+
         Returns:
             OCTVolumeWithMetaData
         """
         self._read_filespec()
+        if scans is None:
+            scans = range(len(self.scan_info))
 
-        with open(self.filepath, "rb") as f:
-            data = np.frombuffer(
-                f.read(), dtype=np.float32
-            )  # np.fromstring() gives numpy depreciation warning
-            all_volumes = []
-            for volume in self.scan_info:
-                num_pixels_slice = volume["height"] * volume["length"]
-                num_slices = volume["number"]
-                all_slices = []
-                for i in range(num_slices):
-                    slice = data[i * num_pixels_slice : (i + 1) * num_pixels_slice]
-                    slice = np.rot90(slice.reshape(volume["length"], volume["height"]))
-                    all_slices.append(slice)
-                all_volumes.append(
-                    OCTVolumeWithMetaData(
-                        all_slices,
-                        metadata_model=OCTMetadataModel(
-                            source=SourceInfo(
-                                vendor="Optovue",
-                                file_format="POCT",
-                                filepath=self.filepath,
-                            ),
-                            series=SeriesInfo(
-                                acquisition_date=self.file_info.get(
-                                    "acquisition_date", None
-                                ),
-                                laterality=self.file_info.get("laterality", ""),
-                            ),
-                            device=DeviceInfo(vendor="Optovue"),
-                            geometry=ImageGeometry(
-                                pixel_spacing=[
-                                    self.file_info.get("scale_x", 0.015),
-                                    self.file_info.get("scale_y", 0.015),
-                                ]
+        file_size = self.filepath.stat().st_size
+        all_volumes = []
+        for index in scans:
+            volume = self.scan_info[index]
+            bytes_slice = volume["height"] * volume["length"] * 4
+            num_slices = volume["number"]
+            available = max(file_size - volume["offset"], 0) // bytes_slice
+            if available < num_slices:
+                warnings.warn(
+                    f"Scan block {index} of {self.filepath} has {available} of "
+                    f"{num_slices} B-scans.",
+                    UserWarning,
+                )
+                num_slices = available
+            if num_slices == 0:
+                data = np.zeros((0, volume["length"], volume["height"]), np.float32)
+            else:
+                data = np.memmap(
+                    self.filepath,
+                    dtype=np.float32,
+                    mode="r",
+                    offset=volume["offset"],
+                    shape=(num_slices, volume["length"], volume["height"]),
+                )
+            all_volumes.append(
+                OCTVolumeWithMetaData(
+                    np.rot90(data, axes=(1, 2)),
+                    metadata_model=OCTMetadataModel(
+                        source=SourceInfo(
+                            vendor="Optovue",
+                            file_format="POCT",
+                            filepath=self.filepath,
+                        ),
+                        series=SeriesInfo(
+                            acquisition_date=self.file_info.get(
+                                "acquisition_date", None
                             ),
-                            metadata=self.file_info,
+                            laterality=self.file_info.get("laterality", ""),
                         ),
-                    )
+                        device=DeviceInfo(vendor="Optovue"),
+                        geometry=ImageGeometry(
+                            pixel_spacing=[
+                                self.file_info.get("scale_x", 0.015),
+                                self.file_info.get("scale_y", 0.015),
+                            ]
+                        ),
+                        metadata=self.file_info,
+                    ),
                 )
+            )
         return all_volumes
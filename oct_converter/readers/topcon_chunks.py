@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import mmap
+import warnings
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+from construct import Container, SizeofError, Struct
+
+
+class TopconChunk(NamedTuple):
+    """Location of a single data chunk within a Topcon .fda/.fds file.
+
+    Attributes:
+        name: chunk name, e.g. b"@IMG_JPEG".
+        offset: absolute position of the chunk's data in the file.
+        size: size of the chunk's data in bytes.
+    """
+
+    name: bytes
+    offset: int
+    size: int
+
+
+class TopconChunks(object):
+    """Memory-mapped chunk container shared by the FDA and FDS readers.
+
+    The file is mapped once and the chunk table is parsed straight from the
+    mapped buffer. Chunk data is handed out as zero-copy memoryview slices
+    bounded by the chunk's size, so reading a small metadata chunk never
+    touches the rest of the file. A chunk name that appears more than once
+    resolves to its last occurrence unless an index is given.
+
+    Attributes:
+        filepath: path to .fda or .fds file.
+        header: dictionary of file header information.
+        table: every chunk in the file, in file order.
+    """
+
+    def __init__(self, filepath: str | Path, header_struct: Struct) -> None:
+        self.filepath = Path(filepath)
+        with open(self.filepath, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buffer = memoryview(self._mmap)
+
+        header_size = header_struct.sizeof()
+        self.header = dict(header_struct.parse(self.buffer[:header_size]))
+        self.table = self._read_chunk_table(header_size)
+        self._by_name = {}
+        for chunk in self.table:
+            self._by_name.setdefault(chunk.name, []).append(chunk)
+
+    def _read_chunk_table(self, position: int) -> list[TopconChunk]:
+        """Walks the chunk table, which starts right after the file header.
+
+        Each entry is a one byte name length, the name, a uint32 data size and
+        the data itself. A zero name length marks the end of the table.
+
+        Args:
+            position: offset of the first chunk entry.
+
+        Returns:
+            list of chunks in file order.
+        """
+        buffer = self.buffer
+        table = []
+        while position < len(buffer):
+            name_size = buffer[position]
+            if name_size == 0:
+                break
+            data_offset = position + 1 + name_size + 4
+            if data_offset > len(buffer):
+                warnings.warn(
+                    f"Chunk table of {self.filepath} is truncated at byte {position}.",
+                    UserWarning,
+                )
+                break
+            name = bytes(buffer[position + 1 : position + 1 + name_size])
+            size = int.from_bytes(buffer[data_offset - 4 : data_offset], "little")
+            table.append(TopconChunk(name, data_offset, size))
+            position = data_offset + size
+        return table
+
+    def __contains__(self, name: bytes) -> bool:
+        return name in self._by_name
+
+    def names(self) -> list[bytes]:
+        """Returns the unique chunk names, in order of first appearance."""
+        return list(self._by_name)
+
+    def find(self, name: bytes) -> list[TopconChunk]:
+        """Returns every occurrence of a chunk, in file order."""
+        return self._by_name.get(name, [])
+
+    def _resolve(self, name: bytes | TopconChunk, index: int) -> TopconChunk | None:
+        if isinstance(name, TopconChunk):
+            return name
+        chunks = self.find(name)
+        return chunks[index] if chunks else None
+
+    def data(self, name: bytes | TopconChunk, index: int = -1) -> memoryview | None:
+        """Zero-copy view of a chunk's data.
+
+        Args:
+            name: chunk name, or a TopconChunk from the table.
+            index: which occurrence to return if the chunk appears more than once.
+                Defaults to the last occurrence.
+
+        Returns:
+            memoryview bounded by the chunk's size, or None if the chunk is absent.
+        """
+        chunk = self._resolve(name, index)
+        if chunk is None:
+            return None
+        return self.buffer[chunk.offset : chunk.offset + chunk.size]
+
+    def array(
+        self,
+        name: bytes | TopconChunk,
+        dtype: np.dtype,
+        shape: tuple[int, ...],
+        offset: int = 0,
+        index: int = -1,
+    ) -> np.ndarray | None:
+        """Zero-copy, read-only array over part of a chunk.
+
+        Pixels are only paged in from disk when the array is accessed.
+
+        Args:
+            name: chunk name, or a TopconChunk from the table.
+            dtype: array data type.
+            shape: array shape, in C order.
+            offset: position of the array within the chunk's data.
+            index: which occurrence to use if the chunk appears more than once.
+                Defaults to the last occurrence.
+
+        Returns:
+            array backed by the memory-mapped file, or None if the chunk is absent.
+        """
+        data = self.data(name, index)
+        if data is None:
+            return None
+        count = int(np.prod(shape))
+        array = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+        return array.reshape(shape)
+
+    def parse(
+        self, struct: Struct, name: bytes | TopconChunk, index: int = -1
+    ) -> Container | None:
+        """Parses a construct Struct from the start of a chunk.
+
+        Only the Struct's own size is read when it is fixed, so parsing the header
+        of a large chunk never copies the rest of it. Some chunks are shorter than
+        the Struct describing them; these are parsed over the Struct's size with a
+        warning, as earlier versions that read to the end of the file did.
+
+        Args:
+            struct: construct Struct describing the chunk.
+            name: chunk name, or a TopconChunk from the table.
+            index: which occurrence to parse if the chunk appears more than once.
+                Defaults to the last occurrence.
+
+        Returns:
+            parsed Container, or None if the chunk is absent.
+        """
+        chunk = self._resolve(name, index)
+        if chunk is None:
+            return None
+        try:
+            size = struct.sizeof()
+        except SizeofError:
+            size = chunk.size
+        if size > chunk.size:
+            warnings.warn(
+                f"Chunk {chunk.name} is {chunk.size} bytes, shorter than "
+                f"its {size} byte structure.",
+                UserWarning,
+            )
+        return struct.parse(self.buffer[chunk.offset : chunk.offset + size])
+
+    def close(self) -> None:
+        """Releases the memory map.
+
+        The map stays open while any array or view created from it is alive.
+        """
+        try:
+            self.buffer.release()
+            self._mmap.close()
+        except BufferError:
+            pass
@@ -477,24 +477,9 @@ def load_heidelberg_fa_dataset(
     study_date_value: date | None = None
 
     with input_file.open("rb") as handle:
-        chunk_stack: list[tuple[int, int]] = []
-        for position in reader.directory_stack:
-            handle.seek(position + reader.byte_skip)
-            directory_chunk = e2e_binary.main_directory_structure.parse(handle.read(52))
-            for _ in range(directory_chunk.num_entries):
-                chunk = e2e_binary.sub_directory_structure.parse(handle.read(44))
-                if chunk.start > chunk.pos:
-                    chunk_stack.append((chunk.start, chunk.size))
-
-        for start, _ in chunk_stack:
-            handle.seek(start + reader.byte_skip)
-            raw_header = handle.read(60)
-            try:
-                chunk = e2e_binary.chunk_structure.parse(raw_header)
-                # print(chunk)
-            except Exception:
-                continue
-            series_key = f"{chunk.patient_db_id}_{chunk.study_id}_{chunk.series_id}"
+        for chunk in reader.chunk_index:
+            handle.seek(chunk.data_offset)
+            series_key = chunk.volume_string
             series_entry = series_metadata.setdefault(
                 series_key,
                 {
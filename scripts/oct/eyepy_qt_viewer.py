@@ -129,7 +129,7 @@ def normalize_laterality_code(value: Any) -> str:
     return normalized
 
 
-def make_projection_fundus(volume_slices: list[np.ndarray]) -> np.ndarray:
+def make_projection_fundus(volume_slices: np.ndarray | list[np.ndarray]) -> np.ndarray:
     volume_array = np.asarray(volume_slices)
     if volume_array.ndim != 3:
         return np.zeros((512, 512), dtype=np.uint8)
@@ -599,7 +599,7 @@ def load_e2e_file(filepath: Path) -> list[VolumeViewModel]:
             fundus = to_display_image(matched_fundus.image)
             fundus_source_label = getattr(matched_fundus, "image_id", None) or "fundus-image"
         else:
-            fundus = make_projection_fundus(list(volume.volume))
+            fundus = make_projection_fundus(volume.as_array())
             fundus_match_mode = "projection-fallback"
             fundus_source_label = "projection-fallback"
 
@@ -626,7 +626,7 @@ def load_e2e_file(filepath: Path) -> list[VolumeViewModel]:
         if volume.laterality:
             label = f"{label} ({volume.laterality})"
 
-        slice_shape = tuple(np.asarray(volume.volume[0]).shape) if volume.volume else tuple()
+        slice_shape = tuple(np.asarray(volume.volume[0]).shape) if volume.num_slices else tuple()
         summary = {
             "file": str(filepath),
             "source": "E2E",
@@ -675,7 +675,7 @@ def load_fda_file(filepath: Path) -> list[VolumeViewModel]:
 
     reader = FDA(filepath)
     volume = reader.read_oct_volume()
-    if volume is None or not volume.volume:
+    if volume is None or not volume.num_slices:
         raise RuntimeError("FDA 文件中未读取到 OCT 体数据。")
 
     fundus_image = reader.read_fundus_image()
@@ -687,7 +687,7 @@ def load_fda_file(filepath: Path) -> list[VolumeViewModel]:
         fundus_source_label = getattr(fundus_image, "image_id", None) or "fundus-image"
         fundus_match_mode = "embedded-fundus"
     else:
-        fundus = make_projection_fundus(list(volume.volume))
+        fundus = make_projection_fundus(volume.as_array())
         fundus_source_label = "projection-fallback"
         fundus_match_mode = "projection-fallback"
 
@@ -704,7 +704,7 @@ def load_fda_file(filepath: Path) -> list[VolumeViewModel]:
     if volume.laterality:
         label = f"{label} ({volume.laterality})"
 
-    slice_shape = tuple(np.asarray(volume.volume[0]).shape) if volume.volume else tuple()
+    slice_shape = tuple(np.asarray(volume.volume[0]).shape) if volume.num_slices else tuple()
     summary = {
         "file": str(filepath),
         "source": "FDA",
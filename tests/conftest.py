@@ -0,0 +1,597 @@
+"""Builders for small synthetic files in each vendor format."""
+
+import struct
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from oct_converter.readers.binary_structs import e2e_binary, fda_binary, fds_binary
+
+E2E_HEIGHT, E2E_WIDTH = 16, 12
+
+
+def _e2e_chunk_header(pos, size, patient, study, series, slice_id, ind, chunk_type):
+    return e2e_binary.chunk_structure.build(
+        dict(
+            magic3="MDbData",
+            unknown=0,
+            unknown2=0,
+            pos=pos,
+            size=size,
+            unknown3=0,
+            patient_db_id=patient,
+            study_id=study,
+            series_id=series,
+            slice_id=slice_id,
+            ind=ind,
+            unknown4=0,
+            type=chunk_type,
+            unknown5=0,
+        )
+    )
+
+
+def _e2e_text(strings, size=256):
+    out = struct.pack("<II", len(strings), size)
+    for string in strings:
+        out += string.encode("utf-16-le").ljust(size, b"\0")
+    return out
+
+
+def _e2e_image(array):
+    height, width = array.shape
+    header = e2e_binary.image_structure.build(
+        dict(size=array.nbytes, type=0, unknown=0, height=height, width=width)
+    )
+    return header + array.tobytes()
+
+
+def build_e2e(path, multi=False, num_slices=5, series=(1, 2), seed=0):
+    """Writes an E2E file holding one OCT volume per series.
+
+    Each volume has ``num_slices`` b-scans with two contours each, a fundus image
+    and a laterality; odd series are right eyes. One extra b-scan is stored under
+    series 9, which has no b-scan metadata.
+    """
+    rng = np.random.default_rng(seed)
+    patient, study = 7, 3
+    payloads = [
+        (
+            patient,
+            study,
+            0,
+            -1,
+            0,
+            9,
+            e2e_binary.patient_id_structure.build(
+                dict(
+                    first_name="Jane",
+                    surname="Doe",
+                    title="Ms",
+                    birthdate=(2450000 + 14558805) * 64,
+                    sex="F",
+                    patient_id="P123",
+                )
+            ),
+        ),
+        (patient, study, 0, -1, 0, 9001, _e2e_text(["Heidelberg Retina", "HRA", ""])),
+    ]
+    for ser in series:
+        laterality = b"R" if ser % 2 else b"L"
+        payloads += [
+            (patient, study, ser, -1, 0, 3, bytes(4) + laterality + bytes(20)),
+            (patient, study, ser, -1, 0, 9006, _e2e_text(["3D Volume", "Vol"])),
+            (patient, study, ser, 0, 0, 11, bytes(20)),
+            (
+                patient,
+                study,
+                ser,
+                0,
+                0,
+                1073741824,
+                _e2e_image(rng.integers(0, 255, (E2E_HEIGHT, E2E_HEIGHT), np.uint8)),
+            ),
+        ]
+        for s in range(num_slices):
+            metadata = dict(
+                unknown1=0,
+                imgSizeY=E2E_HEIGHT,
+                imgSizeX=E2E_WIDTH,
+                posX1=0.0,
+                posY1=float(s),
+                posX2=1.0,
+                posY2=float(s),
+                zero1=0,
+                unknown2=0.0,
+                scaley=0.0039,
+                unknown3=0.0,
+                zero2=0,
+                unknown4=[0.0, 0.0],
+                zero3=0,
+                imgSizeWidth=E2E_WIDTH,
+                numImages=num_slices,
+                aktImage=s,
+                scanType=0,
+                centrePosX=0.0,
+                centrePosY=0.0,
+                unknown5=0,
+                acquisitionTime=132_000_000_000_000_000 + s * 10_000_000 + ser,
+                numAve=1,
+                imgQuality=20.0,
+            )
+            bscan = rng.integers(0, 65535, (E2E_HEIGHT, E2E_WIDTH), np.uint16)
+            bscan[0, 0] = 0xFFFF
+            payloads += [
+                (
+                    patient,
+                    study,
+                    ser,
+                    2 * s,
+                    0,
+                    10004,
+                    e2e_binary.bscan_metadata.build(metadata),
+                ),
+                (patient, study, ser, 2 * s, 1, 1073741824, _e2e_image(bscan)),
+            ]
+            for contour_id in (0, 1):
+                contour = rng.random(E2E_WIDTH).astype(np.float32) * E2E_HEIGHT
+                contour[0] = 0
+                payloads.append(
+                    (
+                        patient,
+                        study,
+                        ser,
+                        2 * s,
+                        0,
+                        10019,
+                        struct.pack("<IIII", 0, contour_id, 0, E2E_WIDTH)
+                        + contour.tobytes(),
+                    )
+                )
+    bscan = rng.integers(0, 65535, (E2E_HEIGHT, E2E_WIDTH), np.uint16)
+    payloads.append((patient, study, 9, 0, 1, 1073741824, _e2e_image(bscan)))
+
+    # two directory blocks, each ending in an empty entry
+    half = len(payloads) // 2
+    block_sizes = [52 + 44 * (half + 1), 52 + 44 * (len(payloads) - half + 1)]
+    dir_positions = [36 + 52, 36 + 52 + block_sizes[0]]
+    offset = 36 + 52 + sum(block_sizes)
+    body = bytearray()
+    entries = []
+    for patient_id, study_id, ser, slice_id, ind, chunk_type, data in payloads:
+        header = _e2e_chunk_header(
+            offset, len(data), patient_id, study_id, ser, slice_id, ind, chunk_type
+        )
+        entries.append(
+            (offset, len(data) + 60, patient_id, study_id, ser, slice_id, chunk_type)
+        )
+        body += header + data
+        offset += len(header) + len(data)
+
+    directories = bytearray()
+    previous = 0
+    for position, block in zip(dir_positions, (entries[:half], entries[half:])):
+        directories += e2e_binary.main_directory_structure.build(
+            dict(
+                magic2="MDbDir",
+                version=1,
+                unknown=[0] * 10,
+                num_entries=len(block) + 1,
+                current=position,
+                prev=previous,
+                unknown3=0,
+            )
+        )
+        for start, size, patient_id, study_id, ser, slice_id, chunk_type in block + [
+            (0, 0, 0, 0, 0, -1, 0)
+        ]:
+            directories += e2e_binary.sub_directory_structure.build(
+                dict(
+                    pos=position,
+                    start=start,
+                    size=size,
+                    unknown=0,
+                    patient_db_id=patient_id,
+                    study_id=study_id,
+                    series_id=ser,
+                    slice_id=slice_id,
+                    unknown2=0,
+                    unknown3=0,
+                    type=chunk_type,
+                    unknown4=0,
+                )
+            )
+        previous = position
+    main_directory = e2e_binary.main_directory_structure.build(
+        dict(
+            magic2="MDbMDir",
+            version=1,
+            unknown=[0] * 10,
+            num_entries=0,
+            current=dir_positions[-1],
+            prev=0,
+            unknown3=0,
+        )
+    )
+    prefix = b"E2EMultipleVolumeFile".ljust(64, b"\0") if multi else b""
+    header = e2e_binary.header_structure.build(
+        dict(magic1="CMDb", version=1, unknown=[0] * 10)
+    )
+    with open(path, "wb") as f:
+        f.write(prefix + header + main_directory + directories + body)
+    return path
+
+
+@pytest.fixture
+def e2e_file(tmp_path):
+    return build_e2e(tmp_path / "synthetic.E2E")
+
+
+@pytest.fixture
+def e2e_multi_file(tmp_path):
+    return build_e2e(
+        tmp_path / "multi.E2E", multi=True, num_slices=4, series=(1, 2, 3), seed=1
+    )
+
+
+TOPCON_HEIGHT, TOPCON_WIDTH, TOPCON_SLICES = 32, 24, 6
+
+
+def _topcon_chunk(name, data):
+    return bytes([len(name)]) + name + struct.pack("<I", len(data)) + data
+
+
+def _jpeg(image):
+    return cv2.imencode(".jpg", image)[1].tobytes()
+
+
+def _topcon_common_chunks(binary):
+    patient = bytearray(binary.patient_info_02_header.sizeof())
+    patient[0:4] = b"P001"
+    patient[32:36] = b"Jane"
+    patient[64:67] = b"Doe"
+    patient[104] = 2
+    patient[105:111] = struct.pack("<HHH", 1970, 5, 6)
+    capture = (
+        struct.pack("<BBI", 1, 2, 7)
+        + b"label".ljust(100, b"\0")
+        + struct.pack("<6H", 2020, 1, 2, 3, 4, 5)
+    )
+    calibration = (
+        "eq_calib_year",
+        "eq_calib_month",
+        "eq_calib_day",
+        "eq_calib_hour",
+        "eq_calib_minute",
+        "spect_calib_year",
+        "spect_calib_month",
+        "spect_calib_day",
+        "spect_calib_hour",
+        "spect_calib_minute",
+    )
+    hw_info = dict(
+        model_name="Maestro", serial_number="SN1", spect_sn="", rom_ver="", unknown=""
+    )
+    hw_info.update({key: 1 for key in calibration})
+    return (
+        _topcon_chunk(b"@PATIENT_INFO_02", bytes(patient))
+        + _topcon_chunk(b"@CAPTURE_INFO_02", capture)
+        + _topcon_chunk(
+            b"@PARAM_SCAN_04",
+            struct.pack("<3I5dBB", 0, 0, 0, 6.0, 6.0, 2.6, 0, 0, 0, 0),
+        )
+        + _topcon_chunk(b"@HW_INFO_03", binary.hw_info_03_header.build(hw_info))
+        + _topcon_chunk(b"@PARAM_OBS_02", struct.pack("<HHH", 1, 0xFFFF, 0xFFFF))
+        + _topcon_chunk(b"@UNKNOWN_THING", b"xyz")
+    )
+
+
+def _topcon_scan_chunk(name, volume):
+    # volume is (width, height, slices), stored in Fortran order
+    width, height, slices = volume.shape
+    return _topcon_chunk(
+        name,
+        struct.pack("<BIIIIBI", 2, width, height, 16, slices, 0, volume.nbytes)
+        + volume.tobytes(order="F"),
+    )
+
+
+def build_fda(path, jpeg=True, color=False, seed=0):
+    """Writes an FDA file holding a JPEG or @IMG_MOT_COMP_03 volume.
+
+    Also holds a colour fundus, a grayscale fundus and three contour layers.
+
+    Args:
+        color: store the JPEG b-scans as colour images.
+    """
+    rng = np.random.default_rng(seed)
+    shape = (TOPCON_SLICES, TOPCON_HEIGHT, TOPCON_WIDTH)
+    out = fda_binary.header.build(
+        dict(file_code="FOCT", file_type="FDA", major_ver=1, minor_ver=2)
+    )
+    out += _topcon_common_chunks(fda_binary)
+    if jpeg:
+        data = struct.pack(
+            "<B6I", 2, 0, 0, TOPCON_WIDTH, TOPCON_HEIGHT, TOPCON_SLICES, 0
+        )
+        for bscan in rng.integers(0, 255, shape + ((3,) if color else ()), np.uint8):
+            encoded = _jpeg(bscan)
+            data += struct.pack("<i", len(encoded)) + encoded
+        out += _topcon_chunk(b"@IMG_JPEG", data)
+    else:
+        volume = rng.integers(0, 65535, shape[::-1], np.uint16)
+        out += _topcon_scan_chunk(b"@IMG_MOT_COMP_03", volume)
+    fundus = rng.integers(0, 255, (20, 30, 3), np.uint8)
+    encoded = _jpeg(fundus)
+    out += _topcon_chunk(
+        b"@IMG_FUNDUS",
+        struct.pack("<4I", 30, 20, 24, 1)
+        + b"JPEG"
+        + struct.pack("<I", len(encoded))
+        + encoded,
+    )
+    encoded = _jpeg(fundus[..., 0])
+    out += _topcon_chunk(
+        b"@IMG_TRC_02", struct.pack("<4IBI", 30, 20, 8, 2, 0, len(encoded)) + encoded
+    )
+    for layer in ("MULTILAYERS_1", "MULTILAYERS_2", "MYSTERY"):
+        seg = rng.integers(0, TOPCON_HEIGHT, (TOPCON_SLICES, TOPCON_WIDTH), np.uint16)
+        out += _topcon_chunk(
+            b"@CONTOUR_INFO",
+            layer.encode().ljust(20, b"\0")
+            + struct.pack("<BBIII", 0, 0, TOPCON_WIDTH, TOPCON_SLICES, seg.nbytes)
+            + seg.tobytes(),
+        )
+    with open(path, "wb") as f:
+        f.write(out + b"\0")
+    return path
+
+
+def build_fds(path, scans=1, seed=0):
+    """Writes an FDS file holding ``scans`` @IMG_SCAN_03 chunks and a fundus image.
+
+    Returns:
+        the path, and the (width, height, slices) volume of each scan chunk.
+    """
+    rng = np.random.default_rng(seed)
+    out = fds_binary.header.build(
+        dict(file_code="FOCT", file_type="FDS", major_ver=1, minor_ver=2)
+    )
+    out += _topcon_common_chunks(fds_binary)
+    volumes = []
+    for _ in range(scans):
+        volume = rng.integers(
+            0, 65535, (TOPCON_WIDTH, TOPCON_HEIGHT, TOPCON_SLICES), np.uint16
+        )
+        volumes.append(volume)
+        out += _topcon_scan_chunk(b"@IMG_SCAN_03", volume)
+    fundus = rng.integers(0, 255, (3, 30, 20), np.uint8)
+    out += _topcon_chunk(
+        b"@IMG_OBS",
+        struct.pack("<4IBI", 30, 20, 24, 1, 0, fundus.nbytes)
+        + fundus.tobytes(order="F"),
+    )
+    with open(path, "wb") as f:
+        f.write(out + b"\0")
+    return path, volumes
+
+
+@pytest.fixture
+def fda_jpeg_file(tmp_path):
+    return build_fda(tmp_path / "jpeg.fda")
+
+
+@pytest.fixture
+def fda_mot_file(tmp_path):
+    return build_fda(tmp_path / "mot.fda", jpeg=False)
+
+
+@pytest.fixture
+def fds_file(tmp_path):
+    return build_fds(tmp_path / "scan.fds")[0]
+
+
+def build_dicom(
+    path,
+    frames=5,
+    rows=24,
+    columns=20,
+    bits=8,
+    photometric="MONOCHROME2",
+    transfer_syntax=None,
+    encapsulation=None,
+    seed=0,
+    **attributes,
+):
+    """Writes a multi-frame DICOM file.
+
+    Args:
+        encapsulation: None for native pixel data, otherwise how JPEG frames are
+            stored: "bot", "nobot", "frag", "fragbot" or "eot".
+        attributes: extra data elements, e.g. InstanceNumber.
+    """
+    from pydicom.dataset import Dataset, FileMetaDataset
+    from pydicom.encaps import encapsulate, encapsulate_extended
+    from pydicom.uid import ExplicitVRLittleEndian, JPEGBaseline8Bit, generate_uid
+
+    rng = np.random.default_rng(seed)
+    file_meta = FileMetaDataset()
+    if encapsulation:
+        file_meta.TransferSyntaxUID = JPEGBaseline8Bit
+    else:
+        file_meta.TransferSyntaxUID = transfer_syntax or ExplicitVRLittleEndian
+    file_meta.MediaStorageSOPClassUID = "1.2.840.10008.5.1.4.1.1.77.1.5.4"
+    file_meta.MediaStorageSOPInstanceUID = generate_uid()
+    ds = Dataset()
+    ds.file_meta = file_meta
+    ds.SOPClassUID = file_meta.MediaStorageSOPClassUID
+    ds.SOPInstanceUID = file_meta.MediaStorageSOPInstanceUID
+    ds.Manufacturer = "Synthetic"
+    ds.ManufacturerModelName = "M1"
+    ds.PixelSpacing = [0.1, 0.2]
+    ds.Rows, ds.Columns, ds.NumberOfFrames = rows, columns, frames
+    ds.SamplesPerPixel = 1 if photometric.startswith("MONOCHROME") else 3
+    if ds.SamplesPerPixel > 1:
+        ds.PlanarConfiguration = 0
+    ds.PhotometricInterpretation = photometric
+    ds.BitsAllocated = bits
+    ds.BitsStored = bits
+    ds.HighBit = bits - 1
+    ds.PixelRepresentation = 0
+    for keyword, value in attributes.items():
+        setattr(ds, keyword, value)
+
+    if encapsulation:
+        ds.LossyImageCompression = "01"
+        encoded = [
+            _jpeg(rng.integers(0, 255, (rows, columns), np.uint8))
+            for _ in range(frames)
+        ]
+        if encapsulation == "eot":
+            (
+                ds.PixelData,
+                ds.ExtendedOffsetTable,
+                ds.ExtendedOffsetTableLengths,
+            ) = encapsulate_extended(encoded)
+        else:
+            ds.PixelData = encapsulate(
+                encoded,
+                fragments_per_frame=2 if encapsulation.startswith("frag") else 1,
+                has_bot=encapsulation in ("bot", "fragbot"),
+            )
+        ds["PixelData"].VR = "OB"
+    else:
+        samples = ds.SamplesPerPixel
+        if photometric == "YBR_FULL_422":
+            samples = 2
+        num_bits = frames * rows * columns * samples * bits
+        if bits > 8:
+            data = rng.integers(0, 2**bits, num_bits // bits, np.uint16)
+        else:
+            # 1 bit data is packed, eight pixels to a byte
+            data = rng.integers(0, 256, (num_bits + 7) // 8, np.uint8)
+        ds.PixelData = data.tobytes() + b"\0" * (data.nbytes % 2)
+    ds.save_as(path, enforce_file_format=True)
+    return path
+
+
+def _boct_key(key, size):
+    encoded = key.encode()
+    return struct.pack("<I", len(encoded)) + encoded + struct.pack("<I", size)
+
+
+def _boct_int(key, value, size=4):
+    return _boct_key(key, size) + int(value).to_bytes(size, "little")
+
+
+def _boct_float(key, value):
+    return _boct_key(key, 8) + struct.pack("<d", value)
+
+
+def _boct_str(key, value):
+    return _boct_key(key, len(value)) + value.encode()
+
+
+def build_boct(
+    path,
+    frames=3,
+    scans=4,
+    lines=20,
+    depth=16,
+    scantype=1,
+    uneven=False,
+    truncate=0,
+    seed=0,
+):
+    """Writes a Bioptigen .OCT file of ``frames * scans`` frames.
+
+    Args:
+        scantype: 0 for linear, 1 for rect scans.
+        uneven: give frames 0, 1 or 2 extra A-scans, so they are not evenly spaced.
+        truncate: number of bytes cut from the end of the file.
+
+    Returns:
+        the path, and the flat uint16 pixels of each frame.
+    """
+    rng = np.random.default_rng(seed)
+    num_frames = frames * scans
+    header = struct.pack("<IH", 0x4F43542E, 1) + _boct_key("FRAMEHEADER", 0)
+    header += _boct_int("FRAMECOUNT", num_frames)
+    header += _boct_int("LINECOUNT", lines)
+    header += _boct_int("LINELENGTH", depth)
+    header += _boct_int("SAMPLEFORMAT", 2)
+    header += _boct_str("DESCRIPTION", "synthetic")
+    header += _boct_float("XMIN", 0) + _boct_float("XMAX", 1)
+    header += _boct_str("XCAPTION", "x")
+    header += _boct_float("YMIN", 0) + _boct_float("YMAX", 1)
+    header += _boct_str("YCAPTION", "y")
+    header += _boct_int("SCANTYPE", scantype)
+    for key in (
+        "SCANDEPTH",
+        "SCANLENGTH",
+        "AZSCANLENGTH",
+        "ELSCANLENGTH",
+        "OBJECTDISTANCE",
+        "SCANANGLE",
+    ):
+        header += _boct_float(key, 1.5)
+    header += _boct_int("SCANS", scans) + _boct_int("FRAMES", frames)
+    header += _boct_int("DOPPLERFLAG", 0)
+    header += _boct_key("CONFIG", 6) + b"\1" * 6 + b"\0" * 4
+
+    body = b""
+    pixels = []
+    for i in range(num_frames):
+        frame_lines = lines + (i % 3 if uneven else 0)
+        frame = rng.integers(0, 65535, frame_lines * depth, np.uint16)
+        pixels.append(frame)
+        frame_header = _boct_key("FRAMEDATA", 0) + _boct_key("FRAMEDATETIME", 16)
+        frame_header += struct.pack("<8H", 2021, 3, 1, 4, 5, 6, 7 + i % 50, i)
+        frame_header += _boct_float("FRAMETIMESTAMP", 0.1 * i)
+        frame_header += _boct_int("FRAMELINES", frame_lines)
+        frame_header += _boct_key("FRAMESAMPLES", frame.nbytes)
+        body += frame_header + frame.tobytes() + b"\0" * 4
+    data = header + body
+    with open(path, "wb") as f:
+        f.write(data[: len(data) - truncate])
+    return path, pixels
+
+
+@pytest.fixture
+def boct_file(tmp_path):
+    return build_boct(tmp_path / "scan_OD.OCT")
+
+
+def build_poct(path, blocks=((8, 6, 5), (8, 10, 2)), truncate=0, seed=0):
+    """Writes an Optovue .oct file and its .txt filespec.
+
+    Args:
+        blocks: (window height, scan length, B-scans) of each scan block.
+        truncate: number of bytes cut from the end of the .oct file.
+
+    Returns:
+        the .oct path, and the flat float32 pixels of each block.
+    """
+    rng = np.random.default_rng(seed)
+    path = Path(path)
+    spec = [
+        "Eye Scanned = OD",
+        "Video Height = 480",
+        "Video Width = 640",
+        "Physical video width = 6.0 mm",
+        "Physical video Height = 4.0 mm",
+    ]
+    pixels = []
+    for height, length, number in blocks:
+        spec += [
+            f"Window Height = {height}",
+            f"Scan Length = {length}",
+            f"Scan Usage = {number}",
+        ]
+        pixels.append(rng.random(height * length * number, dtype=np.float32))
+    path.with_suffix(".txt").write_text("\n".join(spec) + "\n", encoding="iso-8859-1")
+    data = np.concatenate(pixels).tobytes()
+    path.write_bytes(data[: len(data) - truncate])
+    return path, pixels
@@ -0,0 +1,150 @@
+import h5py
+import numpy as np
+import pytest
+from conftest import build_boct
+
+from oct_converter.readers import BOCT
+
+
+def _reference(pixels, shape):
+    """(time, frames, A-scans, depth) volume assembled frame by frame."""
+    volume = np.zeros(shape, dtype=np.uint16)
+    for index, frame in enumerate(pixels[: shape[0] * shape[1]]):
+        t, z = divmod(index, shape[1])
+        volume[t, z] = np.resize(frame, shape[2:])
+    return volume
+
+
+def _as_4d(volumes):
+    return np.stack([np.asarray(volume.as_array()) for volume in volumes])
+
+
+def test_evenly_spaced_frames_are_mapped(tmp_path):
+    path, pixels = build_boct(tmp_path / "even_OS.OCT")
+    volumes = BOCT(path).read_oct_volume()
+    assert len(volumes) == 3
+    np.testing.assert_array_equal(_as_4d(volumes), _reference(pixels, (3, 4, 20, 16)))
+    assert not volumes[0].as_array().flags.owndata
+    assert volumes[0].laterality == "L"
+    assert volumes[0].acquisition_date.year == 2021
+
+
+def test_linear_scans_are_one_frame_per_time_point(tmp_path):
+    path, pixels = build_boct(tmp_path / "linear.OCT", scantype=0, frames=2, scans=3)
+    volumes = BOCT(path).read_oct_volume()
+    np.testing.assert_array_equal(_as_4d(volumes), _reference(pixels, (6, 1, 20, 16)))
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_unevenly_spaced_frames_are_gathered(tmp_path, workers):
+    path, pixels = build_boct(tmp_path / "uneven.OCT", uneven=True)
+    boct = BOCT(path)
+    volumes = boct.read_oct_volume(workers=workers)
+    assert boct.frame_lines.tolist() == [20 + i % 3 for i in range(12)]
+    np.testing.assert_array_equal(_as_4d(volumes), _reference(pixels, (3, 4, 20, 16)))
+
+
+def test_truncated_file_keeps_complete_frames(tmp_path):
+    path, pixels = build_boct(tmp_path / "truncated.OCT", truncate=100)
+    with pytest.warns(UserWarning, match="truncated"):
+        volumes = BOCT(path).read_oct_volume()
+    expected = _reference(pixels[:-1], (3, 4, 20, 16))
+    np.testing.assert_array_equal(_as_4d(volumes), expected)
+
+
+def _no_parsing(monkeypatch):
+    def fail(self):
+        raise AssertionError("the .OCT file was parsed")
+
+    monkeypatch.setattr(BOCT, "read_frame_table", fail)
+
+
+@pytest.mark.parametrize("uneven", [False, True])
+def test_diskbuffered_matches_in_memory(tmp_path, uneven):
+    path, pixels = build_boct(tmp_path / "scan.OCT", uneven=uneven)
+    volumes = BOCT(path).read_oct_volume(diskbuffered=True)
+    np.testing.assert_array_equal(_as_4d(volumes), _reference(pixels, (3, 4, 20, 16)))
+
+
+def test_cache_round_trip(tmp_path, monkeypatch):
+    path, pixels = build_boct(tmp_path / "scan_OD.OCT")
+    cache = tmp_path / "scan.h5"
+    first = BOCT(path).read_oct_volume(cache_path=cache)
+    assert cache.exists()
+
+    _no_parsing(monkeypatch)
+    second = BOCT(path).read_oct_volume(cache_path=cache)
+    expected = _reference(pixels, (3, 4, 20, 16))
+    np.testing.assert_array_equal(_as_4d(first), expected)
+    np.testing.assert_array_equal(_as_4d(second), expected)
+    assert second[0].laterality == "R"
+    assert second[0].acquisition_date == first[0].acquisition_date
+
+
+def test_cache_is_rewritten_when_the_source_changes(tmp_path):
+    path, _ = build_boct(tmp_path / "scan.OCT")
+    cache = tmp_path / "scan.h5"
+    BOCT(path).read_oct_volume(cache_path=cache)
+
+    path, pixels = build_boct(path, frames=2, seed=1)
+    volumes = BOCT(path).read_oct_volume(cache_path=cache)
+    np.testing.assert_array_equal(_as_4d(volumes), _reference(pixels, (2, 4, 20, 16)))
+
+
+def test_incomplete_cache_is_rewritten(tmp_path):
+    path, pixels = build_boct(tmp_path / "scan.OCT")
+    cache = tmp_path / "scan.h5"
+    with h5py.File(cache, "w") as f:
+        # an interrupted read leaves the dataset without the source attributes
+        f.create_dataset("vol", shape=(3, 4, 20, 16), dtype=np.uint16)
+    volumes = BOCT(path).read_oct_volume(cache_path=cache)
+    np.testing.assert_array_equal(_as_4d(volumes), _reference(pixels, (3, 4, 20, 16)))
+
+
+def test_cache_layout(tmp_path):
+    path, _ = build_boct(tmp_path / "scan.OCT")
+    cache = tmp_path / "scan.h5"
+    BOCT(path).read_oct_volume(cache_path=cache, compression="gzip", compression_opts=4)
+    with h5py.File(cache, "r") as f:
+        assert f["vol"].chunks == (1, 1, 20, 16)
+        assert f["vol"].compression == "gzip"
+        assert f["vol"].compression_opts == 4
+
+    BOCT(path).read_oct_volume(cache_path=tmp_path / "big.h5", chunks=(1, 8, 20, 16))
+    with h5py.File(tmp_path / "big.h5", "r") as f:
+        # chunks are clipped to the volume shape
+        assert f["vol"].chunks == (1, 4, 20, 16)
+        assert f["vol"].compression is None
+
+
+@pytest.mark.parametrize("scantype", [0, 1])
+@pytest.mark.parametrize("uneven", [False, True])
+def test_iter_oct_volumes_matches_read_oct_volume(tmp_path, scantype, uneven):
+    path, _ = build_boct(tmp_path / "scan_OS.OCT", scantype=scantype, uneven=uneven)
+    expected = BOCT(path).read_oct_volume()
+    streamed = list(BOCT(path).iter_oct_volumes(workers=2))
+    assert len(streamed) == len(expected)
+    for volume, reference in zip(streamed, expected):
+        np.testing.assert_array_equal(volume.as_array(), reference.as_array())
+        assert volume.laterality == reference.laterality == "L"
+        assert volume.acquisition_date == reference.acquisition_date
+
+
+def test_iter_oct_volumes_reads_time_points_on_demand(tmp_path, monkeypatch):
+    path, pixels = build_boct(tmp_path / "scan.OCT", uneven=True)
+    boct = BOCT(path)
+    gathered = []
+    gather = BOCT._gather_frames
+
+    def record(self, out, time_points=None, workers=None):
+        gathered.append(list(time_points))
+        return gather(self, out, time_points=time_points, workers=workers)
+
+    monkeypatch.setattr(BOCT, "_gather_frames", record)
+    volumes = boct.iter_oct_volumes()
+    assert gathered == []
+    first = next(volumes)
+    assert gathered == [[0]]
+    expected = _reference(pixels, (3, 4, 20, 16))
+    np.testing.assert_array_equal(first.as_array(), expected[0])
+    assert first.as_array().flags.owndata
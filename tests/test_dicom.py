@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from conftest import build_dicom
+from pydicom.uid import ImplicitVRLittleEndian
+
+from oct_converter.image_types import LazyVolume
+from oct_converter.readers import Dicom
+
+
+def _assert_lazy_matches_eager(path):
+    eager = Dicom(path).read_oct_volume()
+    lazy = Dicom(path).read_oct_volume(lazy=True)
+    assert lazy.num_slices == eager.num_slices
+    np.testing.assert_array_equal(lazy.as_array(), eager.as_array())
+    return eager, lazy
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(bits=8),
+        dict(bits=16),
+        dict(bits=16, transfer_syntax=ImplicitVRLittleEndian),
+        dict(photometric="RGB"),
+    ],
+)
+def test_native_frames_are_mapped(tmp_path, kwargs):
+    path = build_dicom(tmp_path / "native.dcm", **kwargs)
+    eager, lazy = _assert_lazy_matches_eager(path)
+    assert isinstance(lazy.volume, np.ndarray)
+    assert not lazy.volume.flags.owndata
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(photometric="YBR_FULL_422"),
+        dict(bits=1, rows=24, columns=16),
+    ],
+)
+def test_native_frames_needing_decoding(tmp_path, kwargs):
+    path = build_dicom(tmp_path / "decoded.dcm", **kwargs)
+    eager, lazy = _assert_lazy_matches_eager(path)
+    assert isinstance(lazy.volume, LazyVolume)
+
+
+def test_unaligned_1_bit_frames_are_read_eagerly(tmp_path):
+    path = build_dicom(tmp_path / "packed.dcm", bits=1, rows=5, columns=5)
+    with pytest.warns(UserWarning, match="reading them eagerly"):
+        _assert_lazy_matches_eager(path)
+
+
+@pytest.mark.parametrize("encapsulation", ["bot", "nobot", "frag", "fragbot", "eot"])
+def test_encapsulated_frames(tmp_path, encapsulation):
+    path = build_dicom(tmp_path / "jpeg.dcm", encapsulation=encapsulation)
+    eager, lazy = _assert_lazy_matches_eager(path)
+    assert isinstance(lazy.volume, LazyVolume)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [dict(bits=8), dict(photometric="YBR_FULL_422"), dict(encapsulation="bot")],
+)
+def test_single_frame_is_2d(tmp_path, kwargs):
+    path = build_dicom(tmp_path / "single.dcm", frames=1, **kwargs)
+    eager, lazy = _assert_lazy_matches_eager(path)
+    assert eager.volume.shape[:2] == (24, 20)
+    assert lazy.volume.shape == eager.volume.shape
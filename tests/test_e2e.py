@@ -0,0 +1,417 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from oct_converter.image_types import LazyVolume
+from oct_converter.readers import E2E
+from oct_converter.readers.binary_structs import e2e_binary
+from oct_converter.readers.e2e import intensity_lut
+
+
+def _volumes(path, **kwargs):
+    return {v.volume_id: v for v in E2E(path).read_oct_volume(**kwargs)}
+
+
+def test_eager_volume_is_one_compact_array(e2e_file):
+    eager = _volumes(e2e_file)
+    lazy = _volumes(e2e_file, lazy=True)
+    assert eager.keys() == lazy.keys()
+    for key, volume in eager.items():
+        assert isinstance(volume.volume, np.ndarray)
+        assert volume.volume.flags.owndata and volume.volume.flags.c_contiguous
+        assert volume.num_slices == volume.slice_mask.sum()
+        np.testing.assert_array_equal(volume.volume, lazy[key].as_array())
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16, np.float32])
+def test_compact_dtype(e2e_file, dtype):
+    reference = _volumes(e2e_file)
+    for key, volume in _volumes(e2e_file, dtype=dtype).items():
+        assert volume.volume.dtype == dtype
+        assert volume.volume.shape == reference[key].volume.shape
+
+
+def _no_parsing(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("parsed despite a valid cache")
+
+    monkeypatch.setattr(E2E, "_read_directory_entries", fail)
+    monkeypatch.setattr(E2E, "_parse_all_metadata", fail)
+
+
+def test_index_cache_round_trip(e2e_file, monkeypatch):
+    reference = E2E(e2e_file).read_oct_volume()
+    E2E(e2e_file, index_cache=True).read_oct_volume()
+    assert e2e_file.with_name(e2e_file.name + ".index.npz").exists()
+
+    _no_parsing(monkeypatch)
+    cached = E2E(e2e_file, index_cache=True)
+    assert cached._read_patient()["patient_id"] == "P123"
+    assert cached._read_lateralities() == {"7_3_1": "R", "7_3_2": "L"}
+    volumes = cached.read_oct_volume()
+    assert [v.volume_id for v in volumes] == [v.volume_id for v in reference]
+    for volume, expected in zip(volumes, reference):
+        np.testing.assert_array_equal(volume.volume, expected.volume)
+        assert volume.patient_id == expected.patient_id
+        assert volume.DOB == expected.DOB
+        assert volume.laterality == expected.laterality
+        assert volume.metadata == expected.metadata
+
+
+def test_index_cache_header_is_json(e2e_file, monkeypatch):
+    reference = E2E(e2e_file).read_all_metadata()
+    E2E(e2e_file, index_cache=True).chunk_index
+    cache_path = e2e_file.with_name(e2e_file.name + ".index.npz")
+    with np.load(cache_path, allow_pickle=False) as cache:
+        assert all(cache[name].dtype != object for name in cache.files)
+        assert cache["header"].dtype.kind == "U"
+
+    _no_parsing(monkeypatch)
+    metadata = E2E(e2e_file, index_cache=True).read_all_metadata()
+    assert metadata == reference
+    assert isinstance(metadata["bscan_data"][0]["parsed_time"], datetime)
+
+
+def test_index_cache_without_json_header(e2e_file, monkeypatch):
+    e2e = E2E(e2e_file, index_cache=True)
+    e2e.chunk_index
+    e2e._metadata["raw"] = b"bytes"
+    e2e._save_index_cache()
+    cache_path = e2e_file.with_name(e2e_file.name + ".index.npz")
+    with np.load(cache_path, allow_pickle=False) as cache:
+        assert "header" not in cache.files
+
+    cached = E2E(e2e_file, index_cache=True)
+    assert cached._load_index_cache()
+    assert cached._metadata is None
+    assert cached._read_lateralities() == {"7_3_1": "R", "7_3_2": "L"}
+    assert "raw" not in cached.read_all_metadata()
+
+
+def test_index_cache_in_directory(e2e_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+    E2E(e2e_file, index_cache=cache_dir).chunk_index
+    assert len(list(cache_dir.glob("*.npz"))) == 1
+    assert E2E(e2e_file, index_cache=cache_dir)._load_index_cache()
+
+
+def test_index_cache_invalidated_by_changed_file(e2e_file):
+    E2E(e2e_file, index_cache=True).chunk_index
+    with open(e2e_file, "ab") as f:
+        f.write(b"\0" * 16)
+    e2e = E2E(e2e_file, index_cache=True)
+    assert e2e._chunk_index is None
+    assert len(e2e.chunk_index) == len(E2E(e2e_file).chunk_index)
+    # the rebuilt index was written back
+    assert E2E(e2e_file, index_cache=True)._chunk_index is not None
+
+
+def test_index_cache_rebuilt_from_unreadable_file(e2e_file):
+    cache_path = e2e_file.with_name(e2e_file.name + ".index.npz")
+    cache_path.write_bytes(b"not a cache")
+    assert E2E(e2e_file, index_cache=True)._chunk_index is None
+
+
+def test_intensity_lut_matches_scalar_transform(e2e_file):
+    e2e = E2E(e2e_file)
+    codes = np.arange(0, 2**16, 7)
+    ufloat = np.array([e2e.uint16_to_ufloat16(int(code)) for code in codes])
+
+    np.testing.assert_array_equal(
+        intensity_lut(False, np.float64)[codes],
+        e2e.vol_intensity_transform(ufloat.copy()),
+    )
+    np.testing.assert_array_equal(
+        intensity_lut(True, np.float64)[codes], np.power(ufloat, 1.0 / 2.4)
+    )
+
+
+def test_intensity_lut_cached_per_normalized_dtype():
+    lut = intensity_lut(False, np.uint8)
+    assert intensity_lut(False, "uint8") is lut
+    assert intensity_lut(0, np.dtype("uint8")) is lut
+    assert intensity_lut(False, np.uint16) is not lut
+    assert lut.dtype == np.uint8 and lut.max() == 255
+    assert not lut.flags.writeable
+
+
+def _construct_walk(path):
+    """Chunk headers and highest slice ids, parsed entry by entry with construct."""
+    e2e = E2E(path)
+    chunks, max_slice_ids = [], {}
+    with open(path, "rb") as f:
+        starts = []
+        for position in e2e.directory_stack:
+            f.seek(position + e2e.byte_skip)
+            directory = e2e_binary.main_directory_structure.parse(f.read(52))
+            for _ in range(directory.num_entries):
+                entry = e2e_binary.sub_directory_structure.parse(f.read(44))
+                key = "{}_{}_{}".format(
+                    entry.patient_db_id, entry.study_id, entry.series_id
+                )
+                max_slice_ids[key] = max(
+                    max_slice_ids.get(key, -np.inf), entry.slice_id / 2
+                )
+                if entry.start > entry.pos:
+                    starts.append(entry.start)
+        for start in starts:
+            f.seek(start + e2e.byte_skip)
+            try:
+                chunk = e2e_binary.chunk_structure.parse(f.read(60))
+            except Exception:
+                continue
+            chunks.append(
+                (
+                    start + e2e.byte_skip,
+                    chunk.size,
+                    chunk.patient_db_id,
+                    chunk.study_id,
+                    chunk.series_id,
+                    chunk.slice_id,
+                    chunk.ind,
+                    chunk.type,
+                )
+            )
+    return chunks, max_slice_ids
+
+
+def test_chunk_index_built_once_and_shared(e2e_multi_file, monkeypatch):
+    calls = []
+    read_directory_entries = E2E._read_directory_entries
+
+    def counting(self, f):
+        calls.append(1)
+        return read_directory_entries(self, f)
+
+    monkeypatch.setattr(E2E, "_read_directory_entries", counting)
+    e2e = E2E(e2e_multi_file)
+    e2e.read_oct_volume()
+    e2e.read_fundus_image()
+    e2e.read_all_metadata()
+    e2e.read_contours()
+    list(e2e.iter_bscans())
+    assert len(calls) == 1
+
+    chunks, max_slice_ids = _construct_walk(e2e_multi_file)
+    assert [tuple(chunk) for chunk in e2e.chunk_index] == chunks
+    assert e2e.max_slice_ids == max_slice_ids
+
+
+def _reference_bscans(path):
+    """B-scans of each volume decoded pixel by pixel with the scalar transform."""
+    e2e = E2E(path)
+    chunks, _ = _construct_walk(path)
+    volumes = {}
+    with open(path, "rb") as f:
+        for offset, _, patient, study, series, slice_id, ind, chunk_type in chunks:
+            if chunk_type != 1073741824 or ind != 1:
+                continue
+            f.seek(offset + 60)
+            image = e2e_binary.image_structure.parse(f.read(20))
+            raw = np.fromfile(f, dtype=np.uint16, count=image.height * image.width)
+            ufloat = np.array([e2e.uint16_to_ufloat16(int(code)) for code in raw])
+            bscan = e2e.vol_intensity_transform(ufloat).reshape(
+                image.height, image.width
+            )
+            key = f"{patient}_{study}_{series}"
+            volumes.setdefault(key, {})[slice_id // 2] = bscan
+    return {key: [bscans[i] for i in sorted(bscans)] for key, bscans in volumes.items()}
+
+
+def test_lazy_matches_eager_and_reference(e2e_file):
+    reference = _reference_bscans(e2e_file)
+    eager = _volumes(e2e_file)
+    lazy = _volumes(e2e_file, lazy=True)
+    assert eager.keys() == lazy.keys() == reference.keys()
+    for key, bscans in reference.items():
+        np.testing.assert_array_equal(eager[key].volume, np.stack(bscans))
+        assert len(lazy[key].volume) == len(bscans)
+        for bscan, expected in zip(lazy[key].volume, bscans):
+            np.testing.assert_array_equal(bscan, expected)
+
+
+def test_lazy_decodes_on_access(e2e_file):
+    volume = _volumes(e2e_file, lazy=True)["7_3_1"].volume
+    assert isinstance(volume, LazyVolume)
+    assert all(bscan is None for bscan in volume._slices)
+    first = volume[0]
+    assert volume[0] is first
+    assert all(bscan is None for bscan in volume._slices[1:])
+
+    uncached = _volumes(e2e_file, lazy=True, cache_slices=False)["7_3_1"].volume
+    np.testing.assert_array_equal(uncached[0], first)
+    assert uncached[0] is not uncached[0]
+    assert all(bscan is None for bscan in uncached._slices)
+
+
+def test_structured_dtypes_match_construct():
+    assert e2e_binary.sub_directory_dtype.itemsize == 44
+    assert e2e_binary.sub_directory_structure.sizeof() == 44
+    assert e2e_binary.chunk_dtype.itemsize == 60
+
+
+def test_directory_entries_match_construct(e2e_multi_file):
+    e2e = E2E(e2e_multi_file)
+    with open(e2e_multi_file, "rb") as f:
+        entries = e2e._read_directory_entries(f)
+        expected = []
+        for position in e2e.directory_stack:
+            f.seek(position + e2e.byte_skip)
+            directory = e2e_binary.main_directory_structure.parse(f.read(52))
+            expected += [
+                e2e_binary.sub_directory_structure.parse(f.read(44))
+                for _ in range(directory.num_entries)
+            ]
+    assert len(entries) == len(expected)
+    for name in entries.dtype.names:
+        if name in expected[0]:
+            assert entries[name].tolist() == [entry[name] for entry in expected], name
+
+
+def test_undecodable_chunk_headers_are_skipped(e2e_file):
+    chunk = E2E(e2e_file).chunk_index[3]
+    with open(e2e_file, "r+b") as f:
+        f.seek(chunk.offset)
+        f.write(b"\xff" * 7)
+
+    chunk_index = E2E(e2e_file).chunk_index
+    assert chunk.offset not in [c.offset for c in chunk_index]
+    assert [tuple(c) for c in chunk_index] == _construct_walk(e2e_file)[0]
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.uint8])
+def test_threaded_decoding_matches_serial(e2e_multi_file, dtype):
+    serial = _volumes(e2e_multi_file, dtype=dtype)
+    threaded = _volumes(e2e_multi_file, dtype=dtype, workers=4)
+    assert serial.keys() == threaded.keys()
+    for key, volume in serial.items():
+        np.testing.assert_array_equal(threaded[key].volume, volume.volume)
+        np.testing.assert_array_equal(threaded[key].slice_mask, volume.slice_mask)
+
+
+def test_select_volumes_by_series_and_laterality(e2e_multi_file):
+    every = _volumes(e2e_multi_file)
+    assert _volumes(e2e_multi_file, series="7_3_2").keys() == {"7_3_2"}
+    right = _volumes(e2e_multi_file, laterality="R")
+    assert right.keys() == {"7_3_1", "7_3_3"}
+    for key, volume in right.items():
+        np.testing.assert_array_equal(volume.volume, every[key].volume)
+        assert volume.contours.keys() == every[key].contours.keys()
+    assert _volumes(e2e_multi_file, series=["7_3_2"], laterality="R") == {}
+
+
+def _series_of(bscan_metadata):
+    # the builder stores the series in the last digits of the acquisition time
+    return bscan_metadata["acquisitionTime"] % 10_000_000
+
+
+def test_selected_metadata_skips_unselected_chunks(e2e_multi_file, monkeypatch):
+    every = E2E(e2e_multi_file).read_all_metadata()
+    parsed = []
+    parse = e2e_binary.bscan_metadata.parse
+
+    def record(raw):
+        parsed.append(raw)
+        return parse(raw)
+
+    monkeypatch.setattr(e2e_binary.bscan_metadata, "parse", record)
+    e2e = E2E(e2e_multi_file)
+    e2e.chunk_index
+    metadata = e2e.read_all_metadata(series=["7_3_2"])
+    assert len(parsed) == 4
+    (volume,) = e2e.read_oct_volume(series="7_3_2")
+    assert volume.metadata == metadata
+    assert [_series_of(bscan) for bscan in metadata["bscan_data"]] == [2] * 4
+    assert metadata["bscan_data"] == [
+        bscan for bscan in every["bscan_data"] if _series_of(bscan) == 2
+    ]
+    assert metadata["scan_pattern"].keys() == {"7_3_2"}
+    # file-level records are kept
+    assert metadata["patient_data"] == every["patient_data"]
+    assert metadata["device_data"] == every["device_data"]
+
+    (fundus,) = e2e.read_fundus_image(laterality="L")
+    assert fundus.metadata == metadata
+
+
+def test_select_slices(e2e_multi_file):
+    every = _volumes(e2e_multi_file)
+    selected = _volumes(e2e_multi_file, slices=slice(1, 3))
+    for key, volume in selected.items():
+        positions = np.flatnonzero(every[key].slice_mask)
+        kept = np.isin(positions, np.arange(len(every[key].slice_mask))[1:3])
+        np.testing.assert_array_equal(volume.volume, every[key].volume[kept])
+        for name, contour in volume.contours.items():
+            np.testing.assert_array_equal(contour, every[key].contours[name][1:3])
+
+
+def test_select_fundus_images(e2e_multi_file):
+    e2e = E2E(e2e_multi_file)
+    every = {image.image_id: image for image in e2e.read_fundus_image()}
+    left = e2e.read_fundus_image(laterality="L")
+    assert [image.image_id for image in left] == ["7_3_2"]
+    np.testing.assert_array_equal(left[0].image, every["7_3_2"].image)
+    localizers = e2e.read_fundus_image(modality="localizer")
+    assert {image.image_id for image in localizers} == set(every)
+    assert e2e.read_fundus_image(modality="fundus") == []
+    with pytest.raises(ValueError):
+        e2e.read_fundus_image(modality="oct")
+
+
+def test_iter_bscans_matches_volumes(e2e_multi_file):
+    volumes = _volumes(e2e_multi_file, dtype=np.float32)
+    seen = {}
+    for key, index, bscan, metadata in E2E(e2e_multi_file).iter_bscans(
+        dtype=np.float32
+    ):
+        volume = volumes[key]
+        row = np.flatnonzero(volume.slice_mask).tolist().index(index)
+        np.testing.assert_array_equal(bscan, volume.volume[row])
+        if key != "7_3_9":
+            assert metadata["scaley"] == pytest.approx(0.0039)
+            for name, contour in metadata["contours"].items():
+                np.testing.assert_array_equal(contour, volume.contours[name][index])
+        seen.setdefault(key, []).append(index)
+    assert {key: len(indices) for key, indices in seen.items()} == {
+        key: volume.num_slices for key, volume in volumes.items()
+    }
+
+
+def test_iter_bscans_filters(e2e_multi_file):
+    e2e = E2E(e2e_multi_file)
+    assert {key for key, *_ in e2e.iter_bscans(series="7_3_2")} == {"7_3_2"}
+    assert {key for key, *_ in e2e.iter_bscans(laterality="R")} == {"7_3_1", "7_3_3"}
+
+
+def test_contour_arrays_match_row_by_row_parse(e2e_multi_file):
+    e2e = E2E(e2e_multi_file)
+    expected = {}
+    with open(e2e_multi_file, "rb") as f:
+        for chunk in e2e.chunk_index:
+            if chunk.type == 10019:
+                f.seek(chunk.data_offset)
+                name, row = e2e._read_contour(f, chunk)
+                expected[chunk.volume_string, name, chunk.slice_id // 2] = row
+
+    for batch_size in (1, 256):
+        contours = e2e.read_contours(batch_size=batch_size)
+        found = 0
+        for key, (names, array) in contours.items():
+            assert array.shape[:2] == (len(names), e2e.max_slice_ids[key] + 1)
+            for layer, name in enumerate(names):
+                for slice_id, row in enumerate(array[layer]):
+                    if (key, name, slice_id) in expected:
+                        found += 1
+                        np.testing.assert_array_equal(
+                            row, expected[key, name, slice_id]
+                        )
+                    else:
+                        assert np.isnan(row).all()
+        assert found == len(expected)
+        assert np.isnan(contours["7_3_1"][1][:, :, 0]).all()
+
+    volume = _volumes(e2e_multi_file)["7_3_1"]
+    names, array = contours["7_3_1"]
+    for layer, name in enumerate(names):
+        np.testing.assert_array_equal(volume.contours[name], array[layer])
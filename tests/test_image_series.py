@@ -0,0 +1,115 @@
+import cv2
+import numpy as np
+import pydicom
+import pytest
+from conftest import build_dicom
+
+from oct_converter.readers import ImageSeries
+
+
+def _dicom_series(directory, instance_numbers, positions=None, **attributes):
+    """One single-frame DICOM file per slice, named in filename order."""
+    directory.mkdir(exist_ok=True)
+    paths = []
+    for index, number in enumerate(instance_numbers):
+        if number is not None:
+            attributes["InstanceNumber"] = number
+        if positions is not None:
+            attributes["ImagePositionPatient"] = [0, 0, positions[index]]
+            attributes["ImageOrientationPatient"] = [1, 0, 0, 0, 1, 0]
+        paths.append(
+            build_dicom(
+                directory / f"slice_{index}.dcm", frames=1, seed=index, **attributes
+            )
+        )
+    return paths
+
+
+def _pixels(paths):
+    return np.stack([pydicom.dcmread(path).pixel_array for path in paths])
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_dicom_slices_are_ordered_by_instance_number(tmp_path, workers):
+    paths = _dicom_series(
+        tmp_path / "series",
+        [4, 2, 3, 1],
+        SeriesInstanceUID="1.2.3",
+        ImageLaterality="R",
+        SpacingBetweenSlices=0.5,
+    )
+    (tmp_path / "series" / "notes.txt").write_text("not a slice")
+    volume = ImageSeries(tmp_path / "series").read_oct_volume(workers=workers)
+    expected = _pixels([paths[3], paths[1], paths[2], paths[0]])
+    np.testing.assert_array_equal(volume.as_array(), expected)
+    assert volume.as_array().dtype == expected.dtype
+    assert volume.laterality == "R"
+    assert volume.pixel_spacing == pytest.approx([0.1, 0.2, 0.5])
+    assert volume.metadata["num_slices"] == 4
+
+
+def test_zero_based_instance_numbers(tmp_path):
+    # ordered against both the filenames and the positions
+    paths = _dicom_series(
+        tmp_path / "series", [3, 2, 1, 0], positions=[0.0, 1.0, 2.0, 3.0]
+    )
+    volume = ImageSeries(tmp_path / "series").read_oct_volume()
+    np.testing.assert_array_equal(volume.as_array(), _pixels(paths[::-1]))
+
+
+def test_dicom_slices_are_ordered_by_position(tmp_path):
+    paths = _dicom_series(tmp_path / "series", [None] * 3, positions=[2.0, 0.0, 1.0])
+    volume = ImageSeries(tmp_path / "series").read_oct_volume()
+    expected = _pixels([paths[1], paths[2], paths[0]])
+    np.testing.assert_array_equal(volume.as_array(), expected)
+
+
+def test_largest_dicom_series_is_read(tmp_path):
+    directory = tmp_path / "series"
+    paths = _dicom_series(directory, [1, 2, 3], SeriesInstanceUID="1.2.3")
+    build_dicom(directory / "other.dcm", frames=1, SeriesInstanceUID="4.5.6")
+    with pytest.warns(UserWarning, match="2 series"):
+        volume = ImageSeries(directory).read_oct_volume()
+    np.testing.assert_array_equal(volume.as_array(), _pixels(paths))
+
+
+def _write_bmp(path, image):
+    assert cv2.imwrite(str(path), image)
+
+
+def test_bmp_slices_are_in_natural_order(tmp_path):
+    rng = np.random.default_rng(0)
+    slices = {n: rng.integers(0, 255, (12, 10), np.uint8) for n in (1, 2, 10)}
+    for number, image in slices.items():
+        # grayscale b-scans saved as 24-bit BMP
+        _write_bmp(tmp_path / f"bscan_{number}.bmp", cv2.merge([image] * 3))
+    volume = ImageSeries(tmp_path).read_oct_volume()
+    array = volume.as_array()
+    assert array.shape == (3, 12, 10)
+    np.testing.assert_array_equal(array, np.stack([slices[n] for n in (1, 2, 10)]))
+    assert volume.metadata["num_slices"] == 3
+
+
+def test_colour_bmp_slices_are_rgb(tmp_path):
+    rng = np.random.default_rng(0)
+    slices = [rng.integers(0, 255, (12, 10, 3), np.uint8) for _ in range(2)]
+    for number, image in enumerate(slices):
+        _write_bmp(tmp_path / f"bscan_{number}.bmp", image)
+    volume = ImageSeries(tmp_path).read_oct_volume()
+    np.testing.assert_array_equal(
+        volume.as_array(), np.stack([image[..., ::-1] for image in slices])
+    )
+
+
+def test_mismatched_slices_raise(tmp_path):
+    _write_bmp(tmp_path / "bscan_0.bmp", np.zeros((12, 10), np.uint8))
+    _write_bmp(tmp_path / "bscan_1.bmp", np.zeros((12, 11), np.uint8))
+    with pytest.raises(ValueError, match="bscan_1.bmp"):
+        ImageSeries(tmp_path).read_oct_volume()
+
+
+def test_empty_directory_raises(tmp_path):
+    with pytest.raises(ValueError, match="No DICOM or BMP slices"):
+        ImageSeries(tmp_path).read_oct_volume()
+    with pytest.raises(NotADirectoryError):
+        ImageSeries(build_dicom(tmp_path / "file.dcm", frames=1))
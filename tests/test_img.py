@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from oct_converter.readers import IMG
+
+
+def _eager(data, rows, cols, interlaced):
+    # the full read of earlier versions, which promoted interlaced data to float64
+    volume = np.frombuffer(data, dtype=np.uint8)
+    num_slices = len(volume) // (rows * cols)
+    volume = volume[: rows * cols * num_slices]
+    volume = volume.reshape((rows, cols, num_slices), order="F")
+    if interlaced:
+        mid_height = rows // 2
+        deinterlaced = np.zeros((mid_height, cols, num_slices * 2))
+        deinterlaced[..., 0::2] = volume[:mid_height, ...]
+        deinterlaced[..., 1::2] = volume[mid_height : 2 * mid_height, ...]
+        volume = np.rot90(deinterlaced, axes=(0, 1))
+    return [volume[:, :, i] for i in range(volume.shape[2])]
+
+
+@pytest.mark.parametrize("interlaced", [False, True])
+@pytest.mark.parametrize("rows, cols", [(16, 8), (15, 6)])
+def test_mapped_volume_matches_eager_read(tmp_path, interlaced, rows, cols):
+    data = np.random.default_rng(0).integers(0, 255, rows * cols * 5 + 7, np.uint8)
+    path = tmp_path / "P1234_Macular Cube 512x128_1-2-2020_3-4-5_OD_sz1_cube_raw.img"
+    path.write_bytes(data.tobytes())
+
+    volume = IMG(path).read_oct_volume(rows=rows, cols=cols, interlaced=interlaced)
+    expected = _eager(data.tobytes(), rows, cols, interlaced)
+    assert volume.num_slices == len(expected)
+    for bscan, reference in zip(volume.volume, expected):
+        # read-only views over the mapped file
+        assert bscan.dtype == np.uint8
+        assert not bscan.flags.owndata and not bscan.flags.writeable
+        np.testing.assert_array_equal(bscan, reference)
+    assert volume.patient_id == "P1234"
+    assert volume.laterality == "R"
+
+
+def test_file_smaller_than_a_bscan(tmp_path):
+    path = tmp_path / "small.img"
+    path.write_bytes(bytes(10))
+    with pytest.raises(ValueError):
+        IMG(path).read_oct_volume(rows=4, cols=4)
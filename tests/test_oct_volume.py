@@ -0,0 +1,80 @@
+import numpy as np
+
+from oct_converter.image_types import OCTVolumeWithMetaData
+
+
+def _bscans(count=4, shape=(6, 5), seed=0):
+    rng = np.random.default_rng(seed)
+    return [rng.integers(0, 255, shape, np.uint8) for _ in range(count)]
+
+
+def test_list_of_bscans_is_stacked():
+    bscans = _bscans()
+    oct_volume = OCTVolumeWithMetaData(bscans)
+    assert isinstance(oct_volume.volume, np.ndarray)
+    assert oct_volume.num_slices == 4
+    np.testing.assert_array_equal(oct_volume.as_array(), np.stack(bscans))
+    # indexes and iterates b-scan by b-scan, as the list did
+    np.testing.assert_array_equal(oct_volume.volume[2], bscans[2])
+    for bscan, expected in zip(oct_volume.volume, bscans):
+        np.testing.assert_array_equal(bscan, expected)
+
+
+def test_views_into_one_array_are_not_copied():
+    array = np.stack(_bscans())
+    oct_volume = OCTVolumeWithMetaData(list(array))
+    assert oct_volume.volume is array
+    assert OCTVolumeWithMetaData(array).as_array() is array
+
+
+def test_views_that_do_not_cover_their_base_are_copied():
+    array = np.stack(_bscans())
+    oct_volume = OCTVolumeWithMetaData(list(array[::-1]))
+    assert oct_volume.volume is not array
+    np.testing.assert_array_equal(oct_volume.as_array(), array[::-1])
+
+
+def test_mixed_shapes_are_kept_as_a_list():
+    bscans = _bscans(2) + _bscans(1, shape=(6, 7))
+    oct_volume = OCTVolumeWithMetaData(bscans)
+    assert isinstance(oct_volume.volume, list)
+    assert oct_volume.num_slices == 3
+    mixed_dtypes = _bscans(2) + [np.zeros((6, 5), np.uint16)]
+    assert isinstance(OCTVolumeWithMetaData(mixed_dtypes).volume, list)
+
+
+def test_memory_mapped_bscans_are_kept_as_a_list(tmp_path):
+    path = tmp_path / "volume.raw"
+    np.stack(_bscans()).tofile(path)
+    mapped = np.memmap(path, dtype=np.uint8, mode="r", shape=(4, 6, 5))
+    bscans = [
+        np.memmap(path, np.uint8, "r", offset=i * 30, shape=(6, 5)) for i in range(4)
+    ]
+    oct_volume = OCTVolumeWithMetaData(bscans)
+    assert oct_volume.volume is bscans
+    np.testing.assert_array_equal(oct_volume.as_array(), mapped)
+
+
+def test_lazy_sequences_are_kept():
+    class Lazy:
+        def __init__(self, bscans):
+            self.bscans = bscans
+
+        def __len__(self):
+            return len(self.bscans)
+
+        def __getitem__(self, index):
+            return self.bscans[index]
+
+    lazy = Lazy(_bscans())
+    oct_volume = OCTVolumeWithMetaData(lazy)
+    assert oct_volume.volume is lazy
+    assert oct_volume.num_slices == 4
+
+
+def test_setting_the_volume_updates_num_slices():
+    oct_volume = OCTVolumeWithMetaData([])
+    assert oct_volume.num_slices == 0
+    oct_volume.volume = _bscans(3)
+    assert isinstance(oct_volume.volume, np.ndarray)
+    assert oct_volume.num_slices == 3
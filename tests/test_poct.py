@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from conftest import build_poct
+
+from oct_converter.readers import POCT
+
+
+def _reference(pixels, height, length):
+    """B-scans of one block, rotated one at a time as the eager reader did."""
+    size = height * length
+    return np.stack(
+        [
+            np.rot90(pixels[i : i + size].reshape(length, height))
+            for i in range(0, pixels.size - size + 1, size)
+        ]
+    )
+
+
+def test_scan_blocks_are_mapped(tmp_path):
+    path, pixels = build_poct(tmp_path / "scan_2021-01-02_03.04.05.oct")
+    volumes = POCT(path).read_oct_volume()
+    assert len(volumes) == 2
+    for volume, block, (height, length, _) in zip(
+        volumes, pixels, ((8, 6, 5), (8, 10, 2))
+    ):
+        array = volume.as_array()
+        assert not array.flags.owndata
+        assert not array.flags.writeable
+        np.testing.assert_array_equal(array, _reference(block, height, length))
+    assert volumes[1].as_array().shape == (2, 8, 10)
+    assert volumes[0].laterality == "R"
+    assert volumes[0].acquisition_date.year == 2021
+    assert volumes[0].pixel_spacing == pytest.approx([6 / 640, 4 / 480])
+
+
+def test_selected_scan_blocks(tmp_path):
+    path, pixels = build_poct(tmp_path / "scan.oct")
+    (volume,) = POCT(path).read_oct_volume(scans=[1])
+    np.testing.assert_array_equal(volume.as_array(), _reference(pixels[1], 8, 10))
+
+
+def test_truncated_file_keeps_complete_bscans(tmp_path):
+    path, pixels = build_poct(tmp_path / "scan.oct", truncate=100)
+    with pytest.warns(UserWarning, match="1 of 2 B-scans"):
+        volumes = POCT(path).read_oct_volume()
+    np.testing.assert_array_equal(volumes[0].as_array(), _reference(pixels[0], 8, 6))
+    np.testing.assert_array_equal(
+        volumes[1].as_array(), _reference(pixels[1][: 8 * 10], 8, 10)
+    )
@@ -0,0 +1,86 @@
+import warnings
+
+import cv2
+import numpy as np
+import pytest
+
+from oct_converter.image_types import OCTVolumeWithMetaData
+from oct_converter.image_types.write_image import cv2_imwrite_safe
+
+
+def _volume(dtype=np.uint16, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 1000, (5, 12, 10)).astype(dtype)
+
+
+def _float_volume(seed=1):
+    # with seed 1, scaling in float32 rounds one pixel differently
+    rng = np.random.default_rng(seed)
+    return (rng.random((5, 64, 64)) * 1000).astype(np.float32)
+
+
+def _baseline(volume, directory, extension):
+    """Slices written as save did before, scaling a float64 copy of the volume."""
+    scaled = np.asarray(volume).astype("float64")
+    scaled *= 255.0 / scaled.max()
+    for index, bscan in enumerate(scaled):
+        cv2_imwrite_safe(str(directory / f"scan_{index}{extension}"), bscan)
+
+
+@pytest.mark.parametrize("extension", [".png", ".bmp", ".jpg"])
+@pytest.mark.parametrize("workers", [1, 4])
+@pytest.mark.parametrize("make_volume", [_volume, _float_volume])
+def test_slices_match_the_baseline(tmp_path, extension, workers, make_volume):
+    array = make_volume()
+    oct_volume = OCTVolumeWithMetaData(array.copy())
+    oct_volume.save(tmp_path / "new" / f"scan{extension}", workers=workers)
+    (tmp_path / "old").mkdir()
+    _baseline(array, tmp_path / "old", extension)
+    for index in range(5):
+        name = f"scan_{index}{extension}"
+        assert (tmp_path / "new" / name).read_bytes() == (
+            tmp_path / "old" / name
+        ).read_bytes()
+
+
+def test_save_does_not_modify_the_volume(tmp_path):
+    array = _volume()
+    oct_volume = OCTVolumeWithMetaData(array)
+    oct_volume.save(tmp_path / "scan.png")
+    assert oct_volume.volume is array
+    assert array.dtype == np.uint16
+    np.testing.assert_array_equal(array, _volume())
+
+
+def test_list_volumes_are_saved(tmp_path):
+    bscans = list(_volume()[:2]) + [np.full((12, 14), 500, np.uint16)]
+    oct_volume = OCTVolumeWithMetaData(bscans)
+    assert isinstance(oct_volume.volume, list)
+    oct_volume.save(tmp_path / "scan.png")
+    last = cv2.imread(str(tmp_path / "scan_2.png"), cv2.IMREAD_UNCHANGED)
+    volume_max = max(bscan.max() for bscan in bscans)
+    assert last.shape == (12, 14)
+    assert (last == round(500 * 255.0 / volume_max)).all()
+
+
+def test_empty_volume_is_saved_black(tmp_path):
+    oct_volume = OCTVolumeWithMetaData(np.zeros((2, 12, 10), np.uint8))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        oct_volume.save(tmp_path / "scan.png")
+    assert not cv2.imread(str(tmp_path / "scan_1.png")).any()
+
+
+def test_imwrite_safe_paths(tmp_path, monkeypatch):
+    image = _volume(np.uint8)[0]
+    monkeypatch.chdir(tmp_path)
+    cv2_imwrite_safe("bare.png", image)
+    np.testing.assert_array_equal(cv2.imread("bare.png", cv2.IMREAD_UNCHANGED), image)
+
+    path = tmp_path / "näive" / "scan.png"
+    cv2_imwrite_safe(str(path), image)
+    decoded = cv2.imdecode(np.fromfile(path, np.uint8), cv2.IMREAD_UNCHANGED)
+    np.testing.assert_array_equal(decoded, image)
+
+    with pytest.raises(FileNotFoundError):
+        cv2_imwrite_safe(str(tmp_path / "missing" / "scan.png"), image, makedirs=False)
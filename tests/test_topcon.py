@@ -0,0 +1,212 @@
+import io
+import struct
+
+import numpy as np
+import pytest
+from conftest import build_fda, build_fds
+from PIL import Image
+
+from oct_converter.readers import FDA, FDS
+from oct_converter.readers.binary_structs import fda_binary, fds_binary
+from oct_converter.readers.topcon_chunks import TopconChunks
+
+
+def _expected_slices(scan):
+    # (width, height, slices) to (slices, height, width)
+    return np.transpose(scan, (2, 1, 0))
+
+
+def test_repeated_chunk_resolves_to_last_occurrence(tmp_path):
+    path, scans = build_fds(tmp_path / "two_scans.fds", scans=2)
+    fds = FDS(path)
+    chunks = fds.chunks
+    assert len(chunks.find(b"@IMG_SCAN_03")) == 2
+
+    last = chunks.find(b"@IMG_SCAN_03")[-1]
+    assert fds.chunk_dict[b"@IMG_SCAN_03"] == [last.offset, last.size]
+    assert bytes(chunks.data(b"@IMG_SCAN_03")) == bytes(chunks.data(last))
+    assert bytes(chunks.data(b"@IMG_SCAN_03", index=0)) != bytes(chunks.data(last))
+    assert chunks.parse(fds_binary.oct_header, b"@IMG_SCAN_03") == chunks.parse(
+        fds_binary.oct_header, last
+    )
+
+    volume = fds.read_oct_volume()
+    np.testing.assert_array_equal(volume.as_array(), _expected_slices(scans[-1]))
+
+
+def test_scan_volume_is_a_view_over_the_file(fds_file):
+    volume = FDS(fds_file).read_oct_volume()
+    array = volume.as_array()
+    assert isinstance(volume.volume, np.ndarray)
+    assert not array.flags.writeable
+    assert not array.flags.owndata
+
+
+def test_chunk_table_matches_file(fds_file):
+    chunks = TopconChunks(fds_file, fds_binary.header)
+    assert chunks.header["file_code"] == "FOCT"
+    assert b"@IMG_SCAN_03" in chunks and b"@IMG_OBS" in chunks
+    assert chunks.names()[0] == b"@PATIENT_INFO_02"
+    assert chunks.data(b"@MISSING") is None
+    assert bytes(chunks.data(b"@UNKNOWN_THING")) == b"xyz"
+    chunks.close()
+
+
+def _pil_slices(fda):
+    # the PIL decoding earlier versions used
+    data = fda.chunks.data(b"@IMG_JPEG")
+    header = fda_binary.oct_header.parse(data[:25])
+    return np.stack(
+        [
+            np.asarray(Image.open(io.BytesIO(bytes(data[offset : offset + size]))))
+            for offset, size in FDA._jpeg_slice_table(data, header.number_slices)
+        ]
+    )
+
+
+@pytest.mark.parametrize("color", [False, True])
+def test_jpeg_slices_match_pil(tmp_path, color):
+    fda = FDA(build_fda(tmp_path / "jpeg.fda", color=color))
+    expected = _pil_slices(fda)
+    for workers in (1, 4):
+        volume = fda.read_oct_volume(workers=workers).as_array()
+        assert volume.shape == expected.shape
+        np.testing.assert_array_equal(volume, expected)
+
+
+def test_segmentation_matches_eager_parse(fda_jpeg_file):
+    fda = FDA(fda_jpeg_file)
+    segmentation = fda.read_segmentation()
+    assert list(segmentation) == ["ILM", "RNFL_GCL", "MYSTERY"]
+    for chunk in fda.chunks.find(b"@CONTOUR_INFO"):
+        header = fda_binary.contour_info_header.parse(bytes(fda.chunks.data(chunk)))
+        raw = struct.unpack_from(
+            "<" + "H" * header.width * header.height, fda.chunks.data(chunk), 34
+        )
+        expected = np.flip(np.array(raw).reshape(header.height, header.width), 0)
+        layer = segmentation[
+            {"MULTILAYERS_1": "ILM", "MULTILAYERS_2": "RNFL_GCL"}.get(
+                header.id, header.id
+            )
+        ]
+        np.testing.assert_array_equal(layer, expected)
+    assert segmentation.as_array().shape == (3, 6, 24)
+
+
+def test_contours_are_int64_from_top(fda_jpeg_file):
+    volume = FDA(fda_jpeg_file).read_oct_volume()
+    bottom_up = FDA(fda_jpeg_file).read_segmentation()
+    for name, contour in volume.contours.items():
+        assert contour.dtype == np.int64
+        np.testing.assert_array_equal(contour, 32 - bottom_up[name].astype(np.int64))
+
+
+def _sequential_walk(path, header_size=15):
+    """Chunk names, offsets and sizes, read one chunk at a time from the file."""
+    table = []
+    with open(path, "rb") as f:
+        f.seek(header_size)
+        while True:
+            name_size = f.read(1)[0]
+            if name_size == 0:
+                return table
+            name = f.read(name_size)
+            size = int.from_bytes(f.read(4), "little")
+            table.append((name, f.tell(), size))
+            f.seek(size, 1)
+
+
+@pytest.mark.parametrize("reader", [FDA, FDS])
+def test_chunk_table_matches_sequential_walk(tmp_path, reader):
+    if reader is FDA:
+        path = build_fda(tmp_path / "jpeg.fda")
+    else:
+        path = build_fds(tmp_path / "scan.fds")[0]
+    chunks = reader(path).chunks
+    assert [tuple(chunk) for chunk in chunks.table] == _sequential_walk(path)
+    data = path.read_bytes()
+    for chunk in chunks.table:
+        view = chunks.data(chunk)
+        assert isinstance(view, memoryview)
+        assert bytes(view) == data[chunk.offset : chunk.offset + chunk.size]
+
+
+def test_truncated_chunk_table_warns(fds_file):
+    data = fds_file.read_bytes()[:-1] + b"\x10@IMG"
+    fds_file.write_bytes(data)
+    with pytest.warns(UserWarning, match="truncated"):
+        chunks = TopconChunks(fds_file, fds_binary.header)
+    assert chunks.names()[-1] == b"@IMG_OBS"
+
+
+def test_metadata_read_through_chunks(fda_jpeg_file, fds_file):
+    for reader in (FDA(fda_jpeg_file), FDS(fds_file)):
+        metadata = reader.read_all_metadata()
+        assert metadata["patient_info_02"]["patient_id"] == "P001"
+        assert metadata["hw_info_03"]["model_name"] == "Maestro"
+        assert metadata["param_obs_02"] == reader.read_param_obs()
+
+
+def _no_pixels(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("image data read by probe()")
+
+    monkeypatch.setattr(FDA, "_decode_jpeg_slices", fail)
+    monkeypatch.setattr(TopconChunks, "array", fail)
+
+
+@pytest.mark.parametrize("jpeg", [True, False])
+def test_fda_probe_matches_full_read(tmp_path, monkeypatch, jpeg):
+    path = build_fda(tmp_path / "probe.fda", jpeg=jpeg)
+    volume = FDA(path).read_oct_volume()
+    _no_pixels(monkeypatch)
+    probe = FDA(path).probe()
+    for part in ("source", "patient", "series", "device", "geometry"):
+        assert getattr(probe, part) == getattr(volume.meta, part), part
+    assert probe.oct_header["number_slices"] == 6
+    assert "@IMG_FUNDUS" in probe.metadata["chunks"]
+    assert len(probe.metadata["chunks"]["@CONTOUR_INFO"]) == 3
+
+
+def test_fds_probe_matches_full_read(fds_file, monkeypatch):
+    volume = FDS(fds_file).read_oct_volume()
+    _no_pixels(monkeypatch)
+    probe = FDS(fds_file).probe()
+    for part in ("source", "patient", "series", "device", "geometry"):
+        assert getattr(probe, part) == getattr(volume.meta, part), part
+    assert probe.oct_header["width"] == 24
+
+
+def test_motion_corrected_volume_is_a_view(fda_mot_file):
+    fda = FDA(fda_mot_file)
+    data = fda.chunks.data(b"@IMG_MOT_COMP_03")
+    header = fda_binary.oct_header_2.parse(data[:22])
+    raw = np.frombuffer(data, dtype=np.uint16, offset=22)
+    # eager decoding of earlier versions
+    expected = raw.reshape(header.width, header.height, header.number_slices, order="F")
+    expected = np.transpose(expected, (1, 0, 2))
+
+    volume = fda.read_oct_volume()
+    array = volume.as_array()
+    assert not array.flags.owndata and not array.flags.writeable
+    for i in range(header.number_slices):
+        np.testing.assert_array_equal(array[i], expected[:, :, i])
+
+
+def test_fds_fundus_is_uint8_rgb(fds_file):
+    fds = FDS(fds_file)
+    data = fds.chunks.data(b"@IMG_OBS")
+    header = fds_binary.fundus_header.parse(data[:21])
+    raw = np.frombuffer(data, dtype=np.uint8, count=header.size, offset=21)
+    # float32 decoding of earlier versions
+    expected = raw.reshape(3, header.width, header.height, order="F")
+    expected = np.flip(np.transpose(expected, (2, 1, 0)).astype(np.float32), 2)
+
+    image = fds.read_fundus_image().image
+    assert image.dtype == np.uint8
+    assert image.flags.c_contiguous and image.flags.writeable
+    np.testing.assert_array_equal(image, expected)
+
+    lazy = fds.read_fundus_image(lazy=True).image
+    assert not lazy.flags.writeable and not lazy.flags.owndata
+    np.testing.assert_array_equal(lazy, image)
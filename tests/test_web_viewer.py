@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# zeiss_loader imports scripts/old modules by their bare names
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts" / "old"))
+
+from oct_converter.image_types import OCTVolumeWithMetaData  # noqa: E402
+from web_viewer.oct.state import ViewerState  # noqa: E402
+
+
+def _state() -> ViewerState:
+    return ViewerState.__new__(ViewerState)
+
+
+def test_slice_count_uses_first_axis_of_oct_volume():
+    volume = OCTVolumeWithMetaData(np.zeros((100, 64, 32), dtype=np.uint8))
+    state = _state()
+
+    assert state._slice_count(volume) == 100
+    slices = state._get_slice_source(volume)
+    assert slices.shape == (100, 64, 32)
+    assert np.shares_memory(slices, volume.volume)
+
+
+def test_slice_count_of_slice_list():
+    volume = OCTVolumeWithMetaData([np.zeros((64, 32)) for _ in range(7)])
+
+    assert _state()._slice_count(volume) == 7
+
+
+def test_foreign_array_infers_slice_axis():
+    class Foreign:
+        volume = np.zeros((64, 32, 5))
+        oct_header = {"number_slices": 5}
+
+    state = _state()
+    assert state._slice_count(Foreign()) == 5
+    assert state._get_slice_source(Foreign()).shape == (5, 64, 32)
@@ -6,6 +6,7 @@ import tempfile
 import threading
 import warnings
 import xml.etree.ElementTree as ET
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
@@ -2155,30 +2156,40 @@ class ViewerState:
         }
 
     def _slice_count(self, volume: Any) -> int:
-        return len(self._get_slices(volume))
+        return len(self._get_slice_source(volume))
 
     def _get_slice(self, volume: Any, slice_index: int) -> np.ndarray:
-        slices = self._get_slices(volume)
+        slices = self._get_slice_source(volume)
         if not 0 <= slice_index < len(slices):
             raise IndexError(f"Slice index out of range: {slice_index}")
-        return slices[slice_index]
+        return self._prepare_display_image(np.asarray(slices[slice_index]))
 
     def _get_slices(self, volume: Any) -> list[np.ndarray]:
+        return [self._prepare_display_image(np.asarray(item)) for item in self._get_slice_source(volume)]
+
+    def _get_slice_source(self, volume: Any) -> Sequence[Any] | np.ndarray:
+        """Returns the volume's slices, indexable along the slice axis, without copying them."""
         volume_data = getattr(volume, "volume")
-        if isinstance(volume_data, list):
-            return [self._prepare_display_image(np.asarray(item)) for item in volume_data]
+        if isinstance(volume_data, Sequence):
+            return volume_data
 
-        array = np.asarray(volume_data)
+        owns_layout = hasattr(volume, "as_array")
+        if owns_layout:
+            array = volume.as_array()
+        else:
+            array = np.asarray(volume_data)
         if array.ndim == 0:
-            return [self._prepare_display_image(array)]
+            return [array]
         if array.ndim == 1:
-            return [self._prepare_display_image(np.expand_dims(array, axis=0))]
+            return [np.expand_dims(array, axis=0)]
         if array.ndim == 2:
-            return [self._prepare_display_image(array)]
+            return [array]
+        if owns_layout:
+            # OCTVolumeWithMetaData always holds its b-scans along axis 0
+            return array
 
         slice_axis = self._infer_slice_axis(array, volume)
-        volume_array = np.moveaxis(array, slice_axis, 0)
-        return [self._prepare_display_image(volume_array[index]) for index in range(volume_array.shape[0])]
+        return np.moveaxis(array, slice_axis, 0)
 
     def _infer_slice_axis(self, array: np.ndarray, volume: Any) -> int:
         expected = self._expected_slice_count(volume)